@@ -2,9 +2,17 @@ from ._datasworn import *  # noqa
 
 from .main import (
     RULESETS,
+    breadcrumb_table,
+    get_ancestors,
+    get_depth,
     get_parent_id,
     get_rule_types,
+    id_table,
     index,
+    issues,
+    parents,
+    preload,
+    row_tables,
     rules,
     breadcrumbs,
 )
@@ -13,8 +21,16 @@ from .main import (
 __all__ = [
     "index",
     "get_parent_id",
+    "get_ancestors",
+    "get_depth",
+    "parents",
     "rules",
     "get_rule_types",
     "RULESETS",
     "breadcrumbs",
+    "breadcrumb_table",
+    "preload",
+    "row_tables",
+    "issues",
+    "id_table",
 ]
@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Type, Union, get_args, get_origin
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesPackage:
     """
     Describes game rules compatible with the Ironsworn tabletop role-playing
@@ -41,7 +41,7 @@ class RulesPackageExpansionDataswornVersion(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesPackageExpansion(RulesPackage):
     """
     A Datasworn package that relies on an external package to provide its
@@ -206,7 +206,7 @@ class RulesPackageRulesetDataswornVersion(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesPackageRuleset(RulesPackage):
     """
     A standalone Datasworn package that describes its own ruleset.
@@ -396,7 +396,7 @@ class ActionRollMethod(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyID:
     """
     Represents any kind of non-wildcard ID, including IDs of embedded objects.
@@ -411,7 +411,7 @@ class AnyID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyIDWildcard:
     """
     Represents any kind of wildcard ID, including IDs of embedded objects.
@@ -426,7 +426,7 @@ class AnyIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyMoveID:
     value: 'str'
 
@@ -437,7 +437,7 @@ class AnyMoveID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyMoveIDWildcard:
     value: 'str'
 
@@ -448,7 +448,7 @@ class AnyMoveIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyOracleRollableID:
     value: 'str'
 
@@ -459,7 +459,7 @@ class AnyOracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyOracleRollableIDWildcard:
     value: 'str'
 
@@ -470,7 +470,7 @@ class AnyOracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyOracleRollableRowID:
     value: 'str'
 
@@ -481,7 +481,7 @@ class AnyOracleRollableRowID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnyOracleRollableRowIDWildcard:
     value: 'str'
 
@@ -501,7 +501,7 @@ class AssetType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Asset:
     id: 'AssetID'
     """
@@ -646,7 +646,7 @@ class Asset:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbility:
     """
     An asset ability: one of the purchasable features of an asset. Most assets
@@ -747,7 +747,7 @@ class AssetAbility:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityControlField:
     field_type: 'str'
 
@@ -765,7 +765,7 @@ class AssetAbilityControlField:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityControlFieldCheckbox(AssetAbilityControlField):
     disables_asset: 'bool'
     """
@@ -811,7 +811,7 @@ class AssetAbilityControlFieldCheckbox(AssetAbilityControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityControlFieldClock(AssetAbilityControlField):
     """
     A clock with 4 or more segments.
@@ -864,7 +864,7 @@ class AssetAbilityControlFieldClock(AssetAbilityControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityControlFieldCounter(AssetAbilityControlField):
     """
     A basic counter representing a non-rollable integer value. They usually
@@ -913,7 +913,7 @@ class AssetAbilityControlFieldCounter(AssetAbilityControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityControlFieldText(AssetAbilityControlField):
     """
     Represents an input that accepts plain text.
@@ -944,7 +944,7 @@ class AssetAbilityControlFieldText(AssetAbilityControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityID:
     """
     A unique ID representing an AssetAbility object.
@@ -959,7 +959,7 @@ class AssetAbilityID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityIDWildcard:
     """
     A wildcarded AssetAbilityId that can be used to match multiple AssetAbility
@@ -975,7 +975,7 @@ class AssetAbilityIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityMoveID:
     """
     A unique ID representing an AssetAbilityMove object.
@@ -990,7 +990,7 @@ class AssetAbilityMoveID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityMoveIDWildcard:
     """
     A wildcarded AssetAbilityMoveId that can be used to match multiple
@@ -1006,7 +1006,7 @@ class AssetAbilityMoveIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOptionField:
     field_type: 'str'
 
@@ -1021,7 +1021,7 @@ class AssetAbilityOptionField:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOptionFieldText(AssetAbilityOptionField):
     """
     Represents an input that accepts plain text.
@@ -1052,7 +1052,7 @@ class AssetAbilityOptionFieldText(AssetAbilityOptionField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOracleRollableID:
     """
     A unique ID representing an AssetAbilityOracleRollable object.
@@ -1067,7 +1067,7 @@ class AssetAbilityOracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOracleRollableIDWildcard:
     """
     A wildcarded AssetAbilityOracleRollableId that can be used to match multiple
@@ -1083,7 +1083,7 @@ class AssetAbilityOracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOracleRollableRowID:
     """
     A unique ID representing an AssetAbilityOracleRollableRow object.
@@ -1098,7 +1098,7 @@ class AssetAbilityOracleRollableRowID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAbilityOracleRollableRowIDWildcard:
     """
     A wildcarded AssetAbilityOracleRollableRowId that can be used to match
@@ -1114,7 +1114,7 @@ class AssetAbilityOracleRollableRowIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetAttachment:
     """
     Describes which assets can be attached to this asset. Example: Starforged's
@@ -1151,7 +1151,7 @@ class AssetCardFlipFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetCardFlipField:
     disables_asset: 'bool'
     """
@@ -1208,7 +1208,7 @@ class AssetCheckboxFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetCheckboxField:
     disables_asset: 'bool'
     """
@@ -1265,7 +1265,7 @@ class AssetCollectionType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetCollection:
     id: 'AssetCollectionID'
     """
@@ -1386,7 +1386,7 @@ class AssetCollection:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetCollectionID:
     """
     A unique ID representing an AssetCollection object.
@@ -1401,7 +1401,7 @@ class AssetCollectionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetCollectionIDWildcard:
     """
     A wildcarded AssetCollectionId that can be used to match multiple
@@ -1426,7 +1426,7 @@ class AssetConditionMeterFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeterMoves:
     """
     Provides hints for moves that interact with this condition meter, such as
@@ -1461,7 +1461,7 @@ class AssetConditionMeterMoves:
              data["suffer"] = _to_json_data(self.suffer)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeter:
     """
     Some assets provide a special condition meter of their own. The most common
@@ -1538,7 +1538,7 @@ class AssetConditionMeter:
              data["moves"] = _to_json_data(self.moves)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeterControlField:
     """
     A checkbox control field, rendered as part of an asset condition meter.
@@ -1558,7 +1558,7 @@ class AssetConditionMeterControlField:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeterControlFieldCardFlip(AssetConditionMeterControlField):
     disables_asset: 'bool'
     """
@@ -1604,7 +1604,7 @@ class AssetConditionMeterControlFieldCardFlip(AssetConditionMeterControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeterControlFieldCheckbox(AssetConditionMeterControlField):
     disables_asset: 'bool'
     """
@@ -1659,7 +1659,7 @@ class AssetConditionMeterEnhancementFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetConditionMeterEnhancement:
     """
     Some assets provide a special condition meter of their own. The most common
@@ -1688,7 +1688,7 @@ class AssetConditionMeterEnhancement:
         data["max"] = _to_json_data(self.max)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlField:
     field_type: 'str'
 
@@ -1706,7 +1706,7 @@ class AssetControlField:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldCardFlip(AssetControlField):
     disables_asset: 'bool'
     """
@@ -1752,7 +1752,7 @@ class AssetControlFieldCardFlip(AssetControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldCheckbox(AssetControlField):
     disables_asset: 'bool'
     """
@@ -1798,7 +1798,7 @@ class AssetControlFieldCheckbox(AssetControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldConditionMeterMoves:
     """
     Provides hints for moves that interact with this condition meter, such as
@@ -1833,7 +1833,7 @@ class AssetControlFieldConditionMeterMoves:
              data["suffer"] = _to_json_data(self.suffer)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldConditionMeter(AssetControlField):
     """
     Some assets provide a special condition meter of their own. The most common
@@ -1908,7 +1908,7 @@ class AssetControlFieldConditionMeter(AssetControlField):
              data["moves"] = _to_json_data(self.moves)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldSelectEnhancementChoice:
     choice_type: 'str'
 
@@ -1924,7 +1924,7 @@ class AssetControlFieldSelectEnhancementChoice:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldSelectEnhancementChoiceChoice(AssetControlFieldSelectEnhancementChoice):
     """
     Represents an option in a list of choices.
@@ -1952,7 +1952,7 @@ class AssetControlFieldSelectEnhancementChoiceChoice(AssetControlFieldSelectEnha
              data["enhance_moves"] = _to_json_data(self.enhance_moves)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldSelectEnhancementChoiceChoiceGroup(AssetControlFieldSelectEnhancementChoice):
     """
     Represents a grouping of options in a list of choices.
@@ -1979,7 +1979,7 @@ class AssetControlFieldSelectEnhancementChoiceChoiceGroup(AssetControlFieldSelec
         data["name"] = _to_json_data(self.name)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldSelectEnhancement(AssetControlField):
     """
     Select from player and/or asset enhancements. Use it to describe modal
@@ -2015,7 +2015,7 @@ class AssetControlFieldSelectEnhancement(AssetControlField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldEnhancement:
     field_type: 'str'
 
@@ -2030,7 +2030,7 @@ class AssetControlFieldEnhancement:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlFieldEnhancementConditionMeter(AssetControlFieldEnhancement):
     """
     Some assets provide a special condition meter of their own. The most common
@@ -2070,7 +2070,7 @@ class AssetControlValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetControlValueRef:
     """
     A reference to the value of an asset control.
@@ -2103,7 +2103,7 @@ class AssetControlValueRef:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetEnhancement:
     """
     Describes enhancements made to this asset in a partial asset object. The
@@ -2157,7 +2157,7 @@ class AssetEnhancement:
              data["suggestions"] = _to_json_data(self.suggestions)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetID:
     """
     A unique ID representing an Asset object.
@@ -2172,7 +2172,7 @@ class AssetID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetIDWildcard:
     """
     A wildcarded AssetId that can be used to match multiple Asset objects.
@@ -2187,7 +2187,7 @@ class AssetIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionField:
     """
     Options are asset input fields which are set once, usually when the
@@ -2211,7 +2211,7 @@ class AssetOptionField:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldSelectEnhancementChoice:
     choice_type: 'str'
 
@@ -2227,7 +2227,7 @@ class AssetOptionFieldSelectEnhancementChoice:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldSelectEnhancementChoiceChoice(AssetOptionFieldSelectEnhancementChoice):
     """
     Represents an option in a list of choices.
@@ -2255,7 +2255,7 @@ class AssetOptionFieldSelectEnhancementChoiceChoice(AssetOptionFieldSelectEnhanc
              data["enhance_moves"] = _to_json_data(self.enhance_moves)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldSelectEnhancementChoiceChoiceGroup(AssetOptionFieldSelectEnhancementChoice):
     """
     Represents a grouping of options in a list of choices.
@@ -2282,7 +2282,7 @@ class AssetOptionFieldSelectEnhancementChoiceChoiceGroup(AssetOptionFieldSelectE
         data["name"] = _to_json_data(self.name)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldSelectEnhancement(AssetOptionField):
     """
     Select from player and/or asset enhancements. Use it to describe modal
@@ -2318,7 +2318,7 @@ class AssetOptionFieldSelectEnhancement(AssetOptionField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldSelectValue(AssetOptionField):
     """
     Represents a list of mutually exclusive choices.
@@ -2352,7 +2352,7 @@ class AssetOptionFieldSelectValue(AssetOptionField):
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionFieldText(AssetOptionField):
     """
     Represents an input that accepts plain text.
@@ -2396,7 +2396,7 @@ class AssetOptionValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetOptionValueRef:
     """
     A reference to the value of an asset option.
@@ -2438,7 +2438,7 @@ class AtlasCollectionType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasCollection:
     id: 'AtlasCollectionID'
     """
@@ -2559,7 +2559,7 @@ class AtlasCollection:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasCollectionID:
     """
     A unique ID representing an AtlasCollection object.
@@ -2574,7 +2574,7 @@ class AtlasCollectionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasCollectionIDWildcard:
     """
     A wildcarded AtlasCollectionId that can be used to match multiple
@@ -2599,7 +2599,7 @@ class AtlasEntryType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasEntry:
     """
     An atlas entry, like the Ironlands region entries found in classic
@@ -2705,7 +2705,7 @@ class AtlasEntry:
              data["your_truth"] = _to_json_data(self.your_truth)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasEntryID:
     """
     A unique ID representing an AtlasEntry object.
@@ -2720,7 +2720,7 @@ class AtlasEntryID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtlasEntryIDWildcard:
     """
     A wildcarded AtlasEntryId that can be used to match multiple AtlasEntry
@@ -2751,7 +2751,7 @@ class AttachedAssetControlValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttachedAssetControlValueRef:
     """
     A reference to the value of an attached asset control. For example, a Module
@@ -2798,7 +2798,7 @@ class AttachedAssetOptionValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttachedAssetOptionValueRef:
     """
     A reference to the value of an attached asset option.
@@ -2828,7 +2828,7 @@ class AttachedAssetOptionValueRef:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthorInfo:
     """
     Information on the original creator of this material.
@@ -2867,7 +2867,7 @@ class AuthorInfo:
              data["url"] = _to_json_data(self.url)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChallengeRank:
     """
     Challenge rank, represented as an integer from 1 (troublesome) to 5 (epic).
@@ -2891,7 +2891,7 @@ class ClockFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClockField:
     """
     A clock with 4 or more segments.
@@ -2981,7 +2981,7 @@ class ConditionMeterFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConditionMeterField:
     """
     A meter with an integer value, bounded by a minimum and maximum.
@@ -3039,7 +3039,7 @@ class ConditionMeterField:
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConditionMeterKey:
     """
     A basic, rollable player character resource specified by the ruleset.
@@ -3054,7 +3054,7 @@ class ConditionMeterKey:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConditionMeterRule:
     """
     Describes a standard player character condition meter.
@@ -3132,7 +3132,7 @@ class ConditionMeterValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConditionMeterValueRef:
     """
     A reference to the value of a standard player condition meter.
@@ -3158,7 +3158,7 @@ class ConditionMeterValueRef:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoreTags:
     requires_allies: 'Optional[bool]'
     """
@@ -3206,7 +3206,7 @@ class CounterFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CounterField:
     """
     A basic counter representing a non-rollable integer value. They usually
@@ -3257,7 +3257,7 @@ class CounterField:
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CSSColor:
     """
     A CSS color value.
@@ -3285,7 +3285,7 @@ class CustomValueUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CustomValue:
     """
     An arbitrary static integer value with a label.
@@ -3323,7 +3323,7 @@ class DelveSiteType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSite:
     """
     A delve site with a theme, domain, and denizens.
@@ -3459,7 +3459,7 @@ class DelveSite:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDenizen:
     """
     Represents an entry in a delve site denizen matrix. Denizen matrices are
@@ -3515,7 +3515,7 @@ class DelveSiteDenizenFrequency(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDenizenID:
     """
     A unique ID representing a DelveSiteDenizen object.
@@ -3530,7 +3530,7 @@ class DelveSiteDenizenID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDenizenIDWildcard:
     """
     A wildcarded DelveSiteDenizenId that can be used to match multiple
@@ -3555,7 +3555,7 @@ class DelveSiteDomainType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomain:
     """
     A delve site Domain card.
@@ -3680,7 +3680,7 @@ class DelveSiteDomain:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainDanger:
     """
     Represents a row in an oracle table, with a single text cell.
@@ -3745,7 +3745,7 @@ class DelveSiteDomainDanger:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainDangerID:
     """
     A unique ID representing a DelveSiteDomainDanger object.
@@ -3760,7 +3760,7 @@ class DelveSiteDomainDangerID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainDangerIDWildcard:
     """
     A wildcarded DelveSiteDomainDangerId that can be used to match multiple
@@ -3776,7 +3776,7 @@ class DelveSiteDomainDangerIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainFeature:
     """
     Represents a row in an oracle table, with a single text cell.
@@ -3841,7 +3841,7 @@ class DelveSiteDomainFeature:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainFeatureID:
     """
     A unique ID representing a DelveSiteDomainFeature object.
@@ -3856,7 +3856,7 @@ class DelveSiteDomainFeatureID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainFeatureIDWildcard:
     """
     A wildcarded DelveSiteDomainFeatureId that can be used to match multiple
@@ -3872,7 +3872,7 @@ class DelveSiteDomainFeatureIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainID:
     """
     A unique ID representing a DelveSiteDomain object.
@@ -3887,7 +3887,7 @@ class DelveSiteDomainID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteDomainIDWildcard:
     """
     A wildcarded DelveSiteDomainId that can be used to match multiple
@@ -3903,7 +3903,7 @@ class DelveSiteDomainIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteID:
     """
     A unique ID representing a DelveSite object.
@@ -3918,7 +3918,7 @@ class DelveSiteID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteIDWildcard:
     """
     A wildcarded DelveSiteId that can be used to match multiple DelveSite
@@ -3943,7 +3943,7 @@ class DelveSiteThemeType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteTheme:
     """
     A delve site theme card.
@@ -4055,7 +4055,7 @@ class DelveSiteTheme:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeDanger:
     """
     Represents a row in an oracle table, with a single text cell.
@@ -4120,7 +4120,7 @@ class DelveSiteThemeDanger:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeDangerID:
     """
     A unique ID representing a DelveSiteThemeDanger object.
@@ -4135,7 +4135,7 @@ class DelveSiteThemeDangerID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeDangerIDWildcard:
     """
     A wildcarded DelveSiteThemeDangerId that can be used to match multiple
@@ -4151,7 +4151,7 @@ class DelveSiteThemeDangerIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeFeature:
     """
     Represents a row in an oracle table, with a single text cell.
@@ -4216,7 +4216,7 @@ class DelveSiteThemeFeature:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeFeatureID:
     """
     A unique ID representing a DelveSiteThemeFeature object.
@@ -4231,7 +4231,7 @@ class DelveSiteThemeFeatureID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeFeatureIDWildcard:
     """
     A wildcarded DelveSiteThemeFeatureId that can be used to match multiple
@@ -4247,7 +4247,7 @@ class DelveSiteThemeFeatureIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeID:
     """
     A unique ID representing a DelveSiteTheme object.
@@ -4262,7 +4262,7 @@ class DelveSiteThemeID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DelveSiteThemeIDWildcard:
     """
     A wildcarded DelveSiteThemeId that can be used to match multiple
@@ -4278,7 +4278,7 @@ class DelveSiteThemeIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiceExpression:
     """
     A simple dice roll expression with an optional (positive or negative)
@@ -4294,7 +4294,7 @@ class DiceExpression:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiceRange:
     """
     Represents a range of dice roll results, bounded by `min` and `max`
@@ -4325,7 +4325,7 @@ class DiceRange:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DictKey:
     """
     A `snake_case` key used in a Datasworn dictionary object.
@@ -4340,7 +4340,7 @@ class DictKey:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Documentation:
     """
     Implementation hints or other developer-facing comments on this node. These
@@ -4356,7 +4356,7 @@ class Documentation:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Email:
     """
     An email address.
@@ -4404,7 +4404,7 @@ class EmbeddedActionRollMoveType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedActionRollMove:
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -4497,7 +4497,7 @@ class EmbeddedActionRollMove:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMove:
     roll_type: 'str'
 
@@ -4524,7 +4524,7 @@ class EmbeddedMoveActionRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveActionRoll(EmbeddedMove):
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -4624,7 +4624,7 @@ class EmbeddedMoveNoRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveNoRoll(EmbeddedMove):
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -4721,7 +4721,7 @@ class EmbeddedMoveProgressRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveProgressRoll(EmbeddedMove):
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -4828,7 +4828,7 @@ class EmbeddedMoveSpecialTrackType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveSpecialTrack(EmbeddedMove):
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -4919,7 +4919,7 @@ class EmbeddedMoveSpecialTrack(EmbeddedMove):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveID:
     value: 'str'
 
@@ -4930,7 +4930,7 @@ class EmbeddedMoveID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedMoveIDWildcard:
     value: 'str'
 
@@ -4959,7 +4959,7 @@ class EmbeddedNoRollMoveType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedNoRollMove:
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -5067,7 +5067,7 @@ class EmbeddedOracleColumnTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5085,7 +5085,7 @@ class EmbeddedOracleColumnTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnText:
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5199,7 +5199,7 @@ class EmbeddedOracleColumnText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5217,7 +5217,7 @@ class EmbeddedOracleColumnText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnText2:
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5331,7 +5331,7 @@ class EmbeddedOracleColumnText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5349,7 +5349,7 @@ class EmbeddedOracleColumnText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleColumnText3:
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5445,7 +5445,7 @@ class EmbeddedOracleColumnText3:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollable:
     oracle_type: 'str'
 
@@ -5474,7 +5474,7 @@ class EmbeddedOracleRollableColumnTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5492,7 +5492,7 @@ class EmbeddedOracleRollableColumnTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnText(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5595,7 +5595,7 @@ class EmbeddedOracleRollableColumnText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5613,7 +5613,7 @@ class EmbeddedOracleRollableColumnText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnText2(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5716,7 +5716,7 @@ class EmbeddedOracleRollableColumnText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5734,7 +5734,7 @@ class EmbeddedOracleRollableColumnText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableColumnText3(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     dice: 'DiceExpression'
@@ -5828,7 +5828,7 @@ class EmbeddedOracleRollableColumnText3(EmbeddedOracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableTextColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -5855,7 +5855,7 @@ class EmbeddedOracleRollableTableTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -5873,7 +5873,7 @@ class EmbeddedOracleRollableTableTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleRollableTableTextColumnLabels'
@@ -5970,7 +5970,7 @@ class EmbeddedOracleRollableTableText(EmbeddedOracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText2ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -6000,7 +6000,7 @@ class EmbeddedOracleRollableTableText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -6018,7 +6018,7 @@ class EmbeddedOracleRollableTableText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText2(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleRollableTableText2ColumnLabels'
@@ -6115,7 +6115,7 @@ class EmbeddedOracleRollableTableText2(EmbeddedOracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText3ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -6148,7 +6148,7 @@ class EmbeddedOracleRollableTableText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -6166,7 +6166,7 @@ class EmbeddedOracleRollableTableText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableTableText3(EmbeddedOracleRollable):
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleRollableTableText3ColumnLabels'
@@ -6263,7 +6263,7 @@ class EmbeddedOracleRollableTableText3(EmbeddedOracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableID:
     value: 'str'
 
@@ -6274,7 +6274,7 @@ class EmbeddedOracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleRollableIDWildcard:
     value: 'str'
 
@@ -6285,7 +6285,7 @@ class EmbeddedOracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableTextColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -6321,7 +6321,7 @@ class EmbeddedOracleTableTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -6339,7 +6339,7 @@ class EmbeddedOracleTableTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText:
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleTableTextColumnLabels'
@@ -6438,7 +6438,7 @@ class EmbeddedOracleTableText:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText2ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -6477,7 +6477,7 @@ class EmbeddedOracleTableText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -6495,7 +6495,7 @@ class EmbeddedOracleTableText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText2:
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleTableText2ColumnLabels'
@@ -6594,7 +6594,7 @@ class EmbeddedOracleTableText2:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText3ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -6636,7 +6636,7 @@ class EmbeddedOracleTableText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -6654,7 +6654,7 @@ class EmbeddedOracleTableText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedOracleTableText3:
     id: 'EmbeddedOracleRollableID'
     column_labels: 'EmbeddedOracleTableText3ColumnLabels'
@@ -6771,7 +6771,7 @@ class EmbeddedProgressRollMoveType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedProgressRollMove:
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -6889,7 +6889,7 @@ class EmbeddedSpecialTrackMoveType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmbeddedSpecialTrackMove:
     id: 'EmbeddedMoveID'
     allow_momentum_burn: 'bool'
@@ -6982,7 +6982,7 @@ class EmbeddedSpecialTrackMove:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntityPrompt:
     """
     This type is a placeholder and may see signficant changes in v0.2.0.
@@ -7023,7 +7023,7 @@ class ExpansionType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Expansion:
     """
     A Datasworn package that relies on an external package to provide its
@@ -7177,7 +7177,7 @@ class Expansion:
              data["truths"] = _to_json_data(self.truths)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpansionID:
     """
     The ID of a Datasworn package that relies on an external package to provide
@@ -7193,7 +7193,7 @@ class ExpansionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class I18nHint:
     part_of_speech: 'Optional[PartOfSpeech]'
     """
@@ -7213,7 +7213,7 @@ class I18nHint:
              data["part_of_speech"] = _to_json_data(self.part_of_speech)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class I18nHintsTemplate:
     text: 'Optional[I18nHint]'
     text2: 'Optional[I18nHint]'
@@ -7237,7 +7237,7 @@ class I18nHintsTemplate:
              data["text3"] = _to_json_data(self.text3)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class I18nHints:
     """
     Internationalization/localization hints for the text content of this object.
@@ -7269,7 +7269,7 @@ class I18nHints:
              data["text3"] = _to_json_data(self.text3)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImpactCategory:
     """
     Describes a category of standard impacts/debilities.
@@ -7306,7 +7306,7 @@ class ImpactCategory:
         data["label"] = _to_json_data(self.label)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImpactRule:
     """
     Describes a standard impact/debility.
@@ -7361,7 +7361,7 @@ class ImpactRule:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Label:
     """
     A localized, player-facing name or label, formatted as plain text. In some
@@ -7378,7 +7378,7 @@ class Label:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarkdownString:
     """
     Localized, player-facing text, formatted in Markdown. It is *not* formatted
@@ -7406,7 +7406,7 @@ class MarkdownString:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarkdownTemplateString:
     """
     A rich text string in Markdown with replaced values from oracle roll
@@ -7426,7 +7426,7 @@ class MarkdownTemplateString:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Move:
     roll_type: 'str'
 
@@ -7453,7 +7453,7 @@ class MoveActionRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveActionRoll0(Move):
     """
     A move that makes an action roll.
@@ -7582,7 +7582,7 @@ class MoveNoRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveNoRoll0(Move):
     """
     A move that makes no progress rolls or action rolls.
@@ -7708,7 +7708,7 @@ class MoveProgressRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveProgressRoll0(Move):
     """
     A progress move that rolls on a standard progress track type (whose features
@@ -7846,7 +7846,7 @@ class MoveSpecialTrackType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveSpecialTrack0(Move):
     """
     A progress move that rolls on a special track, such as Legacies (Starforged)
@@ -7986,7 +7986,7 @@ class MoveActionRollType0(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveActionRoll:
     """
     A move that makes an action roll.
@@ -8122,7 +8122,7 @@ class MoveActionRollEnhancementRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveActionRollEnhancement:
     """
     An object that describes changes to a move. These changes should be applied
@@ -8164,7 +8164,7 @@ class MoveCategoryType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveCategory:
     id: 'MoveCategoryID'
     """
@@ -8285,7 +8285,7 @@ class MoveCategory:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveCategoryID:
     """
     A unique ID representing a MoveCategory object.
@@ -8300,7 +8300,7 @@ class MoveCategoryID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveCategoryIDWildcard:
     """
     A wildcarded MoveCategoryId that can be used to match multiple MoveCategory
@@ -8316,7 +8316,7 @@ class MoveCategoryIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveEnhancement:
     roll_type: 'str'
 
@@ -8334,7 +8334,7 @@ class MoveEnhancement:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveEnhancementActionRoll(MoveEnhancement):
     """
     An object that describes changes to a move. These changes should be applied
@@ -8360,7 +8360,7 @@ class MoveEnhancementActionRoll(MoveEnhancement):
              data["trigger"] = _to_json_data(self.trigger)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveEnhancementNoRoll(MoveEnhancement):
     """
     An object that describes changes to a move. These changes should be applied
@@ -8386,7 +8386,7 @@ class MoveEnhancementNoRoll(MoveEnhancement):
              data["trigger"] = _to_json_data(self.trigger)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveEnhancementProgressRoll(MoveEnhancement):
     """
     An object that describes changes to a move. These changes should be applied
@@ -8412,7 +8412,7 @@ class MoveEnhancementProgressRoll(MoveEnhancement):
              data["trigger"] = _to_json_data(self.trigger)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveEnhancementSpecialTrack(MoveEnhancement):
     """
     An object that describes changes to a move. These changes should be applied
@@ -8438,7 +8438,7 @@ class MoveEnhancementSpecialTrack(MoveEnhancement):
              data["trigger"] = _to_json_data(self.trigger)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveID:
     """
     A unique ID representing a Move object.
@@ -8453,7 +8453,7 @@ class MoveID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveIDWildcard:
     """
     A wildcarded MoveId that can be used to match multiple Move objects.
@@ -8486,7 +8486,7 @@ class MoveNoRollType0(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveNoRoll:
     """
     A move that makes no progress rolls or action rolls.
@@ -8619,7 +8619,7 @@ class MoveNoRollEnhancementRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveNoRollEnhancement:
     """
     An object that describes changes to a move. These changes should be applied
@@ -8652,7 +8652,7 @@ class MoveNoRollEnhancement:
              data["trigger"] = _to_json_data(self.trigger)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOracleRollableID:
     """
     A unique ID representing a MoveOracleRollable object.
@@ -8667,7 +8667,7 @@ class MoveOracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOracleRollableIDWildcard:
     """
     A wildcarded MoveOracleRollableId that can be used to match multiple
@@ -8683,7 +8683,7 @@ class MoveOracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOracleRollableRowID:
     """
     A unique ID representing a MoveOracleRollableRow object.
@@ -8698,7 +8698,7 @@ class MoveOracleRollableRowID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOracleRollableRowIDWildcard:
     """
     A wildcarded MoveOracleRollableRowId that can be used to match multiple
@@ -8714,7 +8714,7 @@ class MoveOracleRollableRowIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOutcome:
     text: 'MarkdownString'
     oracle_rolls: 'Optional[List[OracleRoll]]'
@@ -8733,7 +8733,7 @@ class MoveOutcome:
              data["oracle_rolls"] = _to_json_data(self.oracle_rolls)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveOutcomes:
     """
     A standalone localized description for each move outcome (miss, weak hit,
@@ -8783,7 +8783,7 @@ class MoveProgressRollType0(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveProgressRoll:
     """
     A progress move that rolls on a standard progress track type (whose features
@@ -8928,7 +8928,7 @@ class MoveProgressRollEnhancementRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveProgressRollEnhancement:
     """
     An object that describes changes to a move. These changes should be applied
@@ -9009,7 +9009,7 @@ class MoveSpecialTrackType0(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveSpecialTrack:
     """
     A progress move that rolls on a special track, such as Legacies (Starforged)
@@ -9147,7 +9147,7 @@ class MoveSpecialTrackEnhancementRollType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveSpecialTrackEnhancement:
     """
     An object that describes changes to a move. These changes should be applied
@@ -9202,7 +9202,7 @@ class NpcType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Npc:
     """
     A non-player character entry, similar to those in Chapter 5 of the Ironsworn
@@ -9336,7 +9336,7 @@ class NpcCollectionType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcCollection:
     id: 'NpcCollectionID'
     """
@@ -9457,7 +9457,7 @@ class NpcCollection:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcCollectionID:
     """
     A unique ID representing a NpcCollection object.
@@ -9472,7 +9472,7 @@ class NpcCollectionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcCollectionIDWildcard:
     """
     A wildcarded NpcCollectionId that can be used to match multiple
@@ -9488,7 +9488,7 @@ class NpcCollectionIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcID:
     """
     A unique ID representing a Npc object.
@@ -9503,7 +9503,7 @@ class NpcID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcIDWildcard:
     """
     A wildcarded NpcId that can be used to match multiple Npc objects.
@@ -9518,7 +9518,7 @@ class NpcIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcNature:
     """
     A localized category label describing the nature of this NPC.
@@ -9538,7 +9538,7 @@ class NpcNature:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcVariant:
     id: 'NpcVariantID'
     """
@@ -9581,7 +9581,7 @@ class NpcVariant:
              data["summary"] = _to_json_data(self.summary)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcVariantID:
     """
     A unique ID representing a NpcVariant object.
@@ -9596,7 +9596,7 @@ class NpcVariantID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NpcVariantIDWildcard:
     """
     A wildcarded NpcVariantId that can be used to match multiple NpcVariant
@@ -9612,7 +9612,7 @@ class NpcVariantIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollection:
     oracle_type: 'str'
 
@@ -9631,7 +9631,7 @@ class OracleCollection:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedRollsColumnLabels:
     """
     Provides column labels for this table. The `roll` key refers to the roll
@@ -9661,7 +9661,7 @@ class OracleCollectionTableSharedRollsType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedRolls(OracleCollection):
     """
     An OracleCollection representing a single table with one roll column and
@@ -9794,7 +9794,7 @@ class OracleCollectionTableSharedRolls(OracleCollection):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedTextColumnLabels:
     text: 'Label'
 
@@ -9818,7 +9818,7 @@ class OracleCollectionTableSharedTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedText(OracleCollection):
     """
     An OracleCollection representing a single table with multiple roll columns
@@ -9945,7 +9945,7 @@ class OracleCollectionTableSharedText(OracleCollection):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedText2ColumnLabels:
     text: 'Label'
     text2: 'Label'
@@ -9972,7 +9972,7 @@ class OracleCollectionTableSharedText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedText2(OracleCollection):
     """
     An OracleCollection representing a single table with multiple roll columns,
@@ -10099,7 +10099,7 @@ class OracleCollectionTableSharedText2(OracleCollection):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedText3ColumnLabels:
     text: 'Label'
     text2: 'Label'
@@ -10129,7 +10129,7 @@ class OracleCollectionTableSharedText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTableSharedText3(OracleCollection):
     """
     An OracleCollection representing a single table with multiple roll columns,
@@ -10265,7 +10265,7 @@ class OracleCollectionTablesType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionTables(OracleCollection):
     """
     An OracleCollection that represents a category or grouping of tables, which
@@ -10392,7 +10392,7 @@ class OracleCollectionTables(OracleCollection):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionID:
     """
     A unique ID representing an OracleCollection object.
@@ -10407,7 +10407,7 @@ class OracleCollectionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleCollectionIDWildcard:
     """
     A wildcarded OracleCollectionId that can be used to match multiple
@@ -10441,7 +10441,7 @@ class OracleColumnTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -10459,7 +10459,7 @@ class OracleColumnTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnText:
     """
     Represents a single column in an OracleCollection.
@@ -10590,7 +10590,7 @@ class OracleColumnText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -10608,7 +10608,7 @@ class OracleColumnText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnText2:
     id: 'OracleRollableID'
     """
@@ -10735,7 +10735,7 @@ class OracleColumnText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -10753,7 +10753,7 @@ class OracleColumnText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleColumnText3:
     id: 'OracleRollableID'
     """
@@ -10890,7 +10890,7 @@ class OracleDuplicateBehavior(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleMatchBehavior:
     text: 'MarkdownString'
 
@@ -10905,7 +10905,7 @@ class OracleMatchBehavior:
         data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRoll:
     auto: 'bool'
     """
@@ -10948,7 +10948,7 @@ class OracleRoll:
         data["oracle"] = _to_json_data(self.oracle)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollTemplate:
     """
     Provides string templates that may be used in place of the static row
@@ -10995,7 +10995,7 @@ class OracleRollTemplate:
              data["text3"] = _to_json_data(self.text3)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollable:
     """
     A collection of table rows from which random results may be rolled. This may
@@ -11029,7 +11029,7 @@ class OracleRollableColumnTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11047,7 +11047,7 @@ class OracleRollableColumnTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnText(OracleRollable):
     """
     Represents a single column in an OracleCollection.
@@ -11167,7 +11167,7 @@ class OracleRollableColumnText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11185,7 +11185,7 @@ class OracleRollableColumnText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnText2(OracleRollable):
     id: 'OracleRollableID'
     """
@@ -11301,7 +11301,7 @@ class OracleRollableColumnText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11319,7 +11319,7 @@ class OracleRollableColumnText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableColumnText3(OracleRollable):
     id: 'OracleRollableID'
     """
@@ -11426,7 +11426,7 @@ class OracleRollableColumnText3(OracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTextColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -11453,7 +11453,7 @@ class OracleRollableTableTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11471,7 +11471,7 @@ class OracleRollableTableTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText(OracleRollable):
     """
     Represents a basic rollable oracle table with one roll column and one text
@@ -11594,7 +11594,7 @@ class OracleRollableTableText(OracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText2ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -11624,7 +11624,7 @@ class OracleRollableTableText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11642,7 +11642,7 @@ class OracleRollableTableText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText2(OracleRollable):
     """
     A rollable oracle table with one roll column and two text columns.
@@ -11764,7 +11764,7 @@ class OracleRollableTableText2(OracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText3ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -11797,7 +11797,7 @@ class OracleRollableTableText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -11815,7 +11815,7 @@ class OracleRollableTableText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableText3(OracleRollable):
     """
     A rollable oracle table with one roll column and 3 text columns.
@@ -11937,7 +11937,7 @@ class OracleRollableTableText3(OracleRollable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableID:
     """
     A unique ID representing an OracleRollable object.
@@ -11952,7 +11952,7 @@ class OracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableIDWildcard:
     """
     A wildcarded OracleRollableId that can be used to match multiple
@@ -11968,7 +11968,7 @@ class OracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableRowID:
     """
     A unique ID representing an OracleRollableRow object.
@@ -11983,7 +11983,7 @@ class OracleRollableRowID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableRowIDWildcard:
     """
     A wildcarded OracleRollableRowId that can be used to match multiple
@@ -11999,7 +11999,7 @@ class OracleRollableRowIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableRowText:
     """
     Represents a row in an oracle table, with a single text cell.
@@ -12064,7 +12064,7 @@ class OracleRollableRowText:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableRowText2:
     """
     Represents a row in an oracle table that provides a secondary text field.
@@ -12132,7 +12132,7 @@ class OracleRollableRowText2:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableRowText3:
     """
     Represents a row in an oracle table with 3 text cells.
@@ -12203,7 +12203,7 @@ class OracleRollableRowText3:
              data["template"] = _to_json_data(self.template)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTable:
     oracle_type: 'str'
 
@@ -12220,7 +12220,7 @@ class OracleRollableTable:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableTextColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -12247,7 +12247,7 @@ class OracleRollableTableTableTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -12265,7 +12265,7 @@ class OracleRollableTableTableTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText(OracleRollableTable):
     """
     Represents a basic rollable oracle table with one roll column and one text
@@ -12388,7 +12388,7 @@ class OracleRollableTableTableText(OracleRollableTable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText2ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -12418,7 +12418,7 @@ class OracleRollableTableTableText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -12436,7 +12436,7 @@ class OracleRollableTableTableText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText2(OracleRollableTable):
     """
     A rollable oracle table with one roll column and two text columns.
@@ -12558,7 +12558,7 @@ class OracleRollableTableTableText2(OracleRollableTable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText3ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -12591,7 +12591,7 @@ class OracleRollableTableTableText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -12609,7 +12609,7 @@ class OracleRollableTableTableText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleRollableTableTableText3(OracleRollableTable):
     """
     A rollable oracle table with one roll column and 3 text columns.
@@ -12731,7 +12731,7 @@ class OracleRollableTableTableText3(OracleRollableTable):
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedRollsColumnLabels:
     """
     Provides column labels for this table. The `roll` key refers to the roll
@@ -12770,7 +12770,7 @@ class OracleTableSharedRollsType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedRolls:
     """
     An OracleCollection representing a single table with one roll column and
@@ -12905,7 +12905,7 @@ class OracleTableSharedRolls:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedTextColumnLabels:
     text: 'Label'
 
@@ -12938,7 +12938,7 @@ class OracleTableSharedTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedText:
     """
     An OracleCollection representing a single table with multiple roll columns
@@ -13067,7 +13067,7 @@ class OracleTableSharedText:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedText2ColumnLabels:
     text: 'Label'
     text2: 'Label'
@@ -13103,7 +13103,7 @@ class OracleTableSharedText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedText2:
     """
     An OracleCollection representing a single table with multiple roll columns,
@@ -13232,7 +13232,7 @@ class OracleTableSharedText2:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedText3ColumnLabels:
     text: 'Label'
     text2: 'Label'
@@ -13271,7 +13271,7 @@ class OracleTableSharedText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableSharedText3:
     """
     An OracleCollection representing a single table with multiple roll columns,
@@ -13400,7 +13400,7 @@ class OracleTableSharedText3:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableTextColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -13436,7 +13436,7 @@ class OracleTableTextType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableTextRecommendedRolls:
     max: 'int'
     min: 'int'
@@ -13454,7 +13454,7 @@ class OracleTableTextRecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText:
     """
     Represents a basic rollable oracle table with one roll column and one text
@@ -13579,7 +13579,7 @@ class OracleTableText:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText2ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -13618,7 +13618,7 @@ class OracleTableText2Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText2RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -13636,7 +13636,7 @@ class OracleTableText2RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText2:
     """
     A rollable oracle table with one roll column and two text columns.
@@ -13760,7 +13760,7 @@ class OracleTableText2:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText3ColumnLabels:
     roll: 'Label'
     text: 'Label'
@@ -13802,7 +13802,7 @@ class OracleTableText3Type(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText3RecommendedRolls:
     max: 'int'
     min: 'int'
@@ -13820,7 +13820,7 @@ class OracleTableText3RecommendedRolls:
         data["min"] = _to_json_data(self.min)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTableText3:
     """
     A rollable oracle table with one roll column and 3 text columns.
@@ -13962,7 +13962,7 @@ class OracleTablesCollectionType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OracleTablesCollection:
     """
     An OracleCollection that represents a category or grouping of tables, which
@@ -14091,7 +14091,7 @@ class OracleTablesCollection:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PageNumber:
     """
     Represents a page number in a book.
@@ -14202,7 +14202,7 @@ class ProgressRollOptionUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProgressRollOption:
     using: 'ProgressRollOptionUsing'
 
@@ -14217,7 +14217,7 @@ class ProgressRollOption:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProgressTrackTypeInfo:
     """
     Describes the features of a type of progress track.
@@ -14253,7 +14253,7 @@ class RarityType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rarity:
     """
     A rarity, as described in Ironsworn: Delve.
@@ -14366,7 +14366,7 @@ class Rarity:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RarityID:
     """
     A unique ID representing a Rarity object.
@@ -14381,7 +14381,7 @@ class RarityID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RarityIDWildcard:
     """
     A wildcarded RarityId that can be used to match multiple Rarity objects.
@@ -14396,7 +14396,7 @@ class RarityIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValue:
     """
     Provides a value like a stat, condition meter, or other number (usually for
@@ -14422,7 +14422,7 @@ class RollableValue:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueAssetControl(RollableValue):
     """
     A reference to the value of an asset control.
@@ -14449,7 +14449,7 @@ class RollableValueAssetControl(RollableValue):
         data["control"] = _to_json_data(self.control)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueAssetOption(RollableValue):
     """
     A reference to the value of an asset option.
@@ -14476,7 +14476,7 @@ class RollableValueAssetOption(RollableValue):
         data["option"] = _to_json_data(self.option)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueAttachedAssetControl(RollableValue):
     """
     A reference to the value of an attached asset control. For example, a Module
@@ -14502,7 +14502,7 @@ class RollableValueAttachedAssetControl(RollableValue):
         data["control"] = _to_json_data(self.control)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueAttachedAssetOption(RollableValue):
     """
     A reference to the value of an attached asset option.
@@ -14526,7 +14526,7 @@ class RollableValueAttachedAssetOption(RollableValue):
         data["option"] = _to_json_data(self.option)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueConditionMeter(RollableValue):
     """
     A reference to the value of a standard player condition meter.
@@ -14546,7 +14546,7 @@ class RollableValueConditionMeter(RollableValue):
         data["condition_meter"] = _to_json_data(self.condition_meter)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueCustom(RollableValue):
     """
     An arbitrary static integer value with a label.
@@ -14569,7 +14569,7 @@ class RollableValueCustom(RollableValue):
         data["value"] = _to_json_data(self.value)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RollableValueStat(RollableValue):
     """
     A reference to the value of a standard player character stat.
@@ -14601,7 +14601,7 @@ class RuleType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rules:
     """
     Describes rules for player characters in this ruleset, such as stats and
@@ -14652,7 +14652,7 @@ class Rules:
         data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesExpansion:
     """
     Describes rules for player characters in this ruleset, such as stats and
@@ -14708,7 +14708,7 @@ class RulesExpansion:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesPackageID:
     value: 'str'
 
@@ -14741,7 +14741,7 @@ class RulesetType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ruleset:
     """
     A standalone Datasworn package that describes its own ruleset.
@@ -14890,7 +14890,7 @@ class Ruleset:
              data["truths"] = _to_json_data(self.truths)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RulesetID:
     """
     The ID of standalone Datasworn package that describes its own ruleset.
@@ -14905,7 +14905,7 @@ class RulesetID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementFieldChoice0:
     choice_type: 'str'
 
@@ -14921,7 +14921,7 @@ class SelectEnhancementFieldChoice0:
     def to_json_data(self) -> Any:
         pass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementFieldChoiceChoice(SelectEnhancementFieldChoice0):
     """
     Represents an option in a list of choices.
@@ -14949,7 +14949,7 @@ class SelectEnhancementFieldChoiceChoice(SelectEnhancementFieldChoice0):
              data["enhance_moves"] = _to_json_data(self.enhance_moves)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementFieldChoiceChoiceGroup(SelectEnhancementFieldChoice0):
     """
     Represents a grouping of options in a list of choices.
@@ -14985,7 +14985,7 @@ class SelectEnhancementFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementField:
     """
     Select from player and/or asset enhancements. Use it to describe modal
@@ -15032,7 +15032,7 @@ class SelectEnhancementFieldChoiceChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementFieldChoice:
     """
     Represents an option in a list of choices.
@@ -15071,7 +15071,7 @@ class SelectEnhancementFieldChoiceGroupChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectEnhancementFieldChoiceGroup:
     """
     Represents a grouping of options in a list of choices.
@@ -15109,7 +15109,7 @@ class SelectValueFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueField:
     """
     Represents a list of mutually exclusive choices.
@@ -15145,7 +15145,7 @@ class SelectValueField:
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoice:
     using: 'str'
 
@@ -15175,7 +15175,7 @@ class SelectValueFieldChoiceAssetControlChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceAssetControl(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15217,7 +15217,7 @@ class SelectValueFieldChoiceAssetOptionChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceAssetOption(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15259,7 +15259,7 @@ class SelectValueFieldChoiceAttachedAssetControlChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceAttachedAssetControl(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15298,7 +15298,7 @@ class SelectValueFieldChoiceAttachedAssetOptionChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceAttachedAssetOption(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15337,7 +15337,7 @@ class SelectValueFieldChoiceConditionMeterChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceConditionMeter(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15372,7 +15372,7 @@ class SelectValueFieldChoiceCustomChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceCustom(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15407,7 +15407,7 @@ class SelectValueFieldChoiceStatChoiceType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelectValueFieldChoiceStat(SelectValueFieldChoice):
     """
     Represents an option in a list of choices.
@@ -15433,7 +15433,7 @@ class SelectValueFieldChoiceStat(SelectValueFieldChoice):
         data["stat"] = _to_json_data(self.stat)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticVersion:
     value: 'str'
 
@@ -15444,7 +15444,7 @@ class SemanticVersion:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceInfo:
     """
     Metadata describing the original source of this node
@@ -15543,7 +15543,7 @@ class SpecialTrackRollMethod(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpecialTrackRule:
     """
     Describes a special track like Bonds (classic Ironsworn), Failure (Delve),
@@ -15592,7 +15592,7 @@ class SpecialTrackRule:
              data["tags"] = _to_json_data(self.tags)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpecialTrackType:
     """
     Special, ruleset-specific progress tracks. Usually, one exists per player
@@ -15615,7 +15615,7 @@ class SpecialTrackType:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatKey:
     """
     A basic player character stat.
@@ -15630,7 +15630,7 @@ class StatKey:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatRule:
     """
     Describes a standard player character stat.
@@ -15677,7 +15677,7 @@ class StatValueRefUsing(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatValueRef:
     """
     A reference to the value of a standard player character stat.
@@ -15703,7 +15703,7 @@ class StatValueRef:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Suggestions:
     value: 'List[AnyIDWildcard]'
 
@@ -15714,7 +15714,7 @@ class Suggestions:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SvgImageURL:
     """
     A relative (local) URL pointing to a vector image in the SVG format.
@@ -15729,7 +15729,7 @@ class SvgImageURL:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tag:
     value: 'Any'
 
@@ -15740,7 +15740,7 @@ class Tag:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TagRule:
     schema: 'TagSchema'
     """
@@ -15762,7 +15762,7 @@ class TagRule:
         data["node_types"] = _to_json_data(self.node_types)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TagSchema:
     """
     JSON schema used to validate the tag data, with a mandatory description.
@@ -15813,7 +15813,7 @@ class TaggableNodeType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tags:
     """
     A dictionary of tags, keyed by the RulesPackageId that the tags are from.
@@ -15837,7 +15837,7 @@ class TextFieldFieldType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextField:
     """
     Represents an input that accepts plain text.
@@ -15870,7 +15870,7 @@ class TextField:
              data["icon"] = _to_json_data(self.icon)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerActionRoll:
     """
     Describes trigger conditions for a move that makes an action roll.
@@ -15903,7 +15903,7 @@ class TriggerActionRoll:
         data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerActionRollCondition:
     method: 'ActionRollMethod'
     roll_options: 'List[RollableValue]'
@@ -15937,7 +15937,7 @@ class TriggerActionRollCondition:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerActionRollConditionEnhancement:
     method: 'Optional[ActionRollMethod]'
     roll_options: 'Optional[List[RollableValue]]'
@@ -15971,7 +15971,7 @@ class TriggerActionRollConditionEnhancement:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerActionRollEnhancement:
     """
     Describes changes/additions made to the enhanced move's trigger conditions.
@@ -15994,7 +15994,7 @@ class TriggerActionRollEnhancement:
         data["conditions"] = _to_json_data(self.conditions)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerBy:
     """
     Information on who can activate this trigger condition. Usually this is just
@@ -16025,7 +16025,7 @@ class TriggerBy:
         data["player"] = _to_json_data(self.player)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerNoRoll:
     """
     Describes trigger conditions for a move that makes no rolls.
@@ -16058,7 +16058,7 @@ class TriggerNoRoll:
         data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerNoRollCondition:
     by: 'Optional[TriggerBy]'
     text: 'Optional[MarkdownString]'
@@ -16082,7 +16082,7 @@ class TriggerNoRollCondition:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerNoRollEnhancement:
     """
     Describes changes/additions made to the enhanced move's trigger conditions.
@@ -16105,7 +16105,7 @@ class TriggerNoRollEnhancement:
         data["conditions"] = _to_json_data(self.conditions)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerProgressRoll:
     conditions: 'List[TriggerProgressRollCondition]'
     """
@@ -16134,7 +16134,7 @@ class TriggerProgressRoll:
         data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerProgressRollCondition:
     method: 'ProgressRollMethod'
     roll_options: 'List[ProgressRollOption]'
@@ -16168,7 +16168,7 @@ class TriggerProgressRollCondition:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerProgressRollConditionEnhancement:
     method: 'Optional[ProgressRollMethod]'
     roll_options: 'Optional[List[ProgressRollOption]]'
@@ -16202,7 +16202,7 @@ class TriggerProgressRollConditionEnhancement:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerProgressRollEnhancement:
     """
     Describes changes/additions made to the enhanced move's trigger conditions.
@@ -16225,7 +16225,7 @@ class TriggerProgressRollEnhancement:
         data["conditions"] = _to_json_data(self.conditions)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpecialTrack:
     conditions: 'List[TriggerSpecialTrackCondition]'
     """
@@ -16254,7 +16254,7 @@ class TriggerSpecialTrack:
         data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpecialTrackCondition:
     method: 'SpecialTrackRollMethod'
     roll_options: 'List[TriggerSpecialTrackConditionOption]'
@@ -16288,7 +16288,7 @@ class TriggerSpecialTrackCondition:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpecialTrackConditionEnhancement:
     """
     A progress move that rolls on one or more special tracks, like Bonds
@@ -16327,7 +16327,7 @@ class TriggerSpecialTrackConditionEnhancement:
              data["text"] = _to_json_data(self.text)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpecialTrackConditionOption:
     using: 'SpecialTrackType'
 
@@ -16342,7 +16342,7 @@ class TriggerSpecialTrackConditionOption:
         data["using"] = _to_json_data(self.using)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriggerSpecialTrackEnhancement:
     """
     Describes changes/additions made to the enhanced move's trigger conditions.
@@ -16374,7 +16374,7 @@ class TruthType(Enum):
     def to_json_data(self) -> Any:
         return self.value
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Truth:
     """
     A setting truth category.
@@ -16488,7 +16488,7 @@ class Truth:
              data["your_character"] = _to_json_data(self.your_character)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthID:
     """
     A unique ID representing a Truth object.
@@ -16503,7 +16503,7 @@ class TruthID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthIDWildcard:
     """
     A wildcarded TruthId that can be used to match multiple Truth objects.
@@ -16518,7 +16518,7 @@ class TruthIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOption:
     id: 'TruthOptionID'
     """
@@ -16558,7 +16558,7 @@ class TruthOption:
              data["summary"] = _to_json_data(self.summary)
         return data
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionID:
     """
     A unique ID representing a TruthOption object.
@@ -16573,7 +16573,7 @@ class TruthOptionID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionIDWildcard:
     """
     A wildcarded TruthOptionId that can be used to match multiple TruthOption
@@ -16589,7 +16589,7 @@ class TruthOptionIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionOracleRollableID:
     """
     A unique ID representing a TruthOptionOracleRollable object.
@@ -16604,7 +16604,7 @@ class TruthOptionOracleRollableID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionOracleRollableIDWildcard:
     """
     A wildcarded TruthOptionOracleRollableId that can be used to match multiple
@@ -16620,7 +16620,7 @@ class TruthOptionOracleRollableIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionOracleRollableRowID:
     """
     A unique ID representing a TruthOptionOracleRollableRow object.
@@ -16635,7 +16635,7 @@ class TruthOptionOracleRollableRowID:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TruthOptionOracleRollableRowIDWildcard:
     """
     A wildcarded TruthOptionOracleRollableRowId that can be used to match
@@ -16651,7 +16651,7 @@ class TruthOptionOracleRollableRowIDWildcard:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebURL:
     """
     An absolute URL pointing to a website.
@@ -16666,7 +16666,7 @@ class WebURL:
     def to_json_data(self) -> Any:
         return _to_json_data(self.value)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WebpImageURL:
     """
     A relative (local) URL pointing to a raster image in the WEBP format.
@@ -0,0 +1,4865 @@
+# Code generated by pysworn.datasworn.codegen from _datasworn/__init__.py.
+# Do not edit, run `datasworn codegen` instead.
+# ruff: noqa
+
+from . import (
+    ActionRollMethod,
+    AnyID,
+    AnyIDWildcard,
+    AnyMoveID,
+    AnyMoveIDWildcard,
+    AnyOracleRollableID,
+    AnyOracleRollableIDWildcard,
+    AnyOracleRollableRowID,
+    AnyOracleRollableRowIDWildcard,
+    Asset,
+    AssetAbility,
+    AssetAbilityControlField,
+    AssetAbilityControlFieldCheckbox,
+    AssetAbilityControlFieldClock,
+    AssetAbilityControlFieldCounter,
+    AssetAbilityControlFieldText,
+    AssetAbilityID,
+    AssetAbilityIDWildcard,
+    AssetAbilityMoveID,
+    AssetAbilityMoveIDWildcard,
+    AssetAbilityOptionField,
+    AssetAbilityOptionFieldText,
+    AssetAbilityOracleRollableID,
+    AssetAbilityOracleRollableIDWildcard,
+    AssetAbilityOracleRollableRowID,
+    AssetAbilityOracleRollableRowIDWildcard,
+    AssetAttachment,
+    AssetCardFlipField,
+    AssetCardFlipFieldFieldType,
+    AssetCheckboxField,
+    AssetCheckboxFieldFieldType,
+    AssetCollection,
+    AssetCollectionID,
+    AssetCollectionIDWildcard,
+    AssetCollectionType,
+    AssetConditionMeter,
+    AssetConditionMeterControlField,
+    AssetConditionMeterControlFieldCardFlip,
+    AssetConditionMeterControlFieldCheckbox,
+    AssetConditionMeterEnhancement,
+    AssetConditionMeterEnhancementFieldType,
+    AssetConditionMeterFieldType,
+    AssetConditionMeterMoves,
+    AssetControlField,
+    AssetControlFieldCardFlip,
+    AssetControlFieldCheckbox,
+    AssetControlFieldConditionMeter,
+    AssetControlFieldConditionMeterMoves,
+    AssetControlFieldEnhancement,
+    AssetControlFieldEnhancementConditionMeter,
+    AssetControlFieldSelectEnhancement,
+    AssetControlFieldSelectEnhancementChoice,
+    AssetControlFieldSelectEnhancementChoiceChoice,
+    AssetControlFieldSelectEnhancementChoiceChoiceGroup,
+    AssetControlValueRef,
+    AssetControlValueRefUsing,
+    AssetEnhancement,
+    AssetID,
+    AssetIDWildcard,
+    AssetOptionField,
+    AssetOptionFieldSelectEnhancement,
+    AssetOptionFieldSelectEnhancementChoice,
+    AssetOptionFieldSelectEnhancementChoiceChoice,
+    AssetOptionFieldSelectEnhancementChoiceChoiceGroup,
+    AssetOptionFieldSelectValue,
+    AssetOptionFieldText,
+    AssetOptionValueRef,
+    AssetOptionValueRefUsing,
+    AssetType,
+    AtlasCollection,
+    AtlasCollectionID,
+    AtlasCollectionIDWildcard,
+    AtlasCollectionType,
+    AtlasEntry,
+    AtlasEntryID,
+    AtlasEntryIDWildcard,
+    AtlasEntryType,
+    AttachedAssetControlValueRef,
+    AttachedAssetControlValueRefUsing,
+    AttachedAssetOptionValueRef,
+    AttachedAssetOptionValueRefUsing,
+    AuthorInfo,
+    CSSColor,
+    ChallengeRank,
+    ClockField,
+    ClockFieldFieldType,
+    CollectableType,
+    CollectionType,
+    ConditionMeterField,
+    ConditionMeterFieldFieldType,
+    ConditionMeterKey,
+    ConditionMeterRule,
+    ConditionMeterValueRef,
+    ConditionMeterValueRefUsing,
+    CoreTags,
+    CounterField,
+    CounterFieldFieldType,
+    CustomValue,
+    CustomValueUsing,
+    DelveSite,
+    DelveSiteDenizen,
+    DelveSiteDenizenFrequency,
+    DelveSiteDenizenID,
+    DelveSiteDenizenIDWildcard,
+    DelveSiteDomain,
+    DelveSiteDomainDanger,
+    DelveSiteDomainDangerID,
+    DelveSiteDomainDangerIDWildcard,
+    DelveSiteDomainFeature,
+    DelveSiteDomainFeatureID,
+    DelveSiteDomainFeatureIDWildcard,
+    DelveSiteDomainID,
+    DelveSiteDomainIDWildcard,
+    DelveSiteDomainType,
+    DelveSiteID,
+    DelveSiteIDWildcard,
+    DelveSiteTheme,
+    DelveSiteThemeDanger,
+    DelveSiteThemeDangerID,
+    DelveSiteThemeDangerIDWildcard,
+    DelveSiteThemeFeature,
+    DelveSiteThemeFeatureID,
+    DelveSiteThemeFeatureIDWildcard,
+    DelveSiteThemeID,
+    DelveSiteThemeIDWildcard,
+    DelveSiteThemeType,
+    DelveSiteType,
+    DiceExpression,
+    DiceRange,
+    DictKey,
+    Documentation,
+    Email,
+    EmbedOnlyType,
+    EmbeddedActionRollMove,
+    EmbeddedActionRollMoveRollType,
+    EmbeddedActionRollMoveType,
+    EmbeddedMove,
+    EmbeddedMoveActionRoll,
+    EmbeddedMoveActionRollType,
+    EmbeddedMoveID,
+    EmbeddedMoveIDWildcard,
+    EmbeddedMoveNoRoll,
+    EmbeddedMoveNoRollType,
+    EmbeddedMoveProgressRoll,
+    EmbeddedMoveProgressRollType,
+    EmbeddedMoveSpecialTrack,
+    EmbeddedMoveSpecialTrackType,
+    EmbeddedNoRollMove,
+    EmbeddedNoRollMoveRollType,
+    EmbeddedNoRollMoveType,
+    EmbeddedOracleColumnText,
+    EmbeddedOracleColumnText2,
+    EmbeddedOracleColumnText2OracleType,
+    EmbeddedOracleColumnText2RecommendedRolls,
+    EmbeddedOracleColumnText2Type,
+    EmbeddedOracleColumnText3,
+    EmbeddedOracleColumnText3OracleType,
+    EmbeddedOracleColumnText3RecommendedRolls,
+    EmbeddedOracleColumnText3Type,
+    EmbeddedOracleColumnTextOracleType,
+    EmbeddedOracleColumnTextRecommendedRolls,
+    EmbeddedOracleColumnTextType,
+    EmbeddedOracleRollable,
+    EmbeddedOracleRollableColumnText,
+    EmbeddedOracleRollableColumnText2,
+    EmbeddedOracleRollableColumnText2RecommendedRolls,
+    EmbeddedOracleRollableColumnText2Type,
+    EmbeddedOracleRollableColumnText3,
+    EmbeddedOracleRollableColumnText3RecommendedRolls,
+    EmbeddedOracleRollableColumnText3Type,
+    EmbeddedOracleRollableColumnTextRecommendedRolls,
+    EmbeddedOracleRollableColumnTextType,
+    EmbeddedOracleRollableID,
+    EmbeddedOracleRollableIDWildcard,
+    EmbeddedOracleRollableTableText,
+    EmbeddedOracleRollableTableText2,
+    EmbeddedOracleRollableTableText2ColumnLabels,
+    EmbeddedOracleRollableTableText2RecommendedRolls,
+    EmbeddedOracleRollableTableText2Type,
+    EmbeddedOracleRollableTableText3,
+    EmbeddedOracleRollableTableText3ColumnLabels,
+    EmbeddedOracleRollableTableText3RecommendedRolls,
+    EmbeddedOracleRollableTableText3Type,
+    EmbeddedOracleRollableTableTextColumnLabels,
+    EmbeddedOracleRollableTableTextRecommendedRolls,
+    EmbeddedOracleRollableTableTextType,
+    EmbeddedOracleTableText,
+    EmbeddedOracleTableText2,
+    EmbeddedOracleTableText2ColumnLabels,
+    EmbeddedOracleTableText2OracleType,
+    EmbeddedOracleTableText2RecommendedRolls,
+    EmbeddedOracleTableText2Type,
+    EmbeddedOracleTableText3,
+    EmbeddedOracleTableText3ColumnLabels,
+    EmbeddedOracleTableText3OracleType,
+    EmbeddedOracleTableText3RecommendedRolls,
+    EmbeddedOracleTableText3Type,
+    EmbeddedOracleTableTextColumnLabels,
+    EmbeddedOracleTableTextOracleType,
+    EmbeddedOracleTableTextRecommendedRolls,
+    EmbeddedOracleTableTextType,
+    EmbeddedProgressRollMove,
+    EmbeddedProgressRollMoveRollType,
+    EmbeddedProgressRollMoveType,
+    EmbeddedSpecialTrackMove,
+    EmbeddedSpecialTrackMoveRollType,
+    EmbeddedSpecialTrackMoveType,
+    EntityPrompt,
+    Expansion,
+    ExpansionDataswornVersion,
+    ExpansionID,
+    ExpansionType,
+    I18nHint,
+    I18nHints,
+    I18nHintsTemplate,
+    ImpactCategory,
+    ImpactRule,
+    Label,
+    MarkdownString,
+    MarkdownTemplateString,
+    Move,
+    MoveActionRoll,
+    MoveActionRoll0,
+    MoveActionRollEnhancement,
+    MoveActionRollEnhancementRollType,
+    MoveActionRollRollType,
+    MoveActionRollType,
+    MoveActionRollType0,
+    MoveCategory,
+    MoveCategoryID,
+    MoveCategoryIDWildcard,
+    MoveCategoryType,
+    MoveEnhancement,
+    MoveEnhancementActionRoll,
+    MoveEnhancementNoRoll,
+    MoveEnhancementProgressRoll,
+    MoveEnhancementSpecialTrack,
+    MoveID,
+    MoveIDWildcard,
+    MoveNoRoll,
+    MoveNoRoll0,
+    MoveNoRollEnhancement,
+    MoveNoRollEnhancementRollType,
+    MoveNoRollRollType,
+    MoveNoRollType,
+    MoveNoRollType0,
+    MoveOracleRollableID,
+    MoveOracleRollableIDWildcard,
+    MoveOracleRollableRowID,
+    MoveOracleRollableRowIDWildcard,
+    MoveOutcome,
+    MoveOutcomes,
+    MoveProgressRoll,
+    MoveProgressRoll0,
+    MoveProgressRollEnhancement,
+    MoveProgressRollEnhancementRollType,
+    MoveProgressRollRollType,
+    MoveProgressRollType,
+    MoveProgressRollType0,
+    MoveRollType,
+    MoveSpecialTrack,
+    MoveSpecialTrack0,
+    MoveSpecialTrackEnhancement,
+    MoveSpecialTrackEnhancementRollType,
+    MoveSpecialTrackRollType,
+    MoveSpecialTrackType,
+    MoveSpecialTrackType0,
+    NonCollectableType,
+    Npc,
+    NpcCollection,
+    NpcCollectionID,
+    NpcCollectionIDWildcard,
+    NpcCollectionType,
+    NpcID,
+    NpcIDWildcard,
+    NpcNature,
+    NpcType,
+    NpcVariant,
+    NpcVariantID,
+    NpcVariantIDWildcard,
+    OracleCollection,
+    OracleCollectionID,
+    OracleCollectionIDWildcard,
+    OracleCollectionTableSharedRolls,
+    OracleCollectionTableSharedRollsColumnLabels,
+    OracleCollectionTableSharedRollsType,
+    OracleCollectionTableSharedText,
+    OracleCollectionTableSharedText2,
+    OracleCollectionTableSharedText2ColumnLabels,
+    OracleCollectionTableSharedText2Type,
+    OracleCollectionTableSharedText3,
+    OracleCollectionTableSharedText3ColumnLabels,
+    OracleCollectionTableSharedText3Type,
+    OracleCollectionTableSharedTextColumnLabels,
+    OracleCollectionTableSharedTextType,
+    OracleCollectionTables,
+    OracleCollectionTablesType,
+    OracleColumnText,
+    OracleColumnText2,
+    OracleColumnText2OracleType,
+    OracleColumnText2RecommendedRolls,
+    OracleColumnText2Type,
+    OracleColumnText3,
+    OracleColumnText3OracleType,
+    OracleColumnText3RecommendedRolls,
+    OracleColumnText3Type,
+    OracleColumnTextOracleType,
+    OracleColumnTextRecommendedRolls,
+    OracleColumnTextType,
+    OracleDuplicateBehavior,
+    OracleMatchBehavior,
+    OracleRoll,
+    OracleRollTemplate,
+    OracleRollable,
+    OracleRollableColumnText,
+    OracleRollableColumnText2,
+    OracleRollableColumnText2RecommendedRolls,
+    OracleRollableColumnText2Type,
+    OracleRollableColumnText3,
+    OracleRollableColumnText3RecommendedRolls,
+    OracleRollableColumnText3Type,
+    OracleRollableColumnTextRecommendedRolls,
+    OracleRollableColumnTextType,
+    OracleRollableID,
+    OracleRollableIDWildcard,
+    OracleRollableRowID,
+    OracleRollableRowIDWildcard,
+    OracleRollableRowText,
+    OracleRollableRowText2,
+    OracleRollableRowText3,
+    OracleRollableTable,
+    OracleRollableTableTableText,
+    OracleRollableTableTableText2,
+    OracleRollableTableTableText2ColumnLabels,
+    OracleRollableTableTableText2RecommendedRolls,
+    OracleRollableTableTableText2Type,
+    OracleRollableTableTableText3,
+    OracleRollableTableTableText3ColumnLabels,
+    OracleRollableTableTableText3RecommendedRolls,
+    OracleRollableTableTableText3Type,
+    OracleRollableTableTableTextColumnLabels,
+    OracleRollableTableTableTextRecommendedRolls,
+    OracleRollableTableTableTextType,
+    OracleRollableTableText,
+    OracleRollableTableText2,
+    OracleRollableTableText2ColumnLabels,
+    OracleRollableTableText2RecommendedRolls,
+    OracleRollableTableText2Type,
+    OracleRollableTableText3,
+    OracleRollableTableText3ColumnLabels,
+    OracleRollableTableText3RecommendedRolls,
+    OracleRollableTableText3Type,
+    OracleRollableTableTextColumnLabels,
+    OracleRollableTableTextRecommendedRolls,
+    OracleRollableTableTextType,
+    OracleTableSharedRolls,
+    OracleTableSharedRollsColumnLabels,
+    OracleTableSharedRollsOracleType,
+    OracleTableSharedRollsType,
+    OracleTableSharedText,
+    OracleTableSharedText2,
+    OracleTableSharedText2ColumnLabels,
+    OracleTableSharedText2OracleType,
+    OracleTableSharedText2Type,
+    OracleTableSharedText3,
+    OracleTableSharedText3ColumnLabels,
+    OracleTableSharedText3OracleType,
+    OracleTableSharedText3Type,
+    OracleTableSharedTextColumnLabels,
+    OracleTableSharedTextOracleType,
+    OracleTableSharedTextType,
+    OracleTableText,
+    OracleTableText2,
+    OracleTableText2ColumnLabels,
+    OracleTableText2OracleType,
+    OracleTableText2RecommendedRolls,
+    OracleTableText2Type,
+    OracleTableText3,
+    OracleTableText3ColumnLabels,
+    OracleTableText3OracleType,
+    OracleTableText3RecommendedRolls,
+    OracleTableText3Type,
+    OracleTableTextColumnLabels,
+    OracleTableTextOracleType,
+    OracleTableTextRecommendedRolls,
+    OracleTableTextType,
+    OracleTablesCollection,
+    OracleTablesCollectionOracleType,
+    OracleTablesCollectionType,
+    PageNumber,
+    PartOfSpeech,
+    ProgressRollMethod,
+    ProgressRollOption,
+    ProgressRollOptionUsing,
+    ProgressTrackTypeInfo,
+    Rarity,
+    RarityID,
+    RarityIDWildcard,
+    RarityType,
+    RollableValue,
+    RollableValueAssetControl,
+    RollableValueAssetOption,
+    RollableValueAttachedAssetControl,
+    RollableValueAttachedAssetOption,
+    RollableValueConditionMeter,
+    RollableValueCustom,
+    RollableValueStat,
+    RuleType,
+    Rules,
+    RulesExpansion,
+    RulesPackage,
+    RulesPackageExpansion,
+    RulesPackageExpansionDataswornVersion,
+    RulesPackageID,
+    RulesPackageRuleset,
+    RulesPackageRulesetDataswornVersion,
+    Ruleset,
+    RulesetDataswornVersion,
+    RulesetID,
+    RulesetType,
+    SelectEnhancementField,
+    SelectEnhancementFieldChoice,
+    SelectEnhancementFieldChoice0,
+    SelectEnhancementFieldChoiceChoice,
+    SelectEnhancementFieldChoiceChoiceGroup,
+    SelectEnhancementFieldChoiceChoiceType,
+    SelectEnhancementFieldChoiceGroup,
+    SelectEnhancementFieldChoiceGroupChoiceType,
+    SelectEnhancementFieldFieldType,
+    SelectValueField,
+    SelectValueFieldChoice,
+    SelectValueFieldChoiceAssetControl,
+    SelectValueFieldChoiceAssetControlChoiceType,
+    SelectValueFieldChoiceAssetOption,
+    SelectValueFieldChoiceAssetOptionChoiceType,
+    SelectValueFieldChoiceAttachedAssetControl,
+    SelectValueFieldChoiceAttachedAssetControlChoiceType,
+    SelectValueFieldChoiceAttachedAssetOption,
+    SelectValueFieldChoiceAttachedAssetOptionChoiceType,
+    SelectValueFieldChoiceConditionMeter,
+    SelectValueFieldChoiceConditionMeterChoiceType,
+    SelectValueFieldChoiceCustom,
+    SelectValueFieldChoiceCustomChoiceType,
+    SelectValueFieldChoiceStat,
+    SelectValueFieldChoiceStatChoiceType,
+    SelectValueFieldFieldType,
+    SemanticVersion,
+    SourceInfo,
+    SpecialTrackRollMethod,
+    SpecialTrackRule,
+    SpecialTrackType,
+    StatKey,
+    StatRule,
+    StatValueRef,
+    StatValueRefUsing,
+    Suggestions,
+    SvgImageURL,
+    Tag,
+    TagRule,
+    TagSchema,
+    TaggableNodeType,
+    Tags,
+    TextField,
+    TextFieldFieldType,
+    TriggerActionRoll,
+    TriggerActionRollCondition,
+    TriggerActionRollConditionEnhancement,
+    TriggerActionRollEnhancement,
+    TriggerBy,
+    TriggerNoRoll,
+    TriggerNoRollCondition,
+    TriggerNoRollEnhancement,
+    TriggerProgressRoll,
+    TriggerProgressRollCondition,
+    TriggerProgressRollConditionEnhancement,
+    TriggerProgressRollEnhancement,
+    TriggerSpecialTrack,
+    TriggerSpecialTrackCondition,
+    TriggerSpecialTrackConditionEnhancement,
+    TriggerSpecialTrackConditionOption,
+    TriggerSpecialTrackEnhancement,
+    Truth,
+    TruthID,
+    TruthIDWildcard,
+    TruthOption,
+    TruthOptionID,
+    TruthOptionIDWildcard,
+    TruthOptionOracleRollableID,
+    TruthOptionOracleRollableIDWildcard,
+    TruthOptionOracleRollableRowID,
+    TruthOptionOracleRollableRowIDWildcard,
+    TruthType,
+    WebURL,
+    WebpImageURL,
+)
+
+
+_RulesPackageExpansionDataswornVersion = {m.value: m for m in RulesPackageExpansionDataswornVersion}
+_RulesPackageRulesetDataswornVersion = {m.value: m for m in RulesPackageRulesetDataswornVersion}
+_ActionRollMethod = {m.value: m for m in ActionRollMethod}
+_AssetType = {m.value: m for m in AssetType}
+_AssetCardFlipFieldFieldType = {m.value: m for m in AssetCardFlipFieldFieldType}
+_AssetCheckboxFieldFieldType = {m.value: m for m in AssetCheckboxFieldFieldType}
+_AssetCollectionType = {m.value: m for m in AssetCollectionType}
+_AssetConditionMeterFieldType = {m.value: m for m in AssetConditionMeterFieldType}
+_AssetConditionMeterEnhancementFieldType = {m.value: m for m in AssetConditionMeterEnhancementFieldType}
+_AssetControlValueRefUsing = {m.value: m for m in AssetControlValueRefUsing}
+_AssetOptionValueRefUsing = {m.value: m for m in AssetOptionValueRefUsing}
+_AtlasCollectionType = {m.value: m for m in AtlasCollectionType}
+_AtlasEntryType = {m.value: m for m in AtlasEntryType}
+_AttachedAssetControlValueRefUsing = {m.value: m for m in AttachedAssetControlValueRefUsing}
+_AttachedAssetOptionValueRefUsing = {m.value: m for m in AttachedAssetOptionValueRefUsing}
+_ClockFieldFieldType = {m.value: m for m in ClockFieldFieldType}
+_CollectableType = {m.value: m for m in CollectableType}
+_CollectionType = {m.value: m for m in CollectionType}
+_ConditionMeterFieldFieldType = {m.value: m for m in ConditionMeterFieldFieldType}
+_ConditionMeterValueRefUsing = {m.value: m for m in ConditionMeterValueRefUsing}
+_CounterFieldFieldType = {m.value: m for m in CounterFieldFieldType}
+_CustomValueUsing = {m.value: m for m in CustomValueUsing}
+_DelveSiteType = {m.value: m for m in DelveSiteType}
+_DelveSiteDenizenFrequency = {m.value: m for m in DelveSiteDenizenFrequency}
+_DelveSiteDomainType = {m.value: m for m in DelveSiteDomainType}
+_DelveSiteThemeType = {m.value: m for m in DelveSiteThemeType}
+_EmbedOnlyType = {m.value: m for m in EmbedOnlyType}
+_EmbeddedActionRollMoveRollType = {m.value: m for m in EmbeddedActionRollMoveRollType}
+_EmbeddedActionRollMoveType = {m.value: m for m in EmbeddedActionRollMoveType}
+_EmbeddedMoveActionRollType = {m.value: m for m in EmbeddedMoveActionRollType}
+_EmbeddedMoveNoRollType = {m.value: m for m in EmbeddedMoveNoRollType}
+_EmbeddedMoveProgressRollType = {m.value: m for m in EmbeddedMoveProgressRollType}
+_EmbeddedMoveSpecialTrackType = {m.value: m for m in EmbeddedMoveSpecialTrackType}
+_EmbeddedNoRollMoveRollType = {m.value: m for m in EmbeddedNoRollMoveRollType}
+_EmbeddedNoRollMoveType = {m.value: m for m in EmbeddedNoRollMoveType}
+_EmbeddedOracleColumnTextOracleType = {m.value: m for m in EmbeddedOracleColumnTextOracleType}
+_EmbeddedOracleColumnTextType = {m.value: m for m in EmbeddedOracleColumnTextType}
+_EmbeddedOracleColumnText2OracleType = {m.value: m for m in EmbeddedOracleColumnText2OracleType}
+_EmbeddedOracleColumnText2Type = {m.value: m for m in EmbeddedOracleColumnText2Type}
+_EmbeddedOracleColumnText3OracleType = {m.value: m for m in EmbeddedOracleColumnText3OracleType}
+_EmbeddedOracleColumnText3Type = {m.value: m for m in EmbeddedOracleColumnText3Type}
+_EmbeddedOracleRollableColumnTextType = {m.value: m for m in EmbeddedOracleRollableColumnTextType}
+_EmbeddedOracleRollableColumnText2Type = {m.value: m for m in EmbeddedOracleRollableColumnText2Type}
+_EmbeddedOracleRollableColumnText3Type = {m.value: m for m in EmbeddedOracleRollableColumnText3Type}
+_EmbeddedOracleRollableTableTextType = {m.value: m for m in EmbeddedOracleRollableTableTextType}
+_EmbeddedOracleRollableTableText2Type = {m.value: m for m in EmbeddedOracleRollableTableText2Type}
+_EmbeddedOracleRollableTableText3Type = {m.value: m for m in EmbeddedOracleRollableTableText3Type}
+_EmbeddedOracleTableTextOracleType = {m.value: m for m in EmbeddedOracleTableTextOracleType}
+_EmbeddedOracleTableTextType = {m.value: m for m in EmbeddedOracleTableTextType}
+_EmbeddedOracleTableText2OracleType = {m.value: m for m in EmbeddedOracleTableText2OracleType}
+_EmbeddedOracleTableText2Type = {m.value: m for m in EmbeddedOracleTableText2Type}
+_EmbeddedOracleTableText3OracleType = {m.value: m for m in EmbeddedOracleTableText3OracleType}
+_EmbeddedOracleTableText3Type = {m.value: m for m in EmbeddedOracleTableText3Type}
+_EmbeddedProgressRollMoveRollType = {m.value: m for m in EmbeddedProgressRollMoveRollType}
+_EmbeddedProgressRollMoveType = {m.value: m for m in EmbeddedProgressRollMoveType}
+_EmbeddedSpecialTrackMoveRollType = {m.value: m for m in EmbeddedSpecialTrackMoveRollType}
+_EmbeddedSpecialTrackMoveType = {m.value: m for m in EmbeddedSpecialTrackMoveType}
+_ExpansionDataswornVersion = {m.value: m for m in ExpansionDataswornVersion}
+_ExpansionType = {m.value: m for m in ExpansionType}
+_MoveActionRollType = {m.value: m for m in MoveActionRollType}
+_MoveNoRollType = {m.value: m for m in MoveNoRollType}
+_MoveProgressRollType = {m.value: m for m in MoveProgressRollType}
+_MoveSpecialTrackType = {m.value: m for m in MoveSpecialTrackType}
+_MoveActionRollRollType = {m.value: m for m in MoveActionRollRollType}
+_MoveActionRollType0 = {m.value: m for m in MoveActionRollType0}
+_MoveActionRollEnhancementRollType = {m.value: m for m in MoveActionRollEnhancementRollType}
+_MoveCategoryType = {m.value: m for m in MoveCategoryType}
+_MoveNoRollRollType = {m.value: m for m in MoveNoRollRollType}
+_MoveNoRollType0 = {m.value: m for m in MoveNoRollType0}
+_MoveNoRollEnhancementRollType = {m.value: m for m in MoveNoRollEnhancementRollType}
+_MoveProgressRollRollType = {m.value: m for m in MoveProgressRollRollType}
+_MoveProgressRollType0 = {m.value: m for m in MoveProgressRollType0}
+_MoveProgressRollEnhancementRollType = {m.value: m for m in MoveProgressRollEnhancementRollType}
+_MoveRollType = {m.value: m for m in MoveRollType}
+_MoveSpecialTrackRollType = {m.value: m for m in MoveSpecialTrackRollType}
+_MoveSpecialTrackType0 = {m.value: m for m in MoveSpecialTrackType0}
+_MoveSpecialTrackEnhancementRollType = {m.value: m for m in MoveSpecialTrackEnhancementRollType}
+_NonCollectableType = {m.value: m for m in NonCollectableType}
+_NpcType = {m.value: m for m in NpcType}
+_NpcCollectionType = {m.value: m for m in NpcCollectionType}
+_OracleCollectionTableSharedRollsType = {m.value: m for m in OracleCollectionTableSharedRollsType}
+_OracleCollectionTableSharedTextType = {m.value: m for m in OracleCollectionTableSharedTextType}
+_OracleCollectionTableSharedText2Type = {m.value: m for m in OracleCollectionTableSharedText2Type}
+_OracleCollectionTableSharedText3Type = {m.value: m for m in OracleCollectionTableSharedText3Type}
+_OracleCollectionTablesType = {m.value: m for m in OracleCollectionTablesType}
+_OracleColumnTextOracleType = {m.value: m for m in OracleColumnTextOracleType}
+_OracleColumnTextType = {m.value: m for m in OracleColumnTextType}
+_OracleColumnText2OracleType = {m.value: m for m in OracleColumnText2OracleType}
+_OracleColumnText2Type = {m.value: m for m in OracleColumnText2Type}
+_OracleColumnText3OracleType = {m.value: m for m in OracleColumnText3OracleType}
+_OracleColumnText3Type = {m.value: m for m in OracleColumnText3Type}
+_OracleDuplicateBehavior = {m.value: m for m in OracleDuplicateBehavior}
+_OracleRollableColumnTextType = {m.value: m for m in OracleRollableColumnTextType}
+_OracleRollableColumnText2Type = {m.value: m for m in OracleRollableColumnText2Type}
+_OracleRollableColumnText3Type = {m.value: m for m in OracleRollableColumnText3Type}
+_OracleRollableTableTextType = {m.value: m for m in OracleRollableTableTextType}
+_OracleRollableTableText2Type = {m.value: m for m in OracleRollableTableText2Type}
+_OracleRollableTableText3Type = {m.value: m for m in OracleRollableTableText3Type}
+_OracleRollableTableTableTextType = {m.value: m for m in OracleRollableTableTableTextType}
+_OracleRollableTableTableText2Type = {m.value: m for m in OracleRollableTableTableText2Type}
+_OracleRollableTableTableText3Type = {m.value: m for m in OracleRollableTableTableText3Type}
+_OracleTableSharedRollsOracleType = {m.value: m for m in OracleTableSharedRollsOracleType}
+_OracleTableSharedRollsType = {m.value: m for m in OracleTableSharedRollsType}
+_OracleTableSharedTextOracleType = {m.value: m for m in OracleTableSharedTextOracleType}
+_OracleTableSharedTextType = {m.value: m for m in OracleTableSharedTextType}
+_OracleTableSharedText2OracleType = {m.value: m for m in OracleTableSharedText2OracleType}
+_OracleTableSharedText2Type = {m.value: m for m in OracleTableSharedText2Type}
+_OracleTableSharedText3OracleType = {m.value: m for m in OracleTableSharedText3OracleType}
+_OracleTableSharedText3Type = {m.value: m for m in OracleTableSharedText3Type}
+_OracleTableTextOracleType = {m.value: m for m in OracleTableTextOracleType}
+_OracleTableTextType = {m.value: m for m in OracleTableTextType}
+_OracleTableText2OracleType = {m.value: m for m in OracleTableText2OracleType}
+_OracleTableText2Type = {m.value: m for m in OracleTableText2Type}
+_OracleTableText3OracleType = {m.value: m for m in OracleTableText3OracleType}
+_OracleTableText3Type = {m.value: m for m in OracleTableText3Type}
+_OracleTablesCollectionOracleType = {m.value: m for m in OracleTablesCollectionOracleType}
+_OracleTablesCollectionType = {m.value: m for m in OracleTablesCollectionType}
+_PartOfSpeech = {m.value: m for m in PartOfSpeech}
+_ProgressRollMethod = {m.value: m for m in ProgressRollMethod}
+_ProgressRollOptionUsing = {m.value: m for m in ProgressRollOptionUsing}
+_RarityType = {m.value: m for m in RarityType}
+_RuleType = {m.value: m for m in RuleType}
+_RulesetDataswornVersion = {m.value: m for m in RulesetDataswornVersion}
+_RulesetType = {m.value: m for m in RulesetType}
+_SelectEnhancementFieldFieldType = {m.value: m for m in SelectEnhancementFieldFieldType}
+_SelectEnhancementFieldChoiceChoiceType = {m.value: m for m in SelectEnhancementFieldChoiceChoiceType}
+_SelectEnhancementFieldChoiceGroupChoiceType = {m.value: m for m in SelectEnhancementFieldChoiceGroupChoiceType}
+_SelectValueFieldFieldType = {m.value: m for m in SelectValueFieldFieldType}
+_SelectValueFieldChoiceAssetControlChoiceType = {m.value: m for m in SelectValueFieldChoiceAssetControlChoiceType}
+_SelectValueFieldChoiceAssetOptionChoiceType = {m.value: m for m in SelectValueFieldChoiceAssetOptionChoiceType}
+_SelectValueFieldChoiceAttachedAssetControlChoiceType = {m.value: m for m in SelectValueFieldChoiceAttachedAssetControlChoiceType}
+_SelectValueFieldChoiceAttachedAssetOptionChoiceType = {m.value: m for m in SelectValueFieldChoiceAttachedAssetOptionChoiceType}
+_SelectValueFieldChoiceConditionMeterChoiceType = {m.value: m for m in SelectValueFieldChoiceConditionMeterChoiceType}
+_SelectValueFieldChoiceCustomChoiceType = {m.value: m for m in SelectValueFieldChoiceCustomChoiceType}
+_SelectValueFieldChoiceStatChoiceType = {m.value: m for m in SelectValueFieldChoiceStatChoiceType}
+_SpecialTrackRollMethod = {m.value: m for m in SpecialTrackRollMethod}
+_StatValueRefUsing = {m.value: m for m in StatValueRefUsing}
+_TaggableNodeType = {m.value: m for m in TaggableNodeType}
+_TextFieldFieldType = {m.value: m for m in TextFieldFieldType}
+_TruthType = {m.value: m for m in TruthType}
+
+_CSSColor_interned = {}
+_DiceExpression_interned = {}
+_Label_interned = {}
+_MarkdownString_interned = {}
+_SourceInfo_interned = {}
+
+INTERNED = {
+    CSSColor: _CSSColor_interned,
+    DiceExpression: _DiceExpression_interned,
+    Label: _Label_interned,
+    MarkdownString: _MarkdownString_interned,
+    SourceInfo: _SourceInfo_interned,
+}
+
+
+def _RulesPackage(cls, data):
+    variant, from_json = _RulesPackage_variants[data['type']]
+    return from_json(variant, data)
+
+
+def _RulesPackageExpansion(cls, data):
+    get = data.get
+    return cls(
+        'expansion',
+        (None if (_v0 := get('_id')) is None else _ExpansionID(ExpansionID, _v0)),
+        (None if (_v0 := get('assets')) is None else {_k0: (None if _d0 is None else _AssetCollection(AssetCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('authors')) is None else [(None if _d0 is None else _AuthorInfo(AuthorInfo, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('datasworn_version')) is None else (_RulesPackageExpansionDataswornVersion.get(_v0) or RulesPackageExpansionDataswornVersion(_v0))),
+        get('date'),
+        (None if (_v0 := get('license')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('moves')) is None else {_k0: (None if _d0 is None else _MoveCategory(MoveCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _OracleTablesCollection(OracleTablesCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('ruleset')) is None else _RulesetID(RulesetID, _v0)),
+        (None if (_v0 := get('title')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('atlas')) is None else {_k0: (None if _d0 is None else _AtlasCollection(AtlasCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('delve_sites')) is None else {_k0: (None if _d0 is None else _DelveSite(DelveSite, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('npcs')) is None else {_k0: (None if _d0 is None else _NpcCollection(NpcCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rarities')) is None else {_k0: (None if _d0 is None else _Rarity(Rarity, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rules')) is None else _RulesExpansion(RulesExpansion, _v0)),
+        (None if (_v0 := get('site_domains')) is None else {_k0: (None if _d0 is None else _DelveSiteDomain(DelveSiteDomain, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_themes')) is None else {_k0: (None if _d0 is None else _DelveSiteTheme(DelveSiteTheme, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('truths')) is None else {_k0: (None if _d0 is None else _Truth(Truth, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _RulesPackageRuleset(cls, data):
+    get = data.get
+    return cls(
+        'ruleset',
+        (None if (_v0 := get('_id')) is None else _RulesetID(RulesetID, _v0)),
+        (None if (_v0 := get('assets')) is None else {_k0: (None if _d0 is None else _AssetCollection(AssetCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('authors')) is None else [(None if _d0 is None else _AuthorInfo(AuthorInfo, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('datasworn_version')) is None else (_RulesPackageRulesetDataswornVersion.get(_v0) or RulesPackageRulesetDataswornVersion(_v0))),
+        get('date'),
+        (None if (_v0 := get('license')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('moves')) is None else {_k0: (None if _d0 is None else _MoveCategory(MoveCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _OracleTablesCollection(OracleTablesCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rules')) is None else _Rules(Rules, _v0)),
+        (None if (_v0 := get('title')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('atlas')) is None else {_k0: (None if _d0 is None else _AtlasCollection(AtlasCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('delve_sites')) is None else {_k0: (None if _d0 is None else _DelveSite(DelveSite, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('npcs')) is None else {_k0: (None if _d0 is None else _NpcCollection(NpcCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rarities')) is None else {_k0: (None if _d0 is None else _Rarity(Rarity, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_domains')) is None else {_k0: (None if _d0 is None else _DelveSiteDomain(DelveSiteDomain, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_themes')) is None else {_k0: (None if _d0 is None else _DelveSiteTheme(DelveSiteTheme, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('truths')) is None else {_k0: (None if _d0 is None else _Truth(Truth, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _AnyID(cls, data):
+    return cls(data)
+
+
+def _AnyIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AnyMoveID(cls, data):
+    return cls(data)
+
+
+def _AnyMoveIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AnyOracleRollableID(cls, data):
+    return cls(data)
+
+
+def _AnyOracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AnyOracleRollableRowID(cls, data):
+    return cls(data)
+
+
+def _AnyOracleRollableRowIDWildcard(cls, data):
+    return cls(data)
+
+
+def _Asset(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AssetID(AssetID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('abilities')) is None else [(None if _d0 is None else _AssetAbility(AssetAbility, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('category')) is None else _Label(Label, _v0)),
+        get('count_as_impact'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('options')) is None else {_k0: (None if _d0 is None else _AssetOptionField(AssetOptionField, _d0)) for _k0, _d0 in _v0.items()}),
+        get('shared'),
+        (None if (_v0 := get('type')) is None else (_AssetType.get(_v0) or AssetType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('attachments')) is None else _AssetAttachment(AssetAttachment, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('controls')) is None else {_k0: (None if _d0 is None else _AssetControlField(AssetControlField, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('requirement')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _AssetAbility(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AssetAbilityID(AssetAbilityID, _v0)),
+        get('enabled'),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('controls')) is None else {_k0: (None if _d0 is None else _AssetAbilityControlField(AssetAbilityControlField, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('enhance_asset')) is None else _AssetEnhancement(AssetEnhancement, _v0)),
+        (None if (_v0 := get('enhance_moves')) is None else [(None if _d0 is None else _MoveEnhancement(MoveEnhancement, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('moves')) is None else {_k0: (None if _d0 is None else _EmbeddedMove(EmbeddedMove, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('options')) is None else {_k0: (None if _d0 is None else _AssetAbilityOptionField(AssetAbilityOptionField, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _AssetAbilityControlField(cls, data):
+    variant, from_json = _AssetAbilityControlField_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetAbilityControlFieldCheckbox(cls, data):
+    get = data.get
+    return cls(
+        'checkbox',
+        get('disables_asset'),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetAbilityControlFieldClock(cls, data):
+    get = data.get
+    return cls(
+        'clock',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetAbilityControlFieldCounter(cls, data):
+    get = data.get
+    return cls(
+        'counter',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetAbilityControlFieldText(cls, data):
+    get = data.get
+    return cls(
+        'text',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetAbilityID(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityMoveID(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityMoveIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityOptionField(cls, data):
+    variant, from_json = _AssetAbilityOptionField_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetAbilityOptionFieldText(cls, data):
+    get = data.get
+    return cls(
+        'text',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetAbilityOracleRollableID(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityOracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityOracleRollableRowID(cls, data):
+    return cls(data)
+
+
+def _AssetAbilityOracleRollableRowIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetAttachment(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        get('max'),
+    )
+
+
+def _AssetCardFlipField(cls, data):
+    get = data.get
+    return cls(
+        get('disables_asset'),
+        (None if (_v0 := get('field_type')) is None else (_AssetCardFlipFieldFieldType.get(_v0) or AssetCardFlipFieldFieldType(_v0))),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetCheckboxField(cls, data):
+    get = data.get
+    return cls(
+        get('disables_asset'),
+        (None if (_v0 := get('field_type')) is None else (_AssetCheckboxFieldFieldType.get(_v0) or AssetCheckboxFieldFieldType(_v0))),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetCollection(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AssetCollectionID(AssetCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _AssetCollection(AssetCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _Asset(Asset, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_AssetCollectionType.get(_v0) or AssetCollectionType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AssetCollectionIDWildcard(AssetCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _AssetCollectionIDWildcard(AssetCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _AssetCollectionID(cls, data):
+    return cls(data)
+
+
+def _AssetCollectionIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetConditionMeterMoves(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('recover')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suffer')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+    )
+
+
+def _AssetConditionMeter(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('controls')) is None else {_k0: (None if _d0 is None else _AssetConditionMeterControlField(AssetConditionMeterControlField, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('field_type')) is None else (_AssetConditionMeterFieldType.get(_v0) or AssetConditionMeterFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('moves')) is None else _AssetConditionMeterMoves(AssetConditionMeterMoves, _v0)),
+    )
+
+
+def _AssetConditionMeterControlField(cls, data):
+    variant, from_json = _AssetConditionMeterControlField_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetConditionMeterControlFieldCardFlip(cls, data):
+    get = data.get
+    return cls(
+        'card_flip',
+        get('disables_asset'),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetConditionMeterControlFieldCheckbox(cls, data):
+    get = data.get
+    return cls(
+        'checkbox',
+        get('disables_asset'),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetConditionMeterEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('field_type')) is None else (_AssetConditionMeterEnhancementFieldType.get(_v0) or AssetConditionMeterEnhancementFieldType(_v0))),
+        get('max'),
+    )
+
+
+def _AssetControlField(cls, data):
+    variant, from_json = _AssetControlField_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetControlFieldCardFlip(cls, data):
+    get = data.get
+    return cls(
+        'card_flip',
+        get('disables_asset'),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetControlFieldCheckbox(cls, data):
+    get = data.get
+    return cls(
+        'checkbox',
+        get('disables_asset'),
+        get('is_impact'),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetControlFieldConditionMeterMoves(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('recover')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suffer')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+    )
+
+
+def _AssetControlFieldConditionMeter(cls, data):
+    get = data.get
+    return cls(
+        'condition_meter',
+        (None if (_v0 := get('controls')) is None else {_k0: (None if _d0 is None else _AssetConditionMeterControlField(AssetConditionMeterControlField, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('moves')) is None else _AssetControlFieldConditionMeterMoves(AssetControlFieldConditionMeterMoves, _v0)),
+    )
+
+
+def _AssetControlFieldSelectEnhancementChoice(cls, data):
+    variant, from_json = _AssetControlFieldSelectEnhancementChoice_variants[data['choice_type']]
+    return from_json(variant, data)
+
+
+def _AssetControlFieldSelectEnhancementChoiceChoice(cls, data):
+    get = data.get
+    return cls(
+        'choice',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('enhance_asset')) is None else _AssetEnhancement(AssetEnhancement, _v0)),
+        (None if (_v0 := get('enhance_moves')) is None else [(None if _d0 is None else _MoveEnhancement(MoveEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _AssetControlFieldSelectEnhancementChoiceChoiceGroup(cls, data):
+    get = data.get
+    return cls(
+        'choice_group',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectEnhancementFieldChoice(SelectEnhancementFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+    )
+
+
+def _AssetControlFieldSelectEnhancement(cls, data):
+    get = data.get
+    return cls(
+        'select_enhancement',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _AssetControlFieldSelectEnhancementChoice(AssetControlFieldSelectEnhancementChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('value')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetControlFieldEnhancement(cls, data):
+    variant, from_json = _AssetControlFieldEnhancement_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetControlFieldEnhancementConditionMeter(cls, data):
+    get = data.get
+    return cls(
+        'condition_meter',
+        get('max'),
+    )
+
+
+def _AssetControlValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_AssetControlValueRefUsing.get(_v0) or AssetControlValueRefUsing(_v0))),
+    )
+
+
+def _AssetEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('attachments')) is None else _AssetAttachment(AssetAttachment, _v0)),
+        (None if (_v0 := get('controls')) is None else {_k0: (None if _d0 is None else _AssetControlFieldEnhancement(AssetControlFieldEnhancement, _d0)) for _k0, _d0 in _v0.items()}),
+        get('count_as_impact'),
+        get('shared'),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+    )
+
+
+def _AssetID(cls, data):
+    return cls(data)
+
+
+def _AssetIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AssetOptionField(cls, data):
+    variant, from_json = _AssetOptionField_variants[data['field_type']]
+    return from_json(variant, data)
+
+
+def _AssetOptionFieldSelectEnhancementChoice(cls, data):
+    variant, from_json = _AssetOptionFieldSelectEnhancementChoice_variants[data['choice_type']]
+    return from_json(variant, data)
+
+
+def _AssetOptionFieldSelectEnhancementChoiceChoice(cls, data):
+    get = data.get
+    return cls(
+        'choice',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('enhance_asset')) is None else _AssetEnhancement(AssetEnhancement, _v0)),
+        (None if (_v0 := get('enhance_moves')) is None else [(None if _d0 is None else _MoveEnhancement(MoveEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _AssetOptionFieldSelectEnhancementChoiceChoiceGroup(cls, data):
+    get = data.get
+    return cls(
+        'choice_group',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectEnhancementFieldChoice(SelectEnhancementFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+    )
+
+
+def _AssetOptionFieldSelectEnhancement(cls, data):
+    get = data.get
+    return cls(
+        'select_enhancement',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _AssetOptionFieldSelectEnhancementChoice(AssetOptionFieldSelectEnhancementChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('value')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetOptionFieldSelectValue(cls, data):
+    get = data.get
+    return cls(
+        'select_value',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectValueFieldChoice(SelectValueFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('value')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetOptionFieldText(cls, data):
+    get = data.get
+    return cls(
+        'text',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _AssetOptionValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_AssetOptionValueRefUsing.get(_v0) or AssetOptionValueRefUsing(_v0))),
+    )
+
+
+def _AtlasCollection(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AtlasCollectionID(AtlasCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _AtlasCollection(AtlasCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _AtlasEntry(AtlasEntry, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_AtlasCollectionType.get(_v0) or AtlasCollectionType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AtlasCollectionIDWildcard(AtlasCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _AtlasCollectionIDWildcard(AtlasCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _AtlasCollectionID(cls, data):
+    return cls(data)
+
+
+def _AtlasCollectionIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AtlasEntry(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AtlasEntryID(AtlasEntryID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('features')) is None else [(None if _d0 is None else _MarkdownString(MarkdownString, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_AtlasEntryType.get(_v0) or AtlasEntryType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('quest_starter')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _AtlasEntryIDWildcard(AtlasEntryIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('your_truth')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _AtlasEntryID(cls, data):
+    return cls(data)
+
+
+def _AtlasEntryIDWildcard(cls, data):
+    return cls(data)
+
+
+def _AttachedAssetControlValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_AttachedAssetControlValueRefUsing.get(_v0) or AttachedAssetControlValueRefUsing(_v0))),
+    )
+
+
+def _AttachedAssetOptionValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_AttachedAssetOptionValueRefUsing.get(_v0) or AttachedAssetOptionValueRefUsing(_v0))),
+    )
+
+
+def _AuthorInfo(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('email')) is None else _Email(Email, _v0)),
+        (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+    )
+
+
+def _ChallengeRank(cls, data):
+    return cls(data)
+
+
+def _ClockField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('field_type')) is None else (_ClockFieldFieldType.get(_v0) or ClockFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _ConditionMeterField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('field_type')) is None else (_ConditionMeterFieldFieldType.get(_v0) or ConditionMeterFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _ConditionMeterKey(cls, data):
+    return cls((None if data is None else _DictKey(DictKey, data)))
+
+
+def _ConditionMeterRule(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('shared'),
+        get('value'),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _ConditionMeterValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('condition_meter')) is None else _ConditionMeterKey(ConditionMeterKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_ConditionMeterValueRefUsing.get(_v0) or ConditionMeterValueRefUsing(_v0))),
+    )
+
+
+def _CoreTags(cls, data):
+    get = data.get
+    return cls(
+        get('requires_allies'),
+        get('supernatural'),
+        get('technological'),
+    )
+
+
+def _CounterField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('field_type')) is None else (_CounterFieldFieldType.get(_v0) or CounterFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('max'),
+        get('min'),
+        get('rollable'),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _CSSColor(cls, data):
+    key = data
+    obj = _CSSColor_interned.get(key)
+    if obj is None:
+        obj = _CSSColor_interned[key] = cls(data)
+    return obj
+
+
+def _CustomValue(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('using')) is None else (_CustomValueUsing.get(_v0) or CustomValueUsing(_v0))),
+        get('value'),
+    )
+
+
+def _DelveSite(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteID(DelveSiteID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('denizens')) is None else [(None if _d0 is None else _DelveSiteDenizen(DelveSiteDenizen, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('domain')) is None else _DelveSiteDomainID(DelveSiteDomainID, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rank')) is None else _ChallengeRank(ChallengeRank, _v0)),
+        (None if (_v0 := get('theme')) is None else _DelveSiteThemeID(DelveSiteThemeID, _v0)),
+        (None if (_v0 := get('type')) is None else (_DelveSiteType.get(_v0) or DelveSiteType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        get('extra_card'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('region')) is None else _AtlasEntryID(AtlasEntryID, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _DelveSiteIDWildcard(DelveSiteIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _DelveSiteDenizen(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteDenizenID(DelveSiteDenizenID, _v0)),
+        (None if (_v0 := get('frequency')) is None else (_DelveSiteDenizenFrequency.get(_v0) or DelveSiteDenizenFrequency(_v0))),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('npc')) is None else _NpcID(NpcID, _v0)),
+    )
+
+
+def _DelveSiteDenizenID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDenizenIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomain(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteDomainID(DelveSiteDomainID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('dangers')) is None else [(None if _d0 is None else _DelveSiteDomainDanger(DelveSiteDomainDanger, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('features')) is None else [(None if _d0 is None else _DelveSiteDomainFeature(DelveSiteDomainFeature, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('type')) is None else (_DelveSiteDomainType.get(_v0) or DelveSiteDomainType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('descriptipn')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('name_oracle')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _DelveSiteDomainIDWildcard(DelveSiteDomainIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _DelveSiteDomainDanger(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteDomainDangerID(DelveSiteDomainDangerID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _DelveSiteDomainDangerID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomainDangerIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomainFeature(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteDomainFeatureID(DelveSiteDomainFeatureID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _DelveSiteDomainFeatureID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomainFeatureIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomainID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteDomainIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteTheme(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteThemeID(DelveSiteThemeID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('dangers')) is None else [(None if _d0 is None else _DelveSiteThemeDanger(DelveSiteThemeDanger, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('features')) is None else [(None if _d0 is None else _DelveSiteThemeFeature(DelveSiteThemeFeature, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('type')) is None else (_DelveSiteThemeType.get(_v0) or DelveSiteThemeType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('descriptipn')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _DelveSiteThemeIDWildcard(DelveSiteThemeIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _DelveSiteThemeDanger(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteThemeDangerID(DelveSiteThemeDangerID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _DelveSiteThemeDangerID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteThemeDangerIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteThemeFeature(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _DelveSiteThemeFeatureID(DelveSiteThemeFeatureID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _DelveSiteThemeFeatureID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteThemeFeatureIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DelveSiteThemeID(cls, data):
+    return cls(data)
+
+
+def _DelveSiteThemeIDWildcard(cls, data):
+    return cls(data)
+
+
+def _DiceExpression(cls, data):
+    key = data
+    obj = _DiceExpression_interned.get(key)
+    if obj is None:
+        obj = _DiceExpression_interned[key] = cls(data)
+    return obj
+
+
+def _DiceRange(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _DictKey(cls, data):
+    return cls(data)
+
+
+def _Documentation(cls, data):
+    return cls(data)
+
+
+def _Email(cls, data):
+    return cls(data)
+
+
+def _EmbeddedActionRollMove(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_EmbeddedActionRollMoveRollType.get(_v0) or EmbeddedActionRollMoveRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRoll(TriggerActionRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedActionRollMoveType.get(_v0) or EmbeddedActionRollMoveType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedMove(cls, data):
+    variant, from_json = _EmbeddedMove_variants[data['roll_type']]
+    return from_json(variant, data)
+
+
+def _EmbeddedMoveActionRoll(cls, data):
+    get = data.get
+    return cls(
+        'action_roll',
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRoll(TriggerActionRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedMoveActionRollType.get(_v0) or EmbeddedMoveActionRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedMoveNoRoll(cls, data):
+    get = data.get
+    return cls(
+        'no_roll',
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRoll(TriggerNoRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedMoveNoRollType.get(_v0) or EmbeddedMoveNoRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedMoveProgressRoll(cls, data):
+    get = data.get
+    return cls(
+        'progress_roll',
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tracks')) is None else _ProgressTrackTypeInfo(ProgressTrackTypeInfo, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRoll(TriggerProgressRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedMoveProgressRollType.get(_v0) or EmbeddedMoveProgressRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedMoveSpecialTrack(cls, data):
+    get = data.get
+    return cls(
+        'special_track',
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrack(TriggerSpecialTrack, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedMoveSpecialTrackType.get(_v0) or EmbeddedMoveSpecialTrackType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedMoveID(cls, data):
+    return cls(data)
+
+
+def _EmbeddedMoveIDWildcard(cls, data):
+    return cls(data)
+
+
+def _EmbeddedNoRollMove(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_EmbeddedNoRollMoveRollType.get(_v0) or EmbeddedNoRollMoveRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRoll(TriggerNoRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedNoRollMoveType.get(_v0) or EmbeddedNoRollMoveType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleColumnTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleColumnText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleColumnTextOracleType.get(_v0) or EmbeddedOracleColumnTextOracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleColumnTextType.get(_v0) or EmbeddedOracleColumnTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleColumnTextRecommendedRolls(EmbeddedOracleColumnTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleColumnText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleColumnText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleColumnText2OracleType.get(_v0) or EmbeddedOracleColumnText2OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleColumnText2Type.get(_v0) or EmbeddedOracleColumnText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleColumnText2RecommendedRolls(EmbeddedOracleColumnText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleColumnText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleColumnText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleColumnText3OracleType.get(_v0) or EmbeddedOracleColumnText3OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleColumnText3Type.get(_v0) or EmbeddedOracleColumnText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleColumnText3RecommendedRolls(EmbeddedOracleColumnText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollable(cls, data):
+    variant, from_json = _EmbeddedOracleRollable_variants[data['oracle_type']]
+    return from_json(variant, data)
+
+
+def _EmbeddedOracleRollableColumnTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableColumnText(cls, data):
+    get = data.get
+    return cls(
+        'column_text',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableColumnTextType.get(_v0) or EmbeddedOracleRollableColumnTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableColumnTextRecommendedRolls(EmbeddedOracleRollableColumnTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableColumnText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableColumnText2(cls, data):
+    get = data.get
+    return cls(
+        'column_text2',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableColumnText2Type.get(_v0) or EmbeddedOracleRollableColumnText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableColumnText2RecommendedRolls(EmbeddedOracleRollableColumnText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableColumnText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableColumnText3(cls, data):
+    get = data.get
+    return cls(
+        'column_text3',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableColumnText3Type.get(_v0) or EmbeddedOracleRollableColumnText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableColumnText3RecommendedRolls(EmbeddedOracleRollableColumnText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableTableText(cls, data):
+    get = data.get
+    return cls(
+        'table_text',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleRollableTableTextColumnLabels(EmbeddedOracleRollableTableTextColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableTableTextType.get(_v0) or EmbeddedOracleRollableTableTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableTableTextRecommendedRolls(EmbeddedOracleRollableTableTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableTableText2(cls, data):
+    get = data.get
+    return cls(
+        'table_text2',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleRollableTableText2ColumnLabels(EmbeddedOracleRollableTableText2ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableTableText2Type.get(_v0) or EmbeddedOracleRollableTableText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableTableText2RecommendedRolls(EmbeddedOracleRollableTableText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableTableText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleRollableTableText3(cls, data):
+    get = data.get
+    return cls(
+        'table_text3',
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleRollableTableText3ColumnLabels(EmbeddedOracleRollableTableText3ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleRollableTableText3Type.get(_v0) or EmbeddedOracleRollableTableText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleRollableTableText3RecommendedRolls(EmbeddedOracleRollableTableText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleRollableID(cls, data):
+    return cls(data)
+
+
+def _EmbeddedOracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _EmbeddedOracleTableTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleTableTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleTableText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleTableTextColumnLabels(EmbeddedOracleTableTextColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleTableTextOracleType.get(_v0) or EmbeddedOracleTableTextOracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleTableTextType.get(_v0) or EmbeddedOracleTableTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleTableTextRecommendedRolls(EmbeddedOracleTableTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleTableText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleTableText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleTableText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleTableText2ColumnLabels(EmbeddedOracleTableText2ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleTableText2OracleType.get(_v0) or EmbeddedOracleTableText2OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleTableText2Type.get(_v0) or EmbeddedOracleTableText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleTableText2RecommendedRolls(EmbeddedOracleTableText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedOracleTableText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _EmbeddedOracleTableText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _EmbeddedOracleTableText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedOracleRollableID(EmbeddedOracleRollableID, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _EmbeddedOracleTableText3ColumnLabels(EmbeddedOracleTableText3ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_EmbeddedOracleTableText3OracleType.get(_v0) or EmbeddedOracleTableText3OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_EmbeddedOracleTableText3Type.get(_v0) or EmbeddedOracleTableText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _EmbeddedOracleTableText3RecommendedRolls(EmbeddedOracleTableText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedProgressRollMove(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_EmbeddedProgressRollMoveRollType.get(_v0) or EmbeddedProgressRollMoveRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tracks')) is None else _ProgressTrackTypeInfo(ProgressTrackTypeInfo, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRoll(TriggerProgressRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedProgressRollMoveType.get(_v0) or EmbeddedProgressRollMoveType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EmbeddedSpecialTrackMove(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _EmbeddedMoveID(EmbeddedMoveID, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_EmbeddedSpecialTrackMoveRollType.get(_v0) or EmbeddedSpecialTrackMoveRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrack(TriggerSpecialTrack, _v0)),
+        (None if (_v0 := get('type')) is None else (_EmbeddedSpecialTrackMoveType.get(_v0) or EmbeddedSpecialTrackMoveType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _EntityPrompt(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _Expansion(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _ExpansionID(ExpansionID, _v0)),
+        (None if (_v0 := get('assets')) is None else {_k0: (None if _d0 is None else _AssetCollection(AssetCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('authors')) is None else [(None if _d0 is None else _AuthorInfo(AuthorInfo, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('datasworn_version')) is None else (_ExpansionDataswornVersion.get(_v0) or ExpansionDataswornVersion(_v0))),
+        get('date'),
+        (None if (_v0 := get('license')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('moves')) is None else {_k0: (None if _d0 is None else _MoveCategory(MoveCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _OracleTablesCollection(OracleTablesCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('ruleset')) is None else _RulesetID(RulesetID, _v0)),
+        (None if (_v0 := get('title')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_ExpansionType.get(_v0) or ExpansionType(_v0))),
+        (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('atlas')) is None else {_k0: (None if _d0 is None else _AtlasCollection(AtlasCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('delve_sites')) is None else {_k0: (None if _d0 is None else _DelveSite(DelveSite, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('npcs')) is None else {_k0: (None if _d0 is None else _NpcCollection(NpcCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rarities')) is None else {_k0: (None if _d0 is None else _Rarity(Rarity, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rules')) is None else _RulesExpansion(RulesExpansion, _v0)),
+        (None if (_v0 := get('site_domains')) is None else {_k0: (None if _d0 is None else _DelveSiteDomain(DelveSiteDomain, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_themes')) is None else {_k0: (None if _d0 is None else _DelveSiteTheme(DelveSiteTheme, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('truths')) is None else {_k0: (None if _d0 is None else _Truth(Truth, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _ExpansionID(cls, data):
+    return cls(data)
+
+
+def _I18nHint(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('part_of_speech')) is None else (_PartOfSpeech.get(_v0) or PartOfSpeech(_v0))),
+    )
+
+
+def _I18nHintsTemplate(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _I18nHint(I18nHint, _v0)),
+        (None if (_v0 := get('text2')) is None else _I18nHint(I18nHint, _v0)),
+        (None if (_v0 := get('text3')) is None else _I18nHint(I18nHint, _v0)),
+    )
+
+
+def _I18nHints(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('template')) is None else _I18nHintsTemplate(I18nHintsTemplate, _v0)),
+        (None if (_v0 := get('text')) is None else _I18nHint(I18nHint, _v0)),
+        (None if (_v0 := get('text2')) is None else _I18nHint(I18nHint, _v0)),
+        (None if (_v0 := get('text3')) is None else _I18nHint(I18nHint, _v0)),
+    )
+
+
+def _ImpactCategory(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _ImpactRule(ImpactRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+    )
+
+
+def _ImpactRule(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('permanent'),
+        (None if (_v0 := get('prevents_recovery')) is None else [(None if _d0 is None else _ConditionMeterKey(ConditionMeterKey, _d0)) for _d0 in _v0]),
+        get('shared'),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _Label(cls, data):
+    key = data
+    obj = _Label_interned.get(key)
+    if obj is None:
+        obj = _Label_interned[key] = cls(data)
+    return obj
+
+
+def _MarkdownString(cls, data):
+    key = data
+    obj = _MarkdownString_interned.get(key)
+    if obj is None:
+        obj = _MarkdownString_interned[key] = cls(data)
+    return obj
+
+
+def _MarkdownTemplateString(cls, data):
+    return cls(data)
+
+
+def _Move(cls, data):
+    variant, from_json = _Move_variants[data['roll_type']]
+    return from_json(variant, data)
+
+
+def _MoveActionRoll0(cls, data):
+    get = data.get
+    return cls(
+        'action_roll',
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRoll(TriggerActionRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveActionRollType.get(_v0) or MoveActionRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveNoRoll0(cls, data):
+    get = data.get
+    return cls(
+        'no_roll',
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRoll(TriggerNoRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveNoRollType.get(_v0) or MoveNoRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveProgressRoll0(cls, data):
+    get = data.get
+    return cls(
+        'progress_roll',
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tracks')) is None else _ProgressTrackTypeInfo(ProgressTrackTypeInfo, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRoll(TriggerProgressRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveProgressRollType.get(_v0) or MoveProgressRollType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveSpecialTrack0(cls, data):
+    get = data.get
+    return cls(
+        'special_track',
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrack(TriggerSpecialTrack, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveSpecialTrackType.get(_v0) or MoveSpecialTrackType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveActionRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_MoveActionRollRollType.get(_v0) or MoveActionRollRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRoll(TriggerActionRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveActionRollType0.get(_v0) or MoveActionRollType0(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveActionRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('roll_type')) is None else (_MoveActionRollEnhancementRollType.get(_v0) or MoveActionRollEnhancementRollType(_v0))),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRollEnhancement(TriggerActionRollEnhancement, _v0)),
+    )
+
+
+def _MoveCategory(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _MoveCategoryID(MoveCategoryID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _MoveCategory(MoveCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _Move(Move, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveCategoryType.get(_v0) or MoveCategoryType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _MoveCategoryIDWildcard(MoveCategoryIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveCategoryIDWildcard(MoveCategoryIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveCategoryID(cls, data):
+    return cls(data)
+
+
+def _MoveCategoryIDWildcard(cls, data):
+    return cls(data)
+
+
+def _MoveEnhancement(cls, data):
+    variant, from_json = _MoveEnhancement_variants[data['roll_type']]
+    return from_json(variant, data)
+
+
+def _MoveEnhancementActionRoll(cls, data):
+    get = data.get
+    return cls(
+        'action_roll',
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('trigger')) is None else _TriggerActionRollEnhancement(TriggerActionRollEnhancement, _v0)),
+    )
+
+
+def _MoveEnhancementNoRoll(cls, data):
+    get = data.get
+    return cls(
+        'no_roll',
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRollEnhancement(TriggerNoRollEnhancement, _v0)),
+    )
+
+
+def _MoveEnhancementProgressRoll(cls, data):
+    get = data.get
+    return cls(
+        'progress_roll',
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRollEnhancement(TriggerProgressRollEnhancement, _v0)),
+    )
+
+
+def _MoveEnhancementSpecialTrack(cls, data):
+    get = data.get
+    return cls(
+        'special_track',
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrackEnhancement(TriggerSpecialTrackEnhancement, _v0)),
+    )
+
+
+def _MoveID(cls, data):
+    return cls(data)
+
+
+def _MoveIDWildcard(cls, data):
+    return cls(data)
+
+
+def _MoveNoRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_MoveNoRollRollType.get(_v0) or MoveNoRollRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRoll(TriggerNoRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveNoRollType0.get(_v0) or MoveNoRollType0(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveNoRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('roll_type')) is None else (_MoveNoRollEnhancementRollType.get(_v0) or MoveNoRollEnhancementRollType(_v0))),
+        (None if (_v0 := get('trigger')) is None else _TriggerNoRollEnhancement(TriggerNoRollEnhancement, _v0)),
+    )
+
+
+def _MoveOracleRollableID(cls, data):
+    return cls(data)
+
+
+def _MoveOracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _MoveOracleRollableRowID(cls, data):
+    return cls(data)
+
+
+def _MoveOracleRollableRowIDWildcard(cls, data):
+    return cls(data)
+
+
+def _MoveOutcome(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+    )
+
+
+def _MoveOutcomes(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('miss')) is None else _MoveOutcome(MoveOutcome, _v0)),
+        (None if (_v0 := get('strong_hit')) is None else _MoveOutcome(MoveOutcome, _v0)),
+        (None if (_v0 := get('weak_hit')) is None else _MoveOutcome(MoveOutcome, _v0)),
+    )
+
+
+def _MoveProgressRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_MoveProgressRollRollType.get(_v0) or MoveProgressRollRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tracks')) is None else _ProgressTrackTypeInfo(ProgressTrackTypeInfo, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRoll(TriggerProgressRoll, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveProgressRollType0.get(_v0) or MoveProgressRollType0(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveProgressRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('roll_type')) is None else (_MoveProgressRollEnhancementRollType.get(_v0) or MoveProgressRollEnhancementRollType(_v0))),
+        (None if (_v0 := get('trigger')) is None else _TriggerProgressRollEnhancement(TriggerProgressRollEnhancement, _v0)),
+    )
+
+
+def _MoveSpecialTrack(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _MoveID(MoveID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        get('allow_momentum_burn'),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('outcomes')) is None else _MoveOutcomes(MoveOutcomes, _v0)),
+        (None if (_v0 := get('roll_type')) is None else (_MoveSpecialTrackRollType.get(_v0) or MoveSpecialTrackRollType(_v0))),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrack(TriggerSpecialTrack, _v0)),
+        (None if (_v0 := get('type')) is None else (_MoveSpecialTrackType0.get(_v0) or MoveSpecialTrackType0(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _MoveIDWildcard(MoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _MoveSpecialTrackEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _AnyMoveIDWildcard(AnyMoveIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('roll_type')) is None else (_MoveSpecialTrackEnhancementRollType.get(_v0) or MoveSpecialTrackEnhancementRollType(_v0))),
+        (None if (_v0 := get('trigger')) is None else _TriggerSpecialTrackEnhancement(TriggerSpecialTrackEnhancement, _v0)),
+    )
+
+
+def _Npc(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _NpcID(NpcID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('drives')) is None else [(None if _d0 is None else _MarkdownString(MarkdownString, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('features')) is None else [(None if _d0 is None else _MarkdownString(MarkdownString, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('nature')) is None else _NpcNature(NpcNature, _v0)),
+        (None if (_v0 := get('rank')) is None else _ChallengeRank(ChallengeRank, _v0)),
+        (None if (_v0 := get('tactics')) is None else [(None if _d0 is None else _MarkdownString(MarkdownString, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_NpcType.get(_v0) or NpcType(_v0))),
+        (None if (_v0 := get('variants')) is None else {_k0: (None if _d0 is None else _NpcVariant(NpcVariant, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('quest_starter')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _NpcIDWildcard(NpcIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('your_truth')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _NpcCollection(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _NpcCollectionID(NpcCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _NpcCollection(NpcCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _Npc(Npc, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_NpcCollectionType.get(_v0) or NpcCollectionType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _NpcCollectionIDWildcard(NpcCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _NpcCollectionIDWildcard(NpcCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _NpcCollectionID(cls, data):
+    return cls(data)
+
+
+def _NpcCollectionIDWildcard(cls, data):
+    return cls(data)
+
+
+def _NpcID(cls, data):
+    return cls(data)
+
+
+def _NpcIDWildcard(cls, data):
+    return cls(data)
+
+
+def _NpcNature(cls, data):
+    return cls((None if data is None else _Label(Label, data)))
+
+
+def _NpcVariant(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _NpcVariantID(NpcVariantID, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('nature')) is None else _NpcNature(NpcNature, _v0)),
+        (None if (_v0 := get('rank')) is None else _ChallengeRank(ChallengeRank, _v0)),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _NpcVariantID(cls, data):
+    return cls(data)
+
+
+def _NpcVariantIDWildcard(cls, data):
+    return cls(data)
+
+
+def _OracleCollection(cls, data):
+    variant, from_json = _OracleCollection_variants[data['oracle_type']]
+    return from_json(variant, data)
+
+
+def _OracleCollectionTableSharedRollsColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedRolls(cls, data):
+    get = data.get
+    return cls(
+        'table_shared_rolls',
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleCollectionTableSharedRollsColumnLabels(OracleCollectionTableSharedRollsColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText(OracleColumnText, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_OracleCollectionTableSharedRollsType.get(_v0) or OracleCollectionTableSharedRollsType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedText(cls, data):
+    get = data.get
+    return cls(
+        'table_shared_text',
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleCollectionTableSharedTextColumnLabels(OracleCollectionTableSharedTextColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText(OracleColumnText, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_OracleCollectionTableSharedTextType.get(_v0) or OracleCollectionTableSharedTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedText2(cls, data):
+    get = data.get
+    return cls(
+        'table_shared_text2',
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleCollectionTableSharedText2ColumnLabels(OracleCollectionTableSharedText2ColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText2(OracleColumnText2, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_OracleCollectionTableSharedText2Type.get(_v0) or OracleCollectionTableSharedText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleCollectionTableSharedText3(cls, data):
+    get = data.get
+    return cls(
+        'table_shared_text3',
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleCollectionTableSharedText3ColumnLabels(OracleCollectionTableSharedText3ColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText3(OracleColumnText3, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_OracleCollectionTableSharedText3Type.get(_v0) or OracleCollectionTableSharedText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleCollectionTables(cls, data):
+    get = data.get
+    return cls(
+        'tables',
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _OracleCollection(OracleCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleRollableTable(OracleRollableTable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_OracleCollectionTablesType.get(_v0) or OracleCollectionTablesType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleCollectionID(cls, data):
+    return cls(data)
+
+
+def _OracleCollectionIDWildcard(cls, data):
+    return cls(data)
+
+
+def _OracleColumnTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleColumnText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleColumnTextOracleType.get(_v0) or OracleColumnTextOracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleColumnTextType.get(_v0) or OracleColumnTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleColumnTextRecommendedRolls(OracleColumnTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleColumnText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleColumnText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleColumnText2OracleType.get(_v0) or OracleColumnText2OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleColumnText2Type.get(_v0) or OracleColumnText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleColumnText2RecommendedRolls(OracleColumnText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleColumnText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleColumnText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleColumnText3OracleType.get(_v0) or OracleColumnText3OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleColumnText3Type.get(_v0) or OracleColumnText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleColumnText3RecommendedRolls(OracleColumnText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleMatchBehavior(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _OracleRoll(cls, data):
+    get = data.get
+    return cls(
+        get('auto'),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('duplicates')) is None else (_OracleDuplicateBehavior.get(_v0) or OracleDuplicateBehavior(_v0))),
+        get('number_of_rolls'),
+        (None if (_v0 := get('oracle')) is None else _OracleRollableID(OracleRollableID, _v0)),
+    )
+
+
+def _OracleRollTemplate(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _MarkdownTemplateString(MarkdownTemplateString, _v0)),
+        (None if (_v0 := get('text2')) is None else _MarkdownTemplateString(MarkdownTemplateString, _v0)),
+        (None if (_v0 := get('text3')) is None else _MarkdownTemplateString(MarkdownTemplateString, _v0)),
+    )
+
+
+def _OracleRollable(cls, data):
+    variant, from_json = _OracleRollable_variants[data['oracle_type']]
+    return from_json(variant, data)
+
+
+def _OracleRollableColumnTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableColumnText(cls, data):
+    get = data.get
+    return cls(
+        'column_text',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableColumnTextType.get(_v0) or OracleRollableColumnTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableColumnTextRecommendedRolls(OracleRollableColumnTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableColumnText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableColumnText2(cls, data):
+    get = data.get
+    return cls(
+        'column_text2',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableColumnText2Type.get(_v0) or OracleRollableColumnText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableColumnText2RecommendedRolls(OracleRollableColumnText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableColumnText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableColumnText3(cls, data):
+    get = data.get
+    return cls(
+        'column_text3',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableColumnText3Type.get(_v0) or OracleRollableColumnText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableColumnText3RecommendedRolls(OracleRollableColumnText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableTableTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableText(cls, data):
+    get = data.get
+    return cls(
+        'table_text',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableTextColumnLabels(OracleRollableTableTextColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableTextType.get(_v0) or OracleRollableTableTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableTextRecommendedRolls(OracleRollableTableTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableTableText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableText2(cls, data):
+    get = data.get
+    return cls(
+        'table_text2',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableText2ColumnLabels(OracleRollableTableText2ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableText2Type.get(_v0) or OracleRollableTableText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableText2RecommendedRolls(OracleRollableTableText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableTableText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableText3(cls, data):
+    get = data.get
+    return cls(
+        'table_text3',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableText3ColumnLabels(OracleRollableTableText3ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableText3Type.get(_v0) or OracleRollableTableText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableText3RecommendedRolls(OracleRollableTableText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableID(cls, data):
+    return cls(data)
+
+
+def _OracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _OracleRollableRowID(cls, data):
+    return cls(data)
+
+
+def _OracleRollableRowIDWildcard(cls, data):
+    return cls(data)
+
+
+def _OracleRollableRowText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AnyOracleRollableRowID(AnyOracleRollableRowID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _OracleRollableRowText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AnyOracleRollableRowID(AnyOracleRollableRowID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('text2')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _OracleRollableRowText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _AnyOracleRollableRowID(AnyOracleRollableRowID, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('text2')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('text3')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('_i18n')) is None else _I18nHints(I18nHints, _v0)),
+        (None if (_v0 := get('embed_table')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('oracle_rolls')) is None else [(None if _d0 is None else _OracleRoll(OracleRoll, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('template')) is None else _OracleRollTemplate(OracleRollTemplate, _v0)),
+    )
+
+
+def _OracleRollableTable(cls, data):
+    variant, from_json = _OracleRollableTable_variants[data['oracle_type']]
+    return from_json(variant, data)
+
+
+def _OracleRollableTableTableTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableTableTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableTableText(cls, data):
+    get = data.get
+    return cls(
+        'table_text',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableTableTextColumnLabels(OracleRollableTableTableTextColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableTableTextType.get(_v0) or OracleRollableTableTableTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableTableTextRecommendedRolls(OracleRollableTableTableTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableTableTableText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableTableText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableTableText2(cls, data):
+    get = data.get
+    return cls(
+        'table_text2',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableTableText2ColumnLabels(OracleRollableTableTableText2ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableTableText2Type.get(_v0) or OracleRollableTableTableText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableTableText2RecommendedRolls(OracleRollableTableTableText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleRollableTableTableText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleRollableTableTableText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleRollableTableTableText3(cls, data):
+    get = data.get
+    return cls(
+        'table_text3',
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleRollableTableTableText3ColumnLabels(OracleRollableTableTableText3ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleRollableTableTableText3Type.get(_v0) or OracleRollableTableTableText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleRollableTableTableText3RecommendedRolls(OracleRollableTableTableText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableSharedRollsColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableSharedRolls(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableSharedRollsColumnLabels(OracleTableSharedRollsColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText(OracleColumnText, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableSharedRollsOracleType.get(_v0) or OracleTableSharedRollsOracleType(_v0))),
+        (None if (_v0 := get('type')) is None else (_OracleTableSharedRollsType.get(_v0) or OracleTableSharedRollsType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableSharedTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableSharedText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableSharedTextColumnLabels(OracleTableSharedTextColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText(OracleColumnText, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableSharedTextOracleType.get(_v0) or OracleTableSharedTextOracleType(_v0))),
+        (None if (_v0 := get('type')) is None else (_OracleTableSharedTextType.get(_v0) or OracleTableSharedTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableSharedText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableSharedText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableSharedText2ColumnLabels(OracleTableSharedText2ColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText2(OracleColumnText2, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableSharedText2OracleType.get(_v0) or OracleTableSharedText2OracleType(_v0))),
+        (None if (_v0 := get('type')) is None else (_OracleTableSharedText2Type.get(_v0) or OracleTableSharedText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableSharedText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableSharedText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableSharedText3ColumnLabels(OracleTableSharedText3ColumnLabels, _v0)),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleColumnText3(OracleColumnText3, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableSharedText3OracleType.get(_v0) or OracleTableSharedText3OracleType(_v0))),
+        (None if (_v0 := get('type')) is None else (_OracleTableSharedText3Type.get(_v0) or OracleTableSharedText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableTextColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableTextRecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleTableText(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableTextColumnLabels(OracleTableTextColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableTextOracleType.get(_v0) or OracleTableTextOracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText(OracleRollableRowText, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleTableTextType.get(_v0) or OracleTableTextType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleTableTextRecommendedRolls(OracleTableTextRecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableText2ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableText2RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleTableText2(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableText2ColumnLabels(OracleTableText2ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableText2OracleType.get(_v0) or OracleTableText2OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText2(OracleRollableRowText2, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleTableText2Type.get(_v0) or OracleTableText2Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleTableText2RecommendedRolls(OracleTableText2RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTableText3ColumnLabels(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('roll')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text2')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('text3')) is None else _Label(Label, _v0)),
+    )
+
+
+def _OracleTableText3RecommendedRolls(cls, data):
+    get = data.get
+    return cls(
+        get('max'),
+        get('min'),
+    )
+
+
+def _OracleTableText3(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleRollableID(OracleRollableID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('column_labels')) is None else _OracleTableText3ColumnLabels(OracleTableText3ColumnLabels, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTableText3OracleType.get(_v0) or OracleTableText3OracleType(_v0))),
+        (None if (_v0 := get('rows')) is None else [(None if _d0 is None else _OracleRollableRowText3(OracleRollableRowText3, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_OracleTableText3Type.get(_v0) or OracleTableText3Type(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('match')) is None else _OracleMatchBehavior(OracleMatchBehavior, _v0)),
+        (None if (_v0 := get('recommended_rolls')) is None else _OracleTableText3RecommendedRolls(OracleTableText3RecommendedRolls, _v0)),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleRollableIDWildcard(OracleRollableIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _OracleTablesCollection(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _OracleCollectionID(OracleCollectionID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('collections')) is None else {_k0: (None if _d0 is None else _OracleCollection(OracleCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('contents')) is None else {_k0: (None if _d0 is None else _OracleRollableTable(OracleRollableTable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('oracle_type')) is None else (_OracleTablesCollectionOracleType.get(_v0) or OracleTablesCollectionOracleType(_v0))),
+        (None if (_v0 := get('type')) is None else (_OracleTablesCollectionType.get(_v0) or OracleTablesCollectionType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('enhances')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _OracleCollectionIDWildcard(OracleCollectionIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _PageNumber(cls, data):
+    return cls(data)
+
+
+def _ProgressRollOption(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('using')) is None else (_ProgressRollOptionUsing.get(_v0) or ProgressRollOptionUsing(_v0))),
+    )
+
+
+def _ProgressTrackTypeInfo(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('category')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('controls')) is None else dict(_v0)),
+    )
+
+
+def _Rarity(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _RarityID(RarityID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('asset')) is None else _AssetID(AssetID, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_RarityType.get(_v0) or RarityType(_v0))),
+        get('xp_cost'),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _RarityIDWildcard(RarityIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _RarityID(cls, data):
+    return cls(data)
+
+
+def _RarityIDWildcard(cls, data):
+    return cls(data)
+
+
+def _RollableValue(cls, data):
+    variant, from_json = _RollableValue_variants[data['using']]
+    return from_json(variant, data)
+
+
+def _RollableValueAssetControl(cls, data):
+    get = data.get
+    return cls(
+        'asset_control',
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _RollableValueAssetOption(cls, data):
+    get = data.get
+    return cls(
+        'asset_option',
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _RollableValueAttachedAssetControl(cls, data):
+    get = data.get
+    return cls(
+        'attached_asset_control',
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _RollableValueAttachedAssetOption(cls, data):
+    get = data.get
+    return cls(
+        'attached_asset_option',
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _RollableValueConditionMeter(cls, data):
+    get = data.get
+    return cls(
+        'condition_meter',
+        (None if (_v0 := get('condition_meter')) is None else _ConditionMeterKey(ConditionMeterKey, _v0)),
+    )
+
+
+def _RollableValueCustom(cls, data):
+    get = data.get
+    return cls(
+        'custom',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+    )
+
+
+def _RollableValueStat(cls, data):
+    get = data.get
+    return cls(
+        'stat',
+        (None if (_v0 := get('stat')) is None else _StatKey(StatKey, _v0)),
+    )
+
+
+def _Rules(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('condition_meters')) is None else {_k0: (None if _d0 is None else _ConditionMeterRule(ConditionMeterRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('impacts')) is None else {_k0: (None if _d0 is None else _ImpactCategory(ImpactCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('special_tracks')) is None else {_k0: (None if _d0 is None else _SpecialTrackRule(SpecialTrackRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('stats')) is None else {_k0: (None if _d0 is None else _StatRule(StatRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('tags')) is None else {_k0: (None if _d0 is None else _TagRule(TagRule, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _RulesExpansion(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('condition_meters')) is None else {_k0: (None if _d0 is None else _ConditionMeterRule(ConditionMeterRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('impacts')) is None else {_k0: (None if _d0 is None else _ImpactCategory(ImpactCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('special_tracks')) is None else {_k0: (None if _d0 is None else _SpecialTrackRule(SpecialTrackRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('stats')) is None else {_k0: (None if _d0 is None else _StatRule(StatRule, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('tags')) is None else {_k0: (None if _d0 is None else _TagRule(TagRule, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _RulesPackageID(cls, data):
+    return cls(data)
+
+
+def _Ruleset(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _RulesetID(RulesetID, _v0)),
+        (None if (_v0 := get('assets')) is None else {_k0: (None if _d0 is None else _AssetCollection(AssetCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('authors')) is None else [(None if _d0 is None else _AuthorInfo(AuthorInfo, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('datasworn_version')) is None else (_RulesetDataswornVersion.get(_v0) or RulesetDataswornVersion(_v0))),
+        get('date'),
+        (None if (_v0 := get('license')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('moves')) is None else {_k0: (None if _d0 is None else _MoveCategory(MoveCategory, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _OracleTablesCollection(OracleTablesCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rules')) is None else _Rules(Rules, _v0)),
+        (None if (_v0 := get('title')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('type')) is None else (_RulesetType.get(_v0) or RulesetType(_v0))),
+        (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+        (None if (_v0 := get('atlas')) is None else {_k0: (None if _d0 is None else _AtlasCollection(AtlasCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('delve_sites')) is None else {_k0: (None if _d0 is None else _DelveSite(DelveSite, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('npcs')) is None else {_k0: (None if _d0 is None else _NpcCollection(NpcCollection, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('rarities')) is None else {_k0: (None if _d0 is None else _Rarity(Rarity, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_domains')) is None else {_k0: (None if _d0 is None else _DelveSiteDomain(DelveSiteDomain, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('site_themes')) is None else {_k0: (None if _d0 is None else _DelveSiteTheme(DelveSiteTheme, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('truths')) is None else {_k0: (None if _d0 is None else _Truth(Truth, _d0)) for _k0, _d0 in _v0.items()}),
+    )
+
+
+def _RulesetID(cls, data):
+    return cls(data)
+
+
+def _SelectEnhancementFieldChoice0(cls, data):
+    variant, from_json = _SelectEnhancementFieldChoice0_variants[data['choice_type']]
+    return from_json(variant, data)
+
+
+def _SelectEnhancementFieldChoiceChoice(cls, data):
+    get = data.get
+    return cls(
+        'choice',
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('enhance_asset')) is None else _AssetEnhancement(AssetEnhancement, _v0)),
+        (None if (_v0 := get('enhance_moves')) is None else [(None if _d0 is None else _MoveEnhancement(MoveEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _SelectEnhancementFieldChoiceChoiceGroup(cls, data):
+    get = data.get
+    return cls(
+        'choice_group',
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectEnhancementFieldChoice(SelectEnhancementFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+    )
+
+
+def _SelectEnhancementField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectEnhancementFieldChoice0(SelectEnhancementFieldChoice0, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('field_type')) is None else (_SelectEnhancementFieldFieldType.get(_v0) or SelectEnhancementFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('value')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _SelectEnhancementFieldChoice(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('choice_type')) is None else (_SelectEnhancementFieldChoiceChoiceType.get(_v0) or SelectEnhancementFieldChoiceChoiceType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('enhance_asset')) is None else _AssetEnhancement(AssetEnhancement, _v0)),
+        (None if (_v0 := get('enhance_moves')) is None else [(None if _d0 is None else _MoveEnhancement(MoveEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _SelectEnhancementFieldChoiceGroup(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('choice_type')) is None else (_SelectEnhancementFieldChoiceGroupChoiceType.get(_v0) or SelectEnhancementFieldChoiceGroupChoiceType(_v0))),
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectEnhancementFieldChoice(SelectEnhancementFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+    )
+
+
+def _SelectValueField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('choices')) is None else {_k0: (None if _d0 is None else _SelectValueFieldChoice(SelectValueFieldChoice, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('field_type')) is None else (_SelectValueFieldFieldType.get(_v0) or SelectValueFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('value')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _SelectValueFieldChoice(cls, data):
+    variant, from_json = _SelectValueFieldChoice_variants[data['using']]
+    return from_json(variant, data)
+
+
+def _SelectValueFieldChoiceAssetControl(cls, data):
+    get = data.get
+    return cls(
+        'asset_control',
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceAssetControlChoiceType.get(_v0) or SelectValueFieldChoiceAssetControlChoiceType(_v0))),
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+    )
+
+
+def _SelectValueFieldChoiceAssetOption(cls, data):
+    get = data.get
+    return cls(
+        'asset_option',
+        (None if (_v0 := get('assets')) is None else [(None if _d0 is None else _AssetIDWildcard(AssetIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceAssetOptionChoiceType.get(_v0) or SelectValueFieldChoiceAssetOptionChoiceType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _SelectValueFieldChoiceAttachedAssetControl(cls, data):
+    get = data.get
+    return cls(
+        'attached_asset_control',
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceAttachedAssetControlChoiceType.get(_v0) or SelectValueFieldChoiceAttachedAssetControlChoiceType(_v0))),
+        (None if (_v0 := get('control')) is None else _DictKey(DictKey, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+    )
+
+
+def _SelectValueFieldChoiceAttachedAssetOption(cls, data):
+    get = data.get
+    return cls(
+        'attached_asset_option',
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceAttachedAssetOptionChoiceType.get(_v0) or SelectValueFieldChoiceAttachedAssetOptionChoiceType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('option')) is None else _DictKey(DictKey, _v0)),
+    )
+
+
+def _SelectValueFieldChoiceConditionMeter(cls, data):
+    get = data.get
+    return cls(
+        'condition_meter',
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceConditionMeterChoiceType.get(_v0) or SelectValueFieldChoiceConditionMeterChoiceType(_v0))),
+        (None if (_v0 := get('condition_meter')) is None else _ConditionMeterKey(ConditionMeterKey, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+    )
+
+
+def _SelectValueFieldChoiceCustom(cls, data):
+    get = data.get
+    return cls(
+        'custom',
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceCustomChoiceType.get(_v0) or SelectValueFieldChoiceCustomChoiceType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+    )
+
+
+def _SelectValueFieldChoiceStat(cls, data):
+    get = data.get
+    return cls(
+        'stat',
+        (None if (_v0 := get('choice_type')) is None else (_SelectValueFieldChoiceStatChoiceType.get(_v0) or SelectValueFieldChoiceStatChoiceType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('stat')) is None else _StatKey(StatKey, _v0)),
+    )
+
+
+def _SemanticVersion(cls, data):
+    return cls(data)
+
+
+def _SourceInfo(cls, data):
+    key = _freeze(data)
+    obj = _SourceInfo_interned.get(key)
+    if obj is None:
+        get = data.get
+        obj = _SourceInfo_interned[key] = cls(
+            (None if (_v0 := get('authors')) is None else [(None if _d0 is None else _AuthorInfo(AuthorInfo, _d0)) for _d0 in _v0]),
+            get('date'),
+            (None if (_v0 := get('license')) is None else _WebURL(WebURL, _v0)),
+            (None if (_v0 := get('title')) is None else _Label(Label, _v0)),
+            (None if (_v0 := get('url')) is None else _WebURL(WebURL, _v0)),
+            (None if (_v0 := get('page')) is None else _PageNumber(PageNumber, _v0)),
+        )
+    return obj
+
+
+def _SpecialTrackRule(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('optional'),
+        get('shared'),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _SpecialTrackType(cls, data):
+    return cls((None if data is None else _DictKey(DictKey, data)))
+
+
+def _StatKey(cls, data):
+    return cls((None if data is None else _DictKey(DictKey, data)))
+
+
+def _StatRule(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+    )
+
+
+def _StatValueRef(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('stat')) is None else _StatKey(StatKey, _v0)),
+        (None if (_v0 := get('using')) is None else (_StatValueRefUsing.get(_v0) or StatValueRefUsing(_v0))),
+    )
+
+
+def _Suggestions(cls, data):
+    return cls((None if data is None else [(None if _d0 is None else _AnyIDWildcard(AnyIDWildcard, _d0)) for _d0 in data]))
+
+
+def _SvgImageURL(cls, data):
+    return cls(data)
+
+
+def _Tag(cls, data):
+    return cls(data)
+
+
+def _TagRule(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('$schema')) is None else _TagSchema(TagSchema, _v0)),
+        (None if (_v0 := get('node_types')) is None else [(None if _d0 is None else (_TaggableNodeType.get(_d0) or TaggableNodeType(_d0))) for _d0 in _v0]),
+    )
+
+
+def _TagSchema(cls, data):
+    return cls(data)
+
+
+def _Tags(cls, data):
+    return cls((None if data is None else {_k0: (None if _d0 is None else {_k1: (None if _d1 is None else _Tag(Tag, _d1)) for _k1, _d1 in _d0.items()}) for _k0, _d0 in data.items()}))
+
+
+def _TextField(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('field_type')) is None else (_TextFieldFieldType.get(_v0) or TextFieldFieldType(_v0))),
+        (None if (_v0 := get('label')) is None else _Label(Label, _v0)),
+        get('value'),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+    )
+
+
+def _TriggerActionRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerActionRollCondition(TriggerActionRollCondition, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerActionRollCondition(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_ActionRollMethod.get(_v0) or ActionRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _RollableValue(RollableValue, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerActionRollConditionEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_ActionRollMethod.get(_v0) or ActionRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _RollableValue(RollableValue, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerActionRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerActionRollConditionEnhancement(TriggerActionRollConditionEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _TriggerBy(cls, data):
+    get = data.get
+    return cls(
+        get('ally'),
+        get('player'),
+    )
+
+
+def _TriggerNoRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerNoRollCondition(TriggerNoRollCondition, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerNoRollCondition(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerNoRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerNoRollCondition(TriggerNoRollCondition, _d0)) for _d0 in _v0]),
+    )
+
+
+def _TriggerProgressRoll(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerProgressRollCondition(TriggerProgressRollCondition, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerProgressRollCondition(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_ProgressRollMethod.get(_v0) or ProgressRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _ProgressRollOption(ProgressRollOption, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerProgressRollConditionEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_ProgressRollMethod.get(_v0) or ProgressRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _ProgressRollOption(ProgressRollOption, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerProgressRollEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerProgressRollConditionEnhancement(TriggerProgressRollConditionEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _TriggerSpecialTrack(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerSpecialTrackCondition(TriggerSpecialTrackCondition, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerSpecialTrackCondition(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_SpecialTrackRollMethod.get(_v0) or SpecialTrackRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _TriggerSpecialTrackConditionOption(TriggerSpecialTrackConditionOption, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerSpecialTrackConditionEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('method')) is None else (_SpecialTrackRollMethod.get(_v0) or SpecialTrackRollMethod(_v0))),
+        (None if (_v0 := get('roll_options')) is None else [(None if _d0 is None else _TriggerSpecialTrackConditionOption(TriggerSpecialTrackConditionOption, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('by')) is None else _TriggerBy(TriggerBy, _v0)),
+        (None if (_v0 := get('text')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TriggerSpecialTrackConditionOption(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('using')) is None else _SpecialTrackType(SpecialTrackType, _v0)),
+    )
+
+
+def _TriggerSpecialTrackEnhancement(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('conditions')) is None else [(None if _d0 is None else _TriggerSpecialTrackConditionEnhancement(TriggerSpecialTrackConditionEnhancement, _d0)) for _d0 in _v0]),
+    )
+
+
+def _Truth(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _TruthID(TruthID, _v0)),
+        (None if (_v0 := get('_source')) is None else _SourceInfo(SourceInfo, _v0)),
+        (None if (_v0 := get('dice')) is None else _DiceExpression(DiceExpression, _v0)),
+        (None if (_v0 := get('name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('options')) is None else [(None if _d0 is None else _TruthOption(TruthOption, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('type')) is None else (_TruthType.get(_v0) or TruthType(_v0))),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('canonical_name')) is None else _Label(Label, _v0)),
+        (None if (_v0 := get('color')) is None else _CSSColor(CSSColor, _v0)),
+        (None if (_v0 := get('factions')) is None else [(None if _d0 is None else _EntityPrompt(EntityPrompt, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('icon')) is None else _SvgImageURL(SvgImageURL, _v0)),
+        (None if (_v0 := get('images')) is None else [(None if _d0 is None else _WebpImageURL(WebpImageURL, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('replaces')) is None else [(None if _d0 is None else _TruthIDWildcard(TruthIDWildcard, _d0)) for _d0 in _v0]),
+        (None if (_v0 := get('suggestions')) is None else _Suggestions(Suggestions, _v0)),
+        (None if (_v0 := get('tags')) is None else _Tags(Tags, _v0)),
+        (None if (_v0 := get('your_character')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TruthID(cls, data):
+    return cls(data)
+
+
+def _TruthIDWildcard(cls, data):
+    return cls(data)
+
+
+def _TruthOption(cls, data):
+    get = data.get
+    return cls(
+        (None if (_v0 := get('_id')) is None else _TruthOptionID(TruthOptionID, _v0)),
+        (None if (_v0 := get('description')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('quest_starter')) is None else _MarkdownString(MarkdownString, _v0)),
+        (None if (_v0 := get('roll')) is None else _DiceRange(DiceRange, _v0)),
+        (None if (_v0 := get('_comment')) is None else _Documentation(Documentation, _v0)),
+        (None if (_v0 := get('oracles')) is None else {_k0: (None if _d0 is None else _EmbeddedOracleRollable(EmbeddedOracleRollable, _d0)) for _k0, _d0 in _v0.items()}),
+        (None if (_v0 := get('summary')) is None else _MarkdownString(MarkdownString, _v0)),
+    )
+
+
+def _TruthOptionID(cls, data):
+    return cls(data)
+
+
+def _TruthOptionIDWildcard(cls, data):
+    return cls(data)
+
+
+def _TruthOptionOracleRollableID(cls, data):
+    return cls(data)
+
+
+def _TruthOptionOracleRollableIDWildcard(cls, data):
+    return cls(data)
+
+
+def _TruthOptionOracleRollableRowID(cls, data):
+    return cls(data)
+
+
+def _TruthOptionOracleRollableRowIDWildcard(cls, data):
+    return cls(data)
+
+
+def _WebURL(cls, data):
+    return cls(data)
+
+
+def _WebpImageURL(cls, data):
+    return cls(data)
+
+
+_RulesPackage_variants = {
+    'expansion': (RulesPackageExpansion, _RulesPackageExpansion),
+    'ruleset': (RulesPackageRuleset, _RulesPackageRuleset),
+}
+_AssetAbilityControlField_variants = {
+    'checkbox': (AssetAbilityControlFieldCheckbox, _AssetAbilityControlFieldCheckbox),
+    'clock': (AssetAbilityControlFieldClock, _AssetAbilityControlFieldClock),
+    'counter': (AssetAbilityControlFieldCounter, _AssetAbilityControlFieldCounter),
+    'text': (AssetAbilityControlFieldText, _AssetAbilityControlFieldText),
+}
+_AssetAbilityOptionField_variants = {
+    'text': (AssetAbilityOptionFieldText, _AssetAbilityOptionFieldText),
+}
+_AssetConditionMeterControlField_variants = {
+    'card_flip': (AssetConditionMeterControlFieldCardFlip, _AssetConditionMeterControlFieldCardFlip),
+    'checkbox': (AssetConditionMeterControlFieldCheckbox, _AssetConditionMeterControlFieldCheckbox),
+}
+_AssetControlField_variants = {
+    'card_flip': (AssetControlFieldCardFlip, _AssetControlFieldCardFlip),
+    'checkbox': (AssetControlFieldCheckbox, _AssetControlFieldCheckbox),
+    'condition_meter': (AssetControlFieldConditionMeter, _AssetControlFieldConditionMeter),
+    'select_enhancement': (AssetControlFieldSelectEnhancement, _AssetControlFieldSelectEnhancement),
+}
+_AssetControlFieldSelectEnhancementChoice_variants = {
+    'choice': (AssetControlFieldSelectEnhancementChoiceChoice, _AssetControlFieldSelectEnhancementChoiceChoice),
+    'choice_group': (AssetControlFieldSelectEnhancementChoiceChoiceGroup, _AssetControlFieldSelectEnhancementChoiceChoiceGroup),
+}
+_AssetControlFieldEnhancement_variants = {
+    'condition_meter': (AssetControlFieldEnhancementConditionMeter, _AssetControlFieldEnhancementConditionMeter),
+}
+_AssetOptionField_variants = {
+    'select_enhancement': (AssetOptionFieldSelectEnhancement, _AssetOptionFieldSelectEnhancement),
+    'select_value': (AssetOptionFieldSelectValue, _AssetOptionFieldSelectValue),
+    'text': (AssetOptionFieldText, _AssetOptionFieldText),
+}
+_AssetOptionFieldSelectEnhancementChoice_variants = {
+    'choice': (AssetOptionFieldSelectEnhancementChoiceChoice, _AssetOptionFieldSelectEnhancementChoiceChoice),
+    'choice_group': (AssetOptionFieldSelectEnhancementChoiceChoiceGroup, _AssetOptionFieldSelectEnhancementChoiceChoiceGroup),
+}
+_EmbeddedMove_variants = {
+    'action_roll': (EmbeddedMoveActionRoll, _EmbeddedMoveActionRoll),
+    'no_roll': (EmbeddedMoveNoRoll, _EmbeddedMoveNoRoll),
+    'progress_roll': (EmbeddedMoveProgressRoll, _EmbeddedMoveProgressRoll),
+    'special_track': (EmbeddedMoveSpecialTrack, _EmbeddedMoveSpecialTrack),
+}
+_EmbeddedOracleRollable_variants = {
+    'column_text': (EmbeddedOracleRollableColumnText, _EmbeddedOracleRollableColumnText),
+    'column_text2': (EmbeddedOracleRollableColumnText2, _EmbeddedOracleRollableColumnText2),
+    'column_text3': (EmbeddedOracleRollableColumnText3, _EmbeddedOracleRollableColumnText3),
+    'table_text': (EmbeddedOracleRollableTableText, _EmbeddedOracleRollableTableText),
+    'table_text2': (EmbeddedOracleRollableTableText2, _EmbeddedOracleRollableTableText2),
+    'table_text3': (EmbeddedOracleRollableTableText3, _EmbeddedOracleRollableTableText3),
+}
+_Move_variants = {
+    'action_roll': (MoveActionRoll0, _MoveActionRoll0),
+    'no_roll': (MoveNoRoll0, _MoveNoRoll0),
+    'progress_roll': (MoveProgressRoll0, _MoveProgressRoll0),
+    'special_track': (MoveSpecialTrack0, _MoveSpecialTrack0),
+}
+_MoveEnhancement_variants = {
+    'action_roll': (MoveEnhancementActionRoll, _MoveEnhancementActionRoll),
+    'no_roll': (MoveEnhancementNoRoll, _MoveEnhancementNoRoll),
+    'progress_roll': (MoveEnhancementProgressRoll, _MoveEnhancementProgressRoll),
+    'special_track': (MoveEnhancementSpecialTrack, _MoveEnhancementSpecialTrack),
+}
+_OracleCollection_variants = {
+    'table_shared_rolls': (OracleCollectionTableSharedRolls, _OracleCollectionTableSharedRolls),
+    'table_shared_text': (OracleCollectionTableSharedText, _OracleCollectionTableSharedText),
+    'table_shared_text2': (OracleCollectionTableSharedText2, _OracleCollectionTableSharedText2),
+    'table_shared_text3': (OracleCollectionTableSharedText3, _OracleCollectionTableSharedText3),
+    'tables': (OracleCollectionTables, _OracleCollectionTables),
+}
+_OracleRollable_variants = {
+    'column_text': (OracleRollableColumnText, _OracleRollableColumnText),
+    'column_text2': (OracleRollableColumnText2, _OracleRollableColumnText2),
+    'column_text3': (OracleRollableColumnText3, _OracleRollableColumnText3),
+    'table_text': (OracleRollableTableText, _OracleRollableTableText),
+    'table_text2': (OracleRollableTableText2, _OracleRollableTableText2),
+    'table_text3': (OracleRollableTableText3, _OracleRollableTableText3),
+}
+_OracleRollableTable_variants = {
+    'table_text': (OracleRollableTableTableText, _OracleRollableTableTableText),
+    'table_text2': (OracleRollableTableTableText2, _OracleRollableTableTableText2),
+    'table_text3': (OracleRollableTableTableText3, _OracleRollableTableTableText3),
+}
+_RollableValue_variants = {
+    'asset_control': (RollableValueAssetControl, _RollableValueAssetControl),
+    'asset_option': (RollableValueAssetOption, _RollableValueAssetOption),
+    'attached_asset_control': (RollableValueAttachedAssetControl, _RollableValueAttachedAssetControl),
+    'attached_asset_option': (RollableValueAttachedAssetOption, _RollableValueAttachedAssetOption),
+    'condition_meter': (RollableValueConditionMeter, _RollableValueConditionMeter),
+    'custom': (RollableValueCustom, _RollableValueCustom),
+    'stat': (RollableValueStat, _RollableValueStat),
+}
+_SelectEnhancementFieldChoice0_variants = {
+    'choice': (SelectEnhancementFieldChoiceChoice, _SelectEnhancementFieldChoiceChoice),
+    'choice_group': (SelectEnhancementFieldChoiceChoiceGroup, _SelectEnhancementFieldChoiceChoiceGroup),
+}
+_SelectValueFieldChoice_variants = {
+    'asset_control': (SelectValueFieldChoiceAssetControl, _SelectValueFieldChoiceAssetControl),
+    'asset_option': (SelectValueFieldChoiceAssetOption, _SelectValueFieldChoiceAssetOption),
+    'attached_asset_control': (SelectValueFieldChoiceAttachedAssetControl, _SelectValueFieldChoiceAttachedAssetControl),
+    'attached_asset_option': (SelectValueFieldChoiceAttachedAssetOption, _SelectValueFieldChoiceAttachedAssetOption),
+    'condition_meter': (SelectValueFieldChoiceConditionMeter, _SelectValueFieldChoiceConditionMeter),
+    'custom': (SelectValueFieldChoiceCustom, _SelectValueFieldChoiceCustom),
+    'stat': (SelectValueFieldChoiceStat, _SelectValueFieldChoiceStat),
+}
+
+SPECIALIZED = {
+    RulesPackage: _RulesPackage,
+    RulesPackageExpansion: _RulesPackageExpansion,
+    RulesPackageRuleset: _RulesPackageRuleset,
+    AnyID: _AnyID,
+    AnyIDWildcard: _AnyIDWildcard,
+    AnyMoveID: _AnyMoveID,
+    AnyMoveIDWildcard: _AnyMoveIDWildcard,
+    AnyOracleRollableID: _AnyOracleRollableID,
+    AnyOracleRollableIDWildcard: _AnyOracleRollableIDWildcard,
+    AnyOracleRollableRowID: _AnyOracleRollableRowID,
+    AnyOracleRollableRowIDWildcard: _AnyOracleRollableRowIDWildcard,
+    Asset: _Asset,
+    AssetAbility: _AssetAbility,
+    AssetAbilityControlField: _AssetAbilityControlField,
+    AssetAbilityControlFieldCheckbox: _AssetAbilityControlFieldCheckbox,
+    AssetAbilityControlFieldClock: _AssetAbilityControlFieldClock,
+    AssetAbilityControlFieldCounter: _AssetAbilityControlFieldCounter,
+    AssetAbilityControlFieldText: _AssetAbilityControlFieldText,
+    AssetAbilityID: _AssetAbilityID,
+    AssetAbilityIDWildcard: _AssetAbilityIDWildcard,
+    AssetAbilityMoveID: _AssetAbilityMoveID,
+    AssetAbilityMoveIDWildcard: _AssetAbilityMoveIDWildcard,
+    AssetAbilityOptionField: _AssetAbilityOptionField,
+    AssetAbilityOptionFieldText: _AssetAbilityOptionFieldText,
+    AssetAbilityOracleRollableID: _AssetAbilityOracleRollableID,
+    AssetAbilityOracleRollableIDWildcard: _AssetAbilityOracleRollableIDWildcard,
+    AssetAbilityOracleRollableRowID: _AssetAbilityOracleRollableRowID,
+    AssetAbilityOracleRollableRowIDWildcard: _AssetAbilityOracleRollableRowIDWildcard,
+    AssetAttachment: _AssetAttachment,
+    AssetCardFlipField: _AssetCardFlipField,
+    AssetCheckboxField: _AssetCheckboxField,
+    AssetCollection: _AssetCollection,
+    AssetCollectionID: _AssetCollectionID,
+    AssetCollectionIDWildcard: _AssetCollectionIDWildcard,
+    AssetConditionMeterMoves: _AssetConditionMeterMoves,
+    AssetConditionMeter: _AssetConditionMeter,
+    AssetConditionMeterControlField: _AssetConditionMeterControlField,
+    AssetConditionMeterControlFieldCardFlip: _AssetConditionMeterControlFieldCardFlip,
+    AssetConditionMeterControlFieldCheckbox: _AssetConditionMeterControlFieldCheckbox,
+    AssetConditionMeterEnhancement: _AssetConditionMeterEnhancement,
+    AssetControlField: _AssetControlField,
+    AssetControlFieldCardFlip: _AssetControlFieldCardFlip,
+    AssetControlFieldCheckbox: _AssetControlFieldCheckbox,
+    AssetControlFieldConditionMeterMoves: _AssetControlFieldConditionMeterMoves,
+    AssetControlFieldConditionMeter: _AssetControlFieldConditionMeter,
+    AssetControlFieldSelectEnhancementChoice: _AssetControlFieldSelectEnhancementChoice,
+    AssetControlFieldSelectEnhancementChoiceChoice: _AssetControlFieldSelectEnhancementChoiceChoice,
+    AssetControlFieldSelectEnhancementChoiceChoiceGroup: _AssetControlFieldSelectEnhancementChoiceChoiceGroup,
+    AssetControlFieldSelectEnhancement: _AssetControlFieldSelectEnhancement,
+    AssetControlFieldEnhancement: _AssetControlFieldEnhancement,
+    AssetControlFieldEnhancementConditionMeter: _AssetControlFieldEnhancementConditionMeter,
+    AssetControlValueRef: _AssetControlValueRef,
+    AssetEnhancement: _AssetEnhancement,
+    AssetID: _AssetID,
+    AssetIDWildcard: _AssetIDWildcard,
+    AssetOptionField: _AssetOptionField,
+    AssetOptionFieldSelectEnhancementChoice: _AssetOptionFieldSelectEnhancementChoice,
+    AssetOptionFieldSelectEnhancementChoiceChoice: _AssetOptionFieldSelectEnhancementChoiceChoice,
+    AssetOptionFieldSelectEnhancementChoiceChoiceGroup: _AssetOptionFieldSelectEnhancementChoiceChoiceGroup,
+    AssetOptionFieldSelectEnhancement: _AssetOptionFieldSelectEnhancement,
+    AssetOptionFieldSelectValue: _AssetOptionFieldSelectValue,
+    AssetOptionFieldText: _AssetOptionFieldText,
+    AssetOptionValueRef: _AssetOptionValueRef,
+    AtlasCollection: _AtlasCollection,
+    AtlasCollectionID: _AtlasCollectionID,
+    AtlasCollectionIDWildcard: _AtlasCollectionIDWildcard,
+    AtlasEntry: _AtlasEntry,
+    AtlasEntryID: _AtlasEntryID,
+    AtlasEntryIDWildcard: _AtlasEntryIDWildcard,
+    AttachedAssetControlValueRef: _AttachedAssetControlValueRef,
+    AttachedAssetOptionValueRef: _AttachedAssetOptionValueRef,
+    AuthorInfo: _AuthorInfo,
+    ChallengeRank: _ChallengeRank,
+    ClockField: _ClockField,
+    ConditionMeterField: _ConditionMeterField,
+    ConditionMeterKey: _ConditionMeterKey,
+    ConditionMeterRule: _ConditionMeterRule,
+    ConditionMeterValueRef: _ConditionMeterValueRef,
+    CoreTags: _CoreTags,
+    CounterField: _CounterField,
+    CSSColor: _CSSColor,
+    CustomValue: _CustomValue,
+    DelveSite: _DelveSite,
+    DelveSiteDenizen: _DelveSiteDenizen,
+    DelveSiteDenizenID: _DelveSiteDenizenID,
+    DelveSiteDenizenIDWildcard: _DelveSiteDenizenIDWildcard,
+    DelveSiteDomain: _DelveSiteDomain,
+    DelveSiteDomainDanger: _DelveSiteDomainDanger,
+    DelveSiteDomainDangerID: _DelveSiteDomainDangerID,
+    DelveSiteDomainDangerIDWildcard: _DelveSiteDomainDangerIDWildcard,
+    DelveSiteDomainFeature: _DelveSiteDomainFeature,
+    DelveSiteDomainFeatureID: _DelveSiteDomainFeatureID,
+    DelveSiteDomainFeatureIDWildcard: _DelveSiteDomainFeatureIDWildcard,
+    DelveSiteDomainID: _DelveSiteDomainID,
+    DelveSiteDomainIDWildcard: _DelveSiteDomainIDWildcard,
+    DelveSiteID: _DelveSiteID,
+    DelveSiteIDWildcard: _DelveSiteIDWildcard,
+    DelveSiteTheme: _DelveSiteTheme,
+    DelveSiteThemeDanger: _DelveSiteThemeDanger,
+    DelveSiteThemeDangerID: _DelveSiteThemeDangerID,
+    DelveSiteThemeDangerIDWildcard: _DelveSiteThemeDangerIDWildcard,
+    DelveSiteThemeFeature: _DelveSiteThemeFeature,
+    DelveSiteThemeFeatureID: _DelveSiteThemeFeatureID,
+    DelveSiteThemeFeatureIDWildcard: _DelveSiteThemeFeatureIDWildcard,
+    DelveSiteThemeID: _DelveSiteThemeID,
+    DelveSiteThemeIDWildcard: _DelveSiteThemeIDWildcard,
+    DiceExpression: _DiceExpression,
+    DiceRange: _DiceRange,
+    DictKey: _DictKey,
+    Documentation: _Documentation,
+    Email: _Email,
+    EmbeddedActionRollMove: _EmbeddedActionRollMove,
+    EmbeddedMove: _EmbeddedMove,
+    EmbeddedMoveActionRoll: _EmbeddedMoveActionRoll,
+    EmbeddedMoveNoRoll: _EmbeddedMoveNoRoll,
+    EmbeddedMoveProgressRoll: _EmbeddedMoveProgressRoll,
+    EmbeddedMoveSpecialTrack: _EmbeddedMoveSpecialTrack,
+    EmbeddedMoveID: _EmbeddedMoveID,
+    EmbeddedMoveIDWildcard: _EmbeddedMoveIDWildcard,
+    EmbeddedNoRollMove: _EmbeddedNoRollMove,
+    EmbeddedOracleColumnTextRecommendedRolls: _EmbeddedOracleColumnTextRecommendedRolls,
+    EmbeddedOracleColumnText: _EmbeddedOracleColumnText,
+    EmbeddedOracleColumnText2RecommendedRolls: _EmbeddedOracleColumnText2RecommendedRolls,
+    EmbeddedOracleColumnText2: _EmbeddedOracleColumnText2,
+    EmbeddedOracleColumnText3RecommendedRolls: _EmbeddedOracleColumnText3RecommendedRolls,
+    EmbeddedOracleColumnText3: _EmbeddedOracleColumnText3,
+    EmbeddedOracleRollable: _EmbeddedOracleRollable,
+    EmbeddedOracleRollableColumnTextRecommendedRolls: _EmbeddedOracleRollableColumnTextRecommendedRolls,
+    EmbeddedOracleRollableColumnText: _EmbeddedOracleRollableColumnText,
+    EmbeddedOracleRollableColumnText2RecommendedRolls: _EmbeddedOracleRollableColumnText2RecommendedRolls,
+    EmbeddedOracleRollableColumnText2: _EmbeddedOracleRollableColumnText2,
+    EmbeddedOracleRollableColumnText3RecommendedRolls: _EmbeddedOracleRollableColumnText3RecommendedRolls,
+    EmbeddedOracleRollableColumnText3: _EmbeddedOracleRollableColumnText3,
+    EmbeddedOracleRollableTableTextColumnLabels: _EmbeddedOracleRollableTableTextColumnLabels,
+    EmbeddedOracleRollableTableTextRecommendedRolls: _EmbeddedOracleRollableTableTextRecommendedRolls,
+    EmbeddedOracleRollableTableText: _EmbeddedOracleRollableTableText,
+    EmbeddedOracleRollableTableText2ColumnLabels: _EmbeddedOracleRollableTableText2ColumnLabels,
+    EmbeddedOracleRollableTableText2RecommendedRolls: _EmbeddedOracleRollableTableText2RecommendedRolls,
+    EmbeddedOracleRollableTableText2: _EmbeddedOracleRollableTableText2,
+    EmbeddedOracleRollableTableText3ColumnLabels: _EmbeddedOracleRollableTableText3ColumnLabels,
+    EmbeddedOracleRollableTableText3RecommendedRolls: _EmbeddedOracleRollableTableText3RecommendedRolls,
+    EmbeddedOracleRollableTableText3: _EmbeddedOracleRollableTableText3,
+    EmbeddedOracleRollableID: _EmbeddedOracleRollableID,
+    EmbeddedOracleRollableIDWildcard: _EmbeddedOracleRollableIDWildcard,
+    EmbeddedOracleTableTextColumnLabels: _EmbeddedOracleTableTextColumnLabels,
+    EmbeddedOracleTableTextRecommendedRolls: _EmbeddedOracleTableTextRecommendedRolls,
+    EmbeddedOracleTableText: _EmbeddedOracleTableText,
+    EmbeddedOracleTableText2ColumnLabels: _EmbeddedOracleTableText2ColumnLabels,
+    EmbeddedOracleTableText2RecommendedRolls: _EmbeddedOracleTableText2RecommendedRolls,
+    EmbeddedOracleTableText2: _EmbeddedOracleTableText2,
+    EmbeddedOracleTableText3ColumnLabels: _EmbeddedOracleTableText3ColumnLabels,
+    EmbeddedOracleTableText3RecommendedRolls: _EmbeddedOracleTableText3RecommendedRolls,
+    EmbeddedOracleTableText3: _EmbeddedOracleTableText3,
+    EmbeddedProgressRollMove: _EmbeddedProgressRollMove,
+    EmbeddedSpecialTrackMove: _EmbeddedSpecialTrackMove,
+    EntityPrompt: _EntityPrompt,
+    Expansion: _Expansion,
+    ExpansionID: _ExpansionID,
+    I18nHint: _I18nHint,
+    I18nHintsTemplate: _I18nHintsTemplate,
+    I18nHints: _I18nHints,
+    ImpactCategory: _ImpactCategory,
+    ImpactRule: _ImpactRule,
+    Label: _Label,
+    MarkdownString: _MarkdownString,
+    MarkdownTemplateString: _MarkdownTemplateString,
+    Move: _Move,
+    MoveActionRoll0: _MoveActionRoll0,
+    MoveNoRoll0: _MoveNoRoll0,
+    MoveProgressRoll0: _MoveProgressRoll0,
+    MoveSpecialTrack0: _MoveSpecialTrack0,
+    MoveActionRoll: _MoveActionRoll,
+    MoveActionRollEnhancement: _MoveActionRollEnhancement,
+    MoveCategory: _MoveCategory,
+    MoveCategoryID: _MoveCategoryID,
+    MoveCategoryIDWildcard: _MoveCategoryIDWildcard,
+    MoveEnhancement: _MoveEnhancement,
+    MoveEnhancementActionRoll: _MoveEnhancementActionRoll,
+    MoveEnhancementNoRoll: _MoveEnhancementNoRoll,
+    MoveEnhancementProgressRoll: _MoveEnhancementProgressRoll,
+    MoveEnhancementSpecialTrack: _MoveEnhancementSpecialTrack,
+    MoveID: _MoveID,
+    MoveIDWildcard: _MoveIDWildcard,
+    MoveNoRoll: _MoveNoRoll,
+    MoveNoRollEnhancement: _MoveNoRollEnhancement,
+    MoveOracleRollableID: _MoveOracleRollableID,
+    MoveOracleRollableIDWildcard: _MoveOracleRollableIDWildcard,
+    MoveOracleRollableRowID: _MoveOracleRollableRowID,
+    MoveOracleRollableRowIDWildcard: _MoveOracleRollableRowIDWildcard,
+    MoveOutcome: _MoveOutcome,
+    MoveOutcomes: _MoveOutcomes,
+    MoveProgressRoll: _MoveProgressRoll,
+    MoveProgressRollEnhancement: _MoveProgressRollEnhancement,
+    MoveSpecialTrack: _MoveSpecialTrack,
+    MoveSpecialTrackEnhancement: _MoveSpecialTrackEnhancement,
+    Npc: _Npc,
+    NpcCollection: _NpcCollection,
+    NpcCollectionID: _NpcCollectionID,
+    NpcCollectionIDWildcard: _NpcCollectionIDWildcard,
+    NpcID: _NpcID,
+    NpcIDWildcard: _NpcIDWildcard,
+    NpcNature: _NpcNature,
+    NpcVariant: _NpcVariant,
+    NpcVariantID: _NpcVariantID,
+    NpcVariantIDWildcard: _NpcVariantIDWildcard,
+    OracleCollection: _OracleCollection,
+    OracleCollectionTableSharedRollsColumnLabels: _OracleCollectionTableSharedRollsColumnLabels,
+    OracleCollectionTableSharedRolls: _OracleCollectionTableSharedRolls,
+    OracleCollectionTableSharedTextColumnLabels: _OracleCollectionTableSharedTextColumnLabels,
+    OracleCollectionTableSharedText: _OracleCollectionTableSharedText,
+    OracleCollectionTableSharedText2ColumnLabels: _OracleCollectionTableSharedText2ColumnLabels,
+    OracleCollectionTableSharedText2: _OracleCollectionTableSharedText2,
+    OracleCollectionTableSharedText3ColumnLabels: _OracleCollectionTableSharedText3ColumnLabels,
+    OracleCollectionTableSharedText3: _OracleCollectionTableSharedText3,
+    OracleCollectionTables: _OracleCollectionTables,
+    OracleCollectionID: _OracleCollectionID,
+    OracleCollectionIDWildcard: _OracleCollectionIDWildcard,
+    OracleColumnTextRecommendedRolls: _OracleColumnTextRecommendedRolls,
+    OracleColumnText: _OracleColumnText,
+    OracleColumnText2RecommendedRolls: _OracleColumnText2RecommendedRolls,
+    OracleColumnText2: _OracleColumnText2,
+    OracleColumnText3RecommendedRolls: _OracleColumnText3RecommendedRolls,
+    OracleColumnText3: _OracleColumnText3,
+    OracleMatchBehavior: _OracleMatchBehavior,
+    OracleRoll: _OracleRoll,
+    OracleRollTemplate: _OracleRollTemplate,
+    OracleRollable: _OracleRollable,
+    OracleRollableColumnTextRecommendedRolls: _OracleRollableColumnTextRecommendedRolls,
+    OracleRollableColumnText: _OracleRollableColumnText,
+    OracleRollableColumnText2RecommendedRolls: _OracleRollableColumnText2RecommendedRolls,
+    OracleRollableColumnText2: _OracleRollableColumnText2,
+    OracleRollableColumnText3RecommendedRolls: _OracleRollableColumnText3RecommendedRolls,
+    OracleRollableColumnText3: _OracleRollableColumnText3,
+    OracleRollableTableTextColumnLabels: _OracleRollableTableTextColumnLabels,
+    OracleRollableTableTextRecommendedRolls: _OracleRollableTableTextRecommendedRolls,
+    OracleRollableTableText: _OracleRollableTableText,
+    OracleRollableTableText2ColumnLabels: _OracleRollableTableText2ColumnLabels,
+    OracleRollableTableText2RecommendedRolls: _OracleRollableTableText2RecommendedRolls,
+    OracleRollableTableText2: _OracleRollableTableText2,
+    OracleRollableTableText3ColumnLabels: _OracleRollableTableText3ColumnLabels,
+    OracleRollableTableText3RecommendedRolls: _OracleRollableTableText3RecommendedRolls,
+    OracleRollableTableText3: _OracleRollableTableText3,
+    OracleRollableID: _OracleRollableID,
+    OracleRollableIDWildcard: _OracleRollableIDWildcard,
+    OracleRollableRowID: _OracleRollableRowID,
+    OracleRollableRowIDWildcard: _OracleRollableRowIDWildcard,
+    OracleRollableRowText: _OracleRollableRowText,
+    OracleRollableRowText2: _OracleRollableRowText2,
+    OracleRollableRowText3: _OracleRollableRowText3,
+    OracleRollableTable: _OracleRollableTable,
+    OracleRollableTableTableTextColumnLabels: _OracleRollableTableTableTextColumnLabels,
+    OracleRollableTableTableTextRecommendedRolls: _OracleRollableTableTableTextRecommendedRolls,
+    OracleRollableTableTableText: _OracleRollableTableTableText,
+    OracleRollableTableTableText2ColumnLabels: _OracleRollableTableTableText2ColumnLabels,
+    OracleRollableTableTableText2RecommendedRolls: _OracleRollableTableTableText2RecommendedRolls,
+    OracleRollableTableTableText2: _OracleRollableTableTableText2,
+    OracleRollableTableTableText3ColumnLabels: _OracleRollableTableTableText3ColumnLabels,
+    OracleRollableTableTableText3RecommendedRolls: _OracleRollableTableTableText3RecommendedRolls,
+    OracleRollableTableTableText3: _OracleRollableTableTableText3,
+    OracleTableSharedRollsColumnLabels: _OracleTableSharedRollsColumnLabels,
+    OracleTableSharedRolls: _OracleTableSharedRolls,
+    OracleTableSharedTextColumnLabels: _OracleTableSharedTextColumnLabels,
+    OracleTableSharedText: _OracleTableSharedText,
+    OracleTableSharedText2ColumnLabels: _OracleTableSharedText2ColumnLabels,
+    OracleTableSharedText2: _OracleTableSharedText2,
+    OracleTableSharedText3ColumnLabels: _OracleTableSharedText3ColumnLabels,
+    OracleTableSharedText3: _OracleTableSharedText3,
+    OracleTableTextColumnLabels: _OracleTableTextColumnLabels,
+    OracleTableTextRecommendedRolls: _OracleTableTextRecommendedRolls,
+    OracleTableText: _OracleTableText,
+    OracleTableText2ColumnLabels: _OracleTableText2ColumnLabels,
+    OracleTableText2RecommendedRolls: _OracleTableText2RecommendedRolls,
+    OracleTableText2: _OracleTableText2,
+    OracleTableText3ColumnLabels: _OracleTableText3ColumnLabels,
+    OracleTableText3RecommendedRolls: _OracleTableText3RecommendedRolls,
+    OracleTableText3: _OracleTableText3,
+    OracleTablesCollection: _OracleTablesCollection,
+    PageNumber: _PageNumber,
+    ProgressRollOption: _ProgressRollOption,
+    ProgressTrackTypeInfo: _ProgressTrackTypeInfo,
+    Rarity: _Rarity,
+    RarityID: _RarityID,
+    RarityIDWildcard: _RarityIDWildcard,
+    RollableValue: _RollableValue,
+    RollableValueAssetControl: _RollableValueAssetControl,
+    RollableValueAssetOption: _RollableValueAssetOption,
+    RollableValueAttachedAssetControl: _RollableValueAttachedAssetControl,
+    RollableValueAttachedAssetOption: _RollableValueAttachedAssetOption,
+    RollableValueConditionMeter: _RollableValueConditionMeter,
+    RollableValueCustom: _RollableValueCustom,
+    RollableValueStat: _RollableValueStat,
+    Rules: _Rules,
+    RulesExpansion: _RulesExpansion,
+    RulesPackageID: _RulesPackageID,
+    Ruleset: _Ruleset,
+    RulesetID: _RulesetID,
+    SelectEnhancementFieldChoice0: _SelectEnhancementFieldChoice0,
+    SelectEnhancementFieldChoiceChoice: _SelectEnhancementFieldChoiceChoice,
+    SelectEnhancementFieldChoiceChoiceGroup: _SelectEnhancementFieldChoiceChoiceGroup,
+    SelectEnhancementField: _SelectEnhancementField,
+    SelectEnhancementFieldChoice: _SelectEnhancementFieldChoice,
+    SelectEnhancementFieldChoiceGroup: _SelectEnhancementFieldChoiceGroup,
+    SelectValueField: _SelectValueField,
+    SelectValueFieldChoice: _SelectValueFieldChoice,
+    SelectValueFieldChoiceAssetControl: _SelectValueFieldChoiceAssetControl,
+    SelectValueFieldChoiceAssetOption: _SelectValueFieldChoiceAssetOption,
+    SelectValueFieldChoiceAttachedAssetControl: _SelectValueFieldChoiceAttachedAssetControl,
+    SelectValueFieldChoiceAttachedAssetOption: _SelectValueFieldChoiceAttachedAssetOption,
+    SelectValueFieldChoiceConditionMeter: _SelectValueFieldChoiceConditionMeter,
+    SelectValueFieldChoiceCustom: _SelectValueFieldChoiceCustom,
+    SelectValueFieldChoiceStat: _SelectValueFieldChoiceStat,
+    SemanticVersion: _SemanticVersion,
+    SourceInfo: _SourceInfo,
+    SpecialTrackRule: _SpecialTrackRule,
+    SpecialTrackType: _SpecialTrackType,
+    StatKey: _StatKey,
+    StatRule: _StatRule,
+    StatValueRef: _StatValueRef,
+    Suggestions: _Suggestions,
+    SvgImageURL: _SvgImageURL,
+    Tag: _Tag,
+    TagRule: _TagRule,
+    TagSchema: _TagSchema,
+    Tags: _Tags,
+    TextField: _TextField,
+    TriggerActionRoll: _TriggerActionRoll,
+    TriggerActionRollCondition: _TriggerActionRollCondition,
+    TriggerActionRollConditionEnhancement: _TriggerActionRollConditionEnhancement,
+    TriggerActionRollEnhancement: _TriggerActionRollEnhancement,
+    TriggerBy: _TriggerBy,
+    TriggerNoRoll: _TriggerNoRoll,
+    TriggerNoRollCondition: _TriggerNoRollCondition,
+    TriggerNoRollEnhancement: _TriggerNoRollEnhancement,
+    TriggerProgressRoll: _TriggerProgressRoll,
+    TriggerProgressRollCondition: _TriggerProgressRollCondition,
+    TriggerProgressRollConditionEnhancement: _TriggerProgressRollConditionEnhancement,
+    TriggerProgressRollEnhancement: _TriggerProgressRollEnhancement,
+    TriggerSpecialTrack: _TriggerSpecialTrack,
+    TriggerSpecialTrackCondition: _TriggerSpecialTrackCondition,
+    TriggerSpecialTrackConditionEnhancement: _TriggerSpecialTrackConditionEnhancement,
+    TriggerSpecialTrackConditionOption: _TriggerSpecialTrackConditionOption,
+    TriggerSpecialTrackEnhancement: _TriggerSpecialTrackEnhancement,
+    Truth: _Truth,
+    TruthID: _TruthID,
+    TruthIDWildcard: _TruthIDWildcard,
+    TruthOption: _TruthOption,
+    TruthOptionID: _TruthOptionID,
+    TruthOptionIDWildcard: _TruthOptionIDWildcard,
+    TruthOptionOracleRollableID: _TruthOptionOracleRollableID,
+    TruthOptionOracleRollableIDWildcard: _TruthOptionOracleRollableIDWildcard,
+    TruthOptionOracleRollableRowID: _TruthOptionOracleRollableRowID,
+    TruthOptionOracleRollableRowIDWildcard: _TruthOptionOracleRollableRowIDWildcard,
+    WebURL: _WebURL,
+    WebpImageURL: _WebpImageURL,
+}
+
+
+def _generic_from_json(cls, data):
+    return cls.from_json_data(data)
+
+
+def _freeze(data):
+    """Return a hashable key for a JSON value."""
+    if isinstance(data, dict):
+        return tuple((k, _freeze(v)) for k, v in data.items())
+    if isinstance(data, list):
+        return tuple(_freeze(v) for v in data)
+    return data
+
+
+def clear_interned():
+    """Drop the shared instances, e.g. after the loaded rules are released."""
+    for table in INTERNED.values():
+        table.clear()
+
+
+_generic = {}
+
+
+def install():
+    """Replace `from_json_data` of every model class by its specialized version."""
+    for cls, func in SPECIALIZED.items():
+        _generic.setdefault(cls, cls.__dict__["from_json_data"])
+        cls.from_json_data = classmethod(func)
+
+
+def uninstall():
+    """Restore the generic `from_json_data` methods."""
+    for cls, method in _generic.items():
+        cls.from_json_data = method
@@ -0,0 +1,222 @@
+"""Exact outcome probabilities of rollable oracles.
+
+`row_probabilities()` gives the chance of landing on each row of an oracle,
+from its row table and the distribution of its dice. `expected_rows()`
+follows the rolls a row asks for and the placeholders of its template the
+way `resolver.Resolver` does, and returns the expected number of times each
+row appears in a fully resolved roll. Everything is computed from the
+distributions, without sampling.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import cache
+from typing import Any
+
+from ._datasworn import OracleDuplicateBehavior
+from .dice import Dice
+from .resolver import compile_template, oracle_table, rolls_itself
+
+
+@cache
+def _counts(oracle_id: str, dice: str | None = None) -> tuple[int, ...]:
+    """Return the number of ways to roll each row of `oracle_id` with `dice`
+    (default: the oracle's own); the last item counts uncovered rolls."""
+    oracle, table, own = oracle_table(oracle_id)
+    compiled = own if dice is None else Dice.parse(dice)
+    counts = [0] * (len(oracle.rows) + 1)
+    weights = compiled.weights()
+    if compiled == own:
+        # the row table holds one row index (NO_ROW = -1) per face
+        for i, w in zip(table.rows, weights):
+            counts[i] += w
+    else:
+        for face, w in enumerate(weights, compiled.low):
+            i = table.row_index(face)
+            counts[-1 if i is None else i] += w
+    return tuple(counts)
+
+
+def row_probabilities(oracle_id: str) -> list[Fraction]:
+    """Return the exact probability of each row of `oracle_id`."""
+    counts = _counts(oracle_id)
+    total = sum(counts)
+    return [Fraction(c, total) for c in counts[:-1]]
+
+
+@cache
+def _draws(oracle_id: str, dice: str | None) -> tuple[float, ...]:
+    """Return the probabilities of the rows of `oracle_id` when it is rolled
+    by another row: uncovered and "Roll twice" rows are rerolled."""
+    oracle, _, _ = oracle_table(oracle_id)
+    counts = [
+        0 if rolls_itself(row, oracle_id) else c
+        for row, c in zip(oracle.rows, _counts(oracle_id, dice))
+    ]
+    total = sum(counts)
+    return tuple(c / total for c in counts) if total else ()
+
+
+def _inclusion(q: list[float], k: int) -> list[float]:
+    """Return how often each item is expected to be drawn in `k` draws with
+    probabilities `q`, when items already drawn are drawn again."""
+    if k == 1:
+        return q
+    if k == 2:
+        # q_i + sum over j != i of q_j * q_i / (1 - q_j)
+        odds = [x / (1 - x) if x < 1 else 0.0 for x in q]
+        s = sum(odds)
+        return [x * (1 + s - o) for x, o in zip(q, odds)]
+    out = list(q)
+    for j, x in enumerate(q):
+        if not x or x >= 1:
+            continue
+        rest = [0.0 if i == j else y / (1 - x) for i, y in enumerate(q)]
+        for i, y in enumerate(_inclusion(rest, k - 1)):
+            out[i] += x * y
+    return out
+
+
+def _add(out: dict[str, float], counts: dict[str, float], p: float) -> None:
+    for id_, n in counts.items():
+        out[id_] = out.get(id_, 0.0) + p * n
+
+
+class Analyzer:
+    """Computes and memoizes the expected rows of fully resolved rolls."""
+
+    def __init__(self, *, auto_only: bool = True) -> None:
+        self.auto_only = auto_only
+        """Follow only the rolls marked `auto`, as `Resolver` does."""
+        self._full: dict[str, dict[str, float]] = {}
+        self._rows: dict[tuple[str, int], dict[str, float]] = {}
+        self._rolls: dict[tuple, dict[str, float]] = {}
+        self._active: set[tuple[str, int]] = set()
+        """Rows being expanded, to stop at rows that roll themselves again."""
+        self._cuts = 0
+        """Number of times a row was cut short by `_active`; results computed
+        while it grows are incomplete and not memoized."""
+
+    def expected_rows(self, oracle_id: str) -> dict[str, float]:
+        """Return the expected count of each row ID in a resolved roll."""
+        if (out := self._full.get(oracle_id)) is None:
+            cuts = self._cuts
+            oracle, _, _ = oracle_table(oracle_id)
+            counts = _counts(oracle_id)
+            total = sum(counts)
+            out = {}
+            for row, i, c in zip(oracle.rows, range(len(counts) - 1), counts):
+                if not c:
+                    continue
+                if row.oracle_rolls or row.template:
+                    _add(out, self._expand(oracle_id, i), c / total)
+                else:  # most rows roll nothing further
+                    id_ = row.id.value
+                    out[id_] = out.get(id_, 0.0) + c / total
+            if self._cuts == cuts:
+                self._full[oracle_id] = out
+        return out
+
+    def _rolled(
+        self, oracle_id: str, dice: str | None, k: int, reroll: bool
+    ) -> dict[str, float]:
+        """Return the expected rows once `oracle_id` is rolled `k` times."""
+        key = (oracle_id, dice, k, reroll)
+        if (out := self._rolls.get(key)) is None:
+            cuts = self._cuts
+            q = list(_draws(oracle_id, dice))
+            if reroll:
+                expected = _inclusion(q, min(k, sum(1 for x in q if x)))
+            else:
+                expected = [k * x for x in q]
+            out = {}
+            for j, n in enumerate(expected):
+                if n:
+                    _add(out, self._expand(oracle_id, j), n)
+            if self._cuts == cuts:
+                self._rolls[key] = out
+        return out
+
+    def _expand(self, oracle_id: str, i: int) -> dict[str, float]:
+        """Return the expected rows once row `i` of `oracle_id` is rolled."""
+        if (out := self._rows.get((oracle_id, i))) is not None:
+            return out
+        oracle, _, _ = oracle_table(oracle_id)
+        row = oracle.rows[i]
+        out = {row.id.value: 1.0}
+        if (oracle_id, i) in self._active:
+            self._cuts += 1
+            return out
+        self._active.add((oracle_id, i))
+        cuts = self._cuts
+
+        rolled: dict[str, int] = {}
+        for oracle_roll in row.oracle_rolls or ():
+            if self.auto_only and not oracle_roll.auto:
+                continue
+            target = oracle_roll.oracle.value if oracle_roll.oracle else oracle_id
+            k = oracle_roll.number_of_rolls
+            rolled[target] = rolled.get(target, 0) + k
+            dice = oracle_roll.dice.value if oracle_roll.dice else None
+            reroll = oracle_roll.duplicates is OracleDuplicateBehavior.REROLL
+            _add(out, self._rolled(target, dice, k, reroll), 1.0)
+
+        # placeholders without a matching roll are rolled when filled in
+        if template := row.template:
+            wanted = Counter(
+                part[1]
+                for name in ("text", "text2", "text3")
+                if (text := getattr(template, name))
+                for part in compile_template(text.value)
+                if not isinstance(part, str)
+            )
+            for target, n in wanted.items():
+                if n > (done := rolled.get(target, 0)):
+                    _add(out, self.expected_rows(target), n - done)
+
+        self._active.discard((oracle_id, i))
+        if self._cuts == cuts:
+            self._rows[oracle_id, i] = out
+        return out
+
+
+def expected_rows(oracle_id: str, *, auto_only: bool = True) -> dict[str, float]:
+    """Return the expected count of each row ID in a fully resolved roll of
+    `oracle_id`."""
+    return Analyzer(auto_only=auto_only).expected_rows(oracle_id)
+
+
+@dataclass(slots=True)
+class OracleStats:
+    oracle_id: str
+    dice: str
+    rows: int
+    coverage: float
+    """Probability that a roll lands on a row."""
+    top: float
+    """Probability of the most likely row."""
+    expected: float
+    """Expected number of rows in a fully resolved roll."""
+
+
+def oracle_stats(oracle_ids: Any, *, auto_only: bool = True) -> list[OracleStats]:
+    """Return the `OracleStats` of every oracle in `oracle_ids`, sharing one
+    `Analyzer` so nested oracles are expanded once."""
+    analyzer = Analyzer(auto_only=auto_only)
+    stats = []
+    for oracle_id in oracle_ids:
+        oracle, table, _ = oracle_table(oracle_id)
+        counts = _counts(oracle_id)
+        total = sum(counts)
+        stats.append(
+            OracleStats(
+                oracle_id,
+                table.dice,
+                len(oracle.rows),
+                1 - counts[-1] / total,
+                max(counts[:-1], default=0) / total,
+                sum(analyzer.expected_rows(oracle_id).values()),
+            )
+        )
+    return stats
@@ -0,0 +1,194 @@
+"""On-disk snapshot cache for loaded rulesets.
+
+Building a `RulesPackage` from JSON is the largest part of startup. A snapshot
+stores the built package together with its index, id tree, parent map,
+breadcrumbs, IDs by type, oracle row tables, validation issues, search index,
+link graph and ID table, keyed by the hash of the ruleset JSON file, the
+generated `_datasworn` modules, the indexing modules and the snapshot format,
+so any change to the data, the model or the indexing invalidates it
+automatically.
+
+Environment variables:
+    PYSWORN_CACHE_DIR: directory for snapshots (default `~/.cache/pysworn`).
+    PYSWORN_NO_CACHE: set to a non-empty value to disable the cache.
+    PYSWORN_STORE: set to a non-empty value to serve rulesets from
+        memory-mapped stores instead of snapshots, see `store`.
+"""
+
+import gc
+import hashlib
+import io
+import os
+import pickle
+import struct
+import sys
+from contextlib import contextmanager
+from dataclasses import fields
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from pysworn.datasworn import _datasworn
+
+from .logging import log
+
+SNAPSHOT_VERSION = 10
+"""Bump when the layout of the snapshot payload changes."""
+
+DATA_PATH = Path(_datasworn.__file__).parent
+
+READ_ERRORS = (
+    OSError,
+    EOFError,
+    ValueError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    struct.error,
+    pickle.UnpicklingError,
+)
+"""Errors raised reading a ruleset, snapshot or store that is missing,
+truncated, corrupt or from another version."""
+
+WRITE_ERRORS = (OSError, pickle.PicklingError)
+
+
+def cache_dir() -> Path:
+    if path := os.environ.get("PYSWORN_CACHE_DIR"):
+        return Path(path)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pysworn"
+
+
+def cache_enabled() -> bool:
+    return not os.environ.get("PYSWORN_NO_CACHE")
+
+
+def store_enabled() -> bool:
+    return cache_enabled() and bool(os.environ.get("PYSWORN_STORE"))
+
+
+@cache
+def _module_digest() -> bytes:
+    h = hashlib.blake2b()
+    for name in ("__init__.py", "_from_json.py"):
+        h.update((DATA_PATH / name).read_bytes())
+    # build the tables stored in the snapshot, or the store format
+    for name in (
+        "main.py",
+        "oracles.py",
+        "dice.py",
+        "validate.py",
+        "search.py",
+        "links.py",
+        "ids.py",
+        "ruleset.py",
+        "store.py",
+    ):
+        h.update((Path(__file__).parent / name).read_bytes())
+    return h.digest()
+
+
+def snapshot_key(data: bytes) -> str:
+    """Return the cache key for the raw JSON `data` of a ruleset."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{SNAPSHOT_VERSION}:{sys.version_info[:2]}:".encode())
+    h.update(_module_digest())
+    h.update(data)
+    return h.hexdigest()
+
+
+def snapshot_path(ruleset: str, key: str) -> Path:
+    return cache_dir() / f"{ruleset}-{key}.pickle"
+
+
+@contextmanager
+def gc_paused():
+    """Pause the cyclic garbage collector while building large object graphs."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@cache
+def _interned_values() -> dict[type, dict]:
+    """Interned single-value wrapper classes, with their tables."""
+    from ._datasworn._from_json import INTERNED
+
+    return {
+        cls: table
+        for cls, table in INTERNED.items()
+        if [f.name for f in fields(cls)] == ["value"]
+    }
+
+
+class _Pickler(pickle.Pickler):
+    """Store interned wrappers by value, so that they are shared again with
+    the other rulesets when the snapshot is loaded."""
+
+    def persistent_id(self, obj: Any) -> Any:
+        if type(obj) in _interned_values():
+            return (type(obj).__name__, obj.value)
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        name, value = pid
+        cls = getattr(_datasworn, name)
+        table = _interned_values()[cls]
+        obj = table.get(value)
+        if obj is None:
+            obj = table[value] = cls(value)
+        return obj
+
+
+def dumps(payload: Any) -> bytes:
+    file = io.BytesIO()
+    _Pickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(payload)
+    return file.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    return _Unpickler(io.BytesIO(data)).load()
+
+
+def load_snapshot(ruleset: str, key: str) -> Any | None:
+    path = snapshot_path(ruleset, key)
+    try:
+        with path.open("rb") as file, gc_paused():
+            return _Unpickler(file).load()
+    except FileNotFoundError:
+        return None
+    except READ_ERRORS as exc:
+        log.warning(f"Ignoring unreadable snapshot {path}: {exc}")
+        return None
+
+
+def save_snapshot(ruleset: str, key: str, payload: Any) -> None:
+    path = snapshot_path(ruleset, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # remove stale snapshots of this ruleset
+        for stale in path.parent.glob(f"{ruleset}-*.pickle"):
+            stale.unlink(missing_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as file:
+            _Pickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(payload)
+        tmp.replace(path)
+    except WRITE_ERRORS as exc:
+        log.warning(f"Could not write snapshot {path}: {exc}")
+
+
+def clear_snapshots() -> int:
+    """Remove all snapshots and stores, returning the number of files deleted."""
+    n = 0
+    for pattern in ("*.pickle", "*.store"):
+        for path in cache_dir().glob(pattern):
+            path.unlink(missing_ok=True)
+            n += 1
+    return n
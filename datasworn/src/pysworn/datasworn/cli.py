@@ -1,4 +1,6 @@
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
+from dataclasses import fields, is_dataclass
 
 # from io import StringIO
 from typing import Annotated
@@ -30,35 +32,85 @@ console = Console()
 app = typer.Typer(no_args_is_help=True)
 
 
+def _shared_objects(roots) -> tuple[Counter, Counter, Counter]:
+    """Walk the model graph and count references, distinct objects and bytes
+    of the distinct objects per class."""
+    refs, distinct, size = Counter(), Counter(), Counter()
+    seen = set()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+            continue
+        if not is_dataclass(obj):
+            continue
+        name = type(obj).__name__
+        refs[name] += 1
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        distinct[name] += 1
+        size[name] += sys.getsizeof(obj) + sum(
+            sys.getsizeof(getattr(obj, f.name)) for f in fields(obj)
+        )
+        stack.extend(getattr(obj, f.name) for f in fields(obj))
+    return refs, distinct, size
+
+
+def _memory_report() -> None:
+    from ._datasworn._from_json import INTERNED
+
+    if not INTERNED:
+        print("No interned classes; build a frozen model with `codegen --frozen`.")
+        return
+    refs, distinct, size = _shared_objects(rules.values())
+    table = Table("Class", "References", "Objects", "Deduplicated", "Saved (kB)")
+    for cls in INTERNED:
+        name = cls.__name__
+        saved = refs[name] - distinct[name]
+        avg = size[name] / distinct[name] if distinct[name] else 0
+        table.add_row(
+            name,
+            repr(refs[name]),
+            repr(distinct[name]),
+            f"[bold]{saved!r}[/bold]",
+            f"{saved * avg / 1e3:.0f}",
+        )
+    print(table)
+
+
 @app.command()
 def count(
     verbose: Annotated[bool, typer.Option("--verbose", "-v")] = False,
+    memory: Annotated[
+        bool, typer.Option("--memory", "-m", help="Report interned objects.")
+    ] = False,
 ) -> None:
     """Count IDs by prefix."""
-    counts = []
-    counts_by_ruleset = defaultdict(list)
+    if memory:
+        _memory_report()
+        return
 
-    for k, v in index.items():
-        if verbose:
+    if verbose:
+        for k, v in index.items():
             print(k, type(v))
             print(Inspect(v, max_depth=1, max_length=1, max_string=100))
-        sk = k.split(":")
-        counts.append(sk[0])
 
-        if len(sk) < 2:
-            ruleset = sk[0]
-        else:
-            ruleset = sk[1].split("/")[0]
-        counts_by_ruleset[ruleset].append(sk[0])
+    counts = Counter()
+    for ruleset in RULESETS:
+        for t in index.types(ruleset):
+            counts[t] += len(index.by_type(t, ruleset=ruleset))
 
     table = Table("Type", "Total", *RULESETS)
-    for t in Counter(counts).most_common():
-        k = t[0]
-        v = t[1]
+    for k, v in counts.most_common():
         table.add_row(
             k,
             f"[bold]{repr(v)}[/bold]",
-            *[repr(counts_by_ruleset[ruleset].count(k)) for ruleset in RULESETS],
+            *[repr(len(index.by_type(k, ruleset=ruleset))) for ruleset in RULESETS],
         )
     print(table)
 
@@ -82,7 +134,7 @@ def ids(
     from .main import id_tree
 
     if tree:
-        print(id_tree)
+        print(dict(id_tree))
         return
 
     for k in index.keys():
@@ -114,11 +166,39 @@ def names():
     # print(counts.most_common())
 
 
+@app.command("breadcrumbs")
+def breadcrumbs_(
+    format: Annotated[
+        str, typer.Option("--format", "-f", help="Output format: text or jsonl.")
+    ] = "text",
+    ruleset: Annotated[list[str] | None, typer.Option("--ruleset", "-r")] = None,
+):
+    """Export the breadcrumbs of all indexed IDs."""
+    import orjson
+
+    from .main import server
+
+    if format not in ("text", "jsonl"):
+        raise typer.BadParameter(f"Unknown format: {format}")
+    for name in ruleset or []:
+        if name not in RULESETS:
+            raise typer.BadParameter(f"Unknown ruleset: {name}")
+
+    out = sys.stdout
+    for name in ruleset or RULESETS:
+        for id_, crumbs in server.load(name).breadcrumbs.items():
+            if format == "jsonl":
+                line = orjson.dumps({"id": id_, "breadcrumbs": crumbs})
+                out.write(line.decode() + "\n")
+            else:
+                out.write(f"{id_} --> {' > '.join(crumbs)}\n")
+
+
 @app.command()
 def dump():
     for ruleset in rules:
         print(Rule(ruleset))
-        for category in vars(rules[ruleset]):
+        for category in [f.name for f in fields(rules[ruleset])]:
             print(f"  {category}")
             p = Inspect(
                 getattr(rules[ruleset], category),
@@ -136,6 +216,353 @@ def rules_():
         print(rules[ruleset].rules)
 
 
+@app.command()
+def roll(
+    oracle_id: str,
+    n: Annotated[int, typer.Option("--times", "-n")] = 1,
+    seed: Annotated[int | None, typer.Option("--seed", "-s")] = None,
+    workers: Annotated[int | None, typer.Option("--workers", "-w")] = None,
+):
+    """Roll an oracle and resolve nested rolls and templates."""
+    from .main import row_tables
+    from .resolver import resolve_many
+
+    if oracle_id not in row_tables:
+        raise typer.BadParameter(f"Unknown oracle: {oracle_id}")
+    for result in resolve_many(oracle_id, n, seed=seed, workers=workers):
+        print(f"[dim]{result.roll:>3}[/] {result}")
+
+
+@app.command("oracle-stats")
+def oracle_stats_(
+    oracle_id: Annotated[str | None, typer.Argument()] = None,
+    ruleset: Annotated[list[str] | None, typer.Option("--ruleset", "-r")] = None,
+    all_rolls: Annotated[
+        bool, typer.Option("--all-rolls", "-a", help="Follow non-auto rolls too.")
+    ] = False,
+):
+    """Show exact row probabilities of one oracle or statistics of all."""
+    import time
+
+    from .analysis import expected_rows, oracle_stats, row_probabilities
+    from .main import row_tables, ruleset_of
+
+    if oracle_id is not None:
+        if oracle_id not in row_tables:
+            raise typer.BadParameter(f"Unknown oracle: {oracle_id}")
+        expected = expected_rows(oracle_id, auto_only=not all_rolls)
+        table = Table("Row", "Probability", "Expected", title=oracle_id)
+        own = set()
+        for row, p in zip(index[oracle_id].rows, row_probabilities(oracle_id)):
+            id_ = row.id.value
+            own.add(id_)
+            n = expected.get(id_, 0.0)
+            table.add_row(id_, f"{p} ({float(p):.2%})", f"{n:.4f}")
+        for id_, n in expected.items():
+            if id_ not in own:
+                table.add_row(f"[dim]{id_}", "", f"{n:.4f}")
+        print(table)
+        return
+
+    for name in ruleset or []:
+        if name not in RULESETS:
+            raise typer.BadParameter(f"Unknown ruleset: {name}")
+    names = set(ruleset or RULESETS)
+    ids = [id_ for id_ in row_tables if ruleset_of(id_) in names]
+    t0 = time.perf_counter()
+    stats = oracle_stats(ids, auto_only=not all_rolls)
+    t1 = time.perf_counter()
+
+    table = Table("Oracle", "Dice", "Rows", "Coverage", "Top row", "Expected rows")
+    for s in stats:
+        table.add_row(
+            s.oracle_id,
+            s.dice,
+            repr(s.rows),
+            f"{s.coverage:.1%}",
+            f"{s.top:.1%}",
+            f"{s.expected:.2f}",
+        )
+    print(table)
+    log.info(f"Analyzed {len(stats)} oracles in {t1 - t0:.3f} seconds")
+
+
+@app.command()
+def validate(
+    ruleset: Annotated[list[str] | None, typer.Option("--ruleset", "-r")] = None,
+    strict: Annotated[
+        bool, typer.Option("--strict", help="Exit with status 1 on any issue.")
+    ] = False,
+):
+    """Check oracle row ranges, row IDs and links of all rulesets."""
+    import time
+
+    from .main import server
+    from .validate import check_ruleset
+
+    for name in ruleset or []:
+        if name not in RULESETS:
+            raise typer.BadParameter(f"Unknown ruleset: {name}")
+    server.preload()
+
+    t0 = time.perf_counter()
+    found = [
+        issue
+        for name in ruleset or RULESETS
+        for issue in check_ruleset(server.load(name).index, index)
+    ]
+    t1 = time.perf_counter()
+
+    table = Table("Kind", "ID", "Issue")
+    for issue in found:
+        table.add_row(issue.kind, issue.id, issue.message)
+    if found:
+        print(table)
+    log.info(f"Found {len(found)} issues in {t1 - t0:.3f} seconds")
+    if strict and found:
+        raise typer.Exit(1)
+
+
+@app.command("search")
+def search_(
+    query: str,
+    limit: Annotated[int, typer.Option("--limit", "-n")] = 20,
+    ruleset: Annotated[list[str] | None, typer.Option("--ruleset", "-r")] = None,
+    type_: Annotated[list[str] | None, typer.Option("--type", "-t")] = None,
+):
+    """Search names, texts and tags of all rules."""
+    import time
+
+    from .main import server
+    from .search import search
+
+    for name in ruleset or []:
+        if name not in RULESETS:
+            raise typer.BadParameter(f"Unknown ruleset: {name}")
+    server.preload()
+
+    t0 = time.perf_counter()
+    hits = search(query, limit, ruleset, type_)
+    t1 = time.perf_counter()
+
+    table = Table("Score", "ID", "Breadcrumbs", title=query)
+    for hit in hits:
+        table.add_row(f"{hit.score:.2f}", hit.id, " > ".join(breadcrumbs(hit.id)))
+    print(table)
+    log.info(f"Found {len(hits)} hits in {t1 - t0:.4f} seconds")
+
+
+@app.command("backlinks")
+def backlinks_(
+    id_: Annotated[str, typer.Argument(metavar="ID")],
+    ruleset: Annotated[list[str] | None, typer.Option("--ruleset", "-r")] = None,
+):
+    """List the IDs that link to an ID."""
+    import time
+
+    from .links import backlinks
+    from .main import server
+
+    for name in ruleset or []:
+        if name not in RULESETS:
+            raise typer.BadParameter(f"Unknown ruleset: {name}")
+    server.preload()
+    if id_ not in index:
+        raise typer.BadParameter(f"Unknown ID: {id_}")
+
+    t0 = time.perf_counter()
+    found = backlinks(id_, ruleset)
+    t1 = time.perf_counter()
+
+    table = Table("ID", "Breadcrumbs", title=id_)
+    for source in found:
+        table.add_row(source, " > ".join(breadcrumbs(source)))
+    print(table)
+    log.info(f"Found {len(found)} backlinks in {t1 - t0:.4f} seconds")
+
+
+@app.command("cache")
+def cache_(
+    clear: Annotated[bool, typer.Option("--clear", "-c")] = False,
+):
+    """Show or clear the ruleset snapshot cache and stores."""
+    from . import cache
+
+    if clear:
+        print(f"Removed {cache.clear_snapshots()} snapshots")
+        return
+
+    print(
+        f"[b]{cache.cache_dir()}[/b] (enabled: {cache.cache_enabled()}, "
+        f"stores: {cache.store_enabled()})"
+    )
+    for pattern in ("*.pickle", "*.store"):
+        for path in sorted(cache.cache_dir().glob(pattern)):
+            print(f"  {path.name} {path.stat().st_size / 1e6:.1f} MB")
+
+
+@app.command()
+def codegen(
+    slots: Annotated[
+        bool | None,
+        typer.Option("--slots/--no-slots", help="Build slotted model classes."),
+    ] = None,
+    frozen: Annotated[
+        bool | None,
+        typer.Option("--frozen/--no-frozen", help="Build frozen model classes."),
+    ] = None,
+):
+    """Regenerate the specialized model constructors.
+
+    With --slots/--frozen the model dataclasses are rewritten first; options
+    not given keep their current setting.
+    """
+    from . import codegen
+
+    if slots is not None or frozen is not None:
+        options = codegen.model_options()
+        if slots is not None:
+            options["slots"] = slots
+        if frozen is not None:
+            options["frozen"] = frozen
+        print(f"Wrote {codegen.write_model(**options)} {options}")
+    print(f"Wrote {codegen.write()}")
+
+
+bench = typer.Typer(no_args_is_help=True, help="Run benchmarks.")
+app.add_typer(bench, name="bench")
+
+
+@bench.command("load")
+def bench_load(
+    repeat: Annotated[int, typer.Option("--repeat", "-n")] = 3,
+    use_cache: Annotated[bool, typer.Option("--cache/--no-cache")] = False,
+):
+    """Compare thread, process and serial loading of all rulesets."""
+    import os
+    import time
+
+    from .main import RulesServer
+
+    if not use_cache:
+        os.environ["PYSWORN_NO_CACHE"] = "1"
+
+    table = Table(
+        "Mode", "Best (s)", "Mean (s)", title=f"Load {len(RULESETS)} rulesets"
+    )
+    for mode in ("serial", "thread", "process"):
+        times = []
+        for _ in range(repeat):
+            server = RulesServer()
+            t0 = time.perf_counter()
+            server.preload(mode=mode)
+            times.append(time.perf_counter() - t0)
+        table.add_row(mode, f"{min(times):.3f}", f"{sum(times) / len(times):.3f}")
+    print(table)
+
+
+@bench.command("parse")
+def bench_parse(
+    repeat: Annotated[int, typer.Option("--repeat", "-n")] = 3,
+):
+    """Compare generic and specialized model construction per ruleset."""
+    import time
+
+    import orjson
+
+    from . import cache
+    from ._datasworn import RulesPackage, _from_json
+
+    table = Table("Ruleset", "Generic (s)", "Specialized (s)", "Speedup")
+    for ruleset in RULESETS:
+        data = orjson.loads((cache.DATA_PATH / f"{ruleset}.json").read_bytes())
+        best = {}
+        for specialized in (False, True):
+            if specialized:
+                _from_json.install()
+            else:
+                _from_json.uninstall()
+            times = []
+            for _ in range(repeat):
+                with cache.gc_paused():
+                    t0 = time.perf_counter()
+                    RulesPackage.from_json_data(data)
+                    times.append(time.perf_counter() - t0)
+            best[specialized] = min(times)
+        table.add_row(
+            ruleset,
+            f"{best[False]:.3f}",
+            f"{best[True]:.3f}",
+            f"{best[False] / best[True]:.1f}x",
+        )
+    _from_json.install()
+    print(table)
+
+
+@bench.command("memory")
+def bench_memory():
+    """Measure the memory held by the fully loaded index."""
+    import gc
+    import resource
+    import tracemalloc
+
+    from . import codegen
+    from .main import RulesServer
+
+    gc.collect()
+    tracemalloc.start()
+    server = RulesServer()
+    server.preload(mode="serial")
+    gc.collect()
+    traced, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    table = Table("Model", "Index IDs", "Traced (MB)", "Peak RSS (MB)")
+    table.add_row(
+        str(codegen.model_options()),
+        str(len(server.index)),
+        f"{traced / 1e6:.1f}",
+        f"{rss:.1f}",
+    )
+    print(table)
+
+
+@bench.command("roll")
+def bench_roll(
+    n: Annotated[int, typer.Option("--rolls", "-n")] = 1_000_000,
+    seed: Annotated[int, typer.Option("--seed", "-s")] = 0,
+):
+    """Roll all oracle_rollable tables, one roll at a time and in batches."""
+    import random
+    import time
+
+    from .main import row_tables
+
+    tables = [
+        row_tables[id_] for id_ in index.by_type("oracle_rollable") if id_ in row_tables
+    ]
+    per_table = n // len(tables)
+    rng = random.Random(seed)
+
+    t0 = time.perf_counter()
+    for table in tables:
+        for _ in range(per_table):
+            table.row_index(table.roll(rng))
+    single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for table in tables:
+        table.roll_many(per_table, rng)
+    batch = time.perf_counter() - t0
+
+    total = per_table * len(tables)
+    result = Table("Mode", "Time (s)", "Rolls/s", title=f"{total} rolls")
+    for mode, t in (("single", single), ("roll_many", batch)):
+        result.add_row(mode, f"{t:.3f}", f"{total / t:,.0f}")
+    print(result)
+
+
 @app.callback()
 def callback(
     log_level: Annotated[
@@ -0,0 +1,360 @@
+"""Generate specialized `from_json_data` constructors for the Datasworn model.
+
+The generated `_datasworn/__init__.py` deserializes every field through the
+generic `_from_json_data`, which inspects the type annotation with
+`get_origin`/`get_args` on every call. This module reads the model source once
+and emits `_datasworn/_from_json.py`, with one constructor per class in which
+the type dispatch is resolved at code generation time. `install()` in the
+generated module swaps them in behind the unchanged `from_json_data` API.
+In a frozen model, instances of the `INTERNED` classes are shared between
+identical JSON values.
+
+It can also rewrite the model's `@dataclass` decorators. The checked-in model
+is slotted and frozen, which drops the per-instance `__dict__` of the tens of
+thousands of loaded objects and lets the constructors intern; a plain build
+is kept for debugging.
+
+Run `datasworn codegen` after regenerating or patching the model.
+"""
+
+import ast
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+MODEL_PATH = Path(__file__).parent / "_datasworn" / "__init__.py"
+OUTPUT_PATH = Path(__file__).parent / "_datasworn" / "_from_json.py"
+
+PRIMITIVES = {"bool", "int", "float", "str", "object", "Any"}
+
+INTERNED = ("CSSColor", "DiceExpression", "Label", "MarkdownString", "SourceInfo")
+"""Classes whose instances are shared between identical JSON values. Only a
+frozen model interns them, so a shared instance cannot be modified in place;
+the `authors` list of a `SourceInfo` is shared too and must not be changed."""
+
+HEADER = """\
+# Code generated by pysworn.datasworn.codegen from _datasworn/__init__.py.
+# Do not edit, run `datasworn codegen` instead.
+# ruff: noqa
+"""
+
+
+@dataclass
+class ClassSpec:
+    name: str
+    kind: str
+    """One of "struct", "value", "enum" or "union"."""
+    args: list = field(default_factory=list)
+    """struct/value: constructor arguments as ("literal", value) or
+    ("field", type_node, json_key | None)."""
+    tag: str = ""
+    """union: name of the discriminator property."""
+    variants: dict[str, str] = field(default_factory=dict)
+    """union: discriminator value -> class name."""
+
+
+def _from_json_method(node: ast.ClassDef) -> ast.FunctionDef | None:
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef) and item.name == "from_json_data":
+            return item
+    return None
+
+
+def _parse_arg(arg: ast.expr):
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        return ("literal", arg.value)
+    if (
+        isinstance(arg, ast.Call)
+        and isinstance(arg.func, ast.Name)
+        and arg.func.id == "_from_json_data"
+        and len(arg.args) == 2
+    ):
+        type_node, source = arg.args
+        if isinstance(source, ast.Name) and source.id == "data":
+            return ("field", type_node, None)
+        if (
+            isinstance(source, ast.Call)
+            and isinstance(source.func, ast.Attribute)
+            and source.func.attr == "get"
+            and isinstance(source.args[0], ast.Constant)
+        ):
+            return ("field", type_node, source.args[0].value)
+    return None
+
+
+def _parse_class(node: ast.ClassDef) -> ClassSpec | None:
+    method = _from_json_method(node)
+    if method is None:
+        return None
+    body = method.body
+    bases = {base.id for base in node.bases if isinstance(base, ast.Name)}
+
+    # discriminated union: variants = {...}; return variants[data[tag]]...
+    if (
+        len(body) == 2
+        and isinstance(body[0], ast.AnnAssign)
+        and isinstance(body[0].value, ast.Dict)
+    ):
+        tag = body[1].value.func.value.slice.slice.value  # type: ignore[attr-defined]
+        variants = {
+            key.value: value.id  # type: ignore[union-attr]
+            for key, value in zip(body[0].value.keys, body[0].value.values)
+        }
+        return ClassSpec(node.name, "union", tag=tag, variants=variants)
+
+    if len(body) != 1 or not isinstance(body[0], ast.Return):
+        return None
+    call = body[0].value
+    if not (isinstance(call, ast.Call) and getattr(call.func, "id", "") == "cls"):
+        return None
+
+    if "Enum" in bases:
+        return ClassSpec(node.name, "enum")
+
+    args = [_parse_arg(arg) for arg in call.args]
+    if any(arg is None for arg in args):
+        return None
+    kind = "value" if len(args) == 1 and args[0][2] is None else "struct"
+    return ClassSpec(node.name, kind, args=args)
+
+
+def parse_model(source: str) -> list[ClassSpec]:
+    specs = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and (spec := _parse_class(node)):
+            specs.append(spec)
+    return specs
+
+
+class _Emitter:
+    def __init__(self, specs: list[ClassSpec], interned: tuple[str, ...]) -> None:
+        self.specs = {spec.name: spec for spec in specs}
+        self.interned = interned
+        self.names: set[str] = set()
+        self.uses_datetime = False
+
+    def convert(self, type_node: ast.expr, expr: str, depth: int = 0) -> str:
+        """Return an expression converting `expr` (which may be None)."""
+        if isinstance(type_node, ast.Constant):  # forward reference
+            type_node = ast.parse(type_node.value, mode="eval").body
+        if isinstance(type_node, ast.Name):
+            name = type_node.id
+            if name in PRIMITIVES:
+                return expr
+            if name == "datetime":
+                self.uses_datetime = True
+                return self._guard(expr, depth, lambda v: f"_model._parse_rfc3339({v})")
+            self.names.add(name)
+            spec = self.specs.get(name)
+            if spec is None:
+                return self._guard(expr, depth, lambda v: f"{name}.from_json_data({v})")
+            if spec.kind == "enum":
+                return self._guard(
+                    expr, depth, lambda v: f"(_{name}.get({v}) or {name}({v}))"
+                )
+            return self._guard(expr, depth, lambda v: f"_{name}({name}, {v})")
+
+        assert isinstance(type_node, ast.Subscript)
+        origin = type_node.value.id  # type: ignore[attr-defined]
+        inner = type_node.slice
+        if origin in ("Optional", "Union"):
+            if isinstance(inner, ast.Tuple):
+                inner = inner.elts[0]
+            return self.convert(inner, expr, depth)
+
+        item = f"_d{depth}"
+        if origin == "List":
+            element = self.convert(inner, item, depth + 1)
+            if element == item:
+                return self._guard(expr, depth, lambda v: f"list({v})")
+            return self._guard(expr, depth, lambda v: f"[{element} for {item} in {v}]")
+        if origin == "Dict":
+            value_type = inner.elts[1]  # type: ignore[attr-defined]
+            element = self.convert(value_type, item, depth + 1)
+            if element == item:
+                return self._guard(expr, depth, lambda v: f"dict({v})")
+            key = f"_k{depth}"
+            return self._guard(
+                expr,
+                depth,
+                lambda v: f"{{{key}: {element} for {key}, {item} in {v}.items()}}",
+            )
+        msg = f"Unsupported type annotation: {ast.unparse(type_node)}"
+        raise ValueError(msg)
+
+    @staticmethod
+    def _guard(expr: str, depth: int, convert: Callable[[str], str]) -> str:
+        """Return `convert(expr)`, passing None through like `_from_json_data`."""
+        if expr.isidentifier():
+            return f"(None if {expr} is None else {convert(expr)})"
+        var = f"_v{depth}"
+        return f"(None if ({var} := {expr}) is None else {convert(var)})"
+
+    def function(self, spec: ClassSpec) -> str:
+        if spec.kind == "union":
+            return (
+                f"def _{spec.name}(cls, data):\n"
+                f"    variant, from_json = _{spec.name}_variants[data[{spec.tag!r}]]\n"
+                f"    return from_json(variant, data)\n"
+            )
+
+        interned = spec.name in self.interned
+        indent = "        " if interned else "    "
+        lines = [f"def _{spec.name}(cls, data):"]
+        if interned:
+            key = "data" if spec.kind == "value" else "_freeze(data)"
+            lines.append(f"    key = {key}")
+            lines.append(f"    obj = _{spec.name}_interned.get(key)")
+            lines.append("    if obj is None:")
+        if spec.kind == "struct" and any(arg[0] == "field" for arg in spec.args):
+            lines.append(f"{indent}get = data.get")
+        args = []
+        for arg in spec.args:
+            if arg[0] == "literal":
+                args.append(repr(arg[1]))
+            elif arg[2] is None:
+                args.append(self.convert(arg[1], "data"))
+            else:
+                args.append(self.convert(arg[1], f"get({arg[2]!r})"))
+        ret = f"obj = _{spec.name}_interned[key] = cls" if interned else "return cls"
+        if spec.kind == "value":
+            lines.append(f"{indent}{ret}({args[0]})")
+        else:
+            lines.append(f"{indent}{ret}(")
+            lines.extend(f"{indent}    {arg}," for arg in args)
+            lines.append(f"{indent})")
+        if interned:
+            lines.append("    return obj")
+        return "\n".join(lines) + "\n"
+
+    def module(self) -> str:
+        functions = []
+        for spec in self.specs.values():
+            self.names.add(spec.name)
+            if spec.kind == "union":
+                self.names.update(spec.variants.values())
+            if spec.kind != "enum":
+                functions.append(self.function(spec))
+
+        out = [HEADER]
+        if self.uses_datetime:
+            out.append("import pysworn.datasworn._datasworn as _model\n")
+        out.append("from . import (")
+        out.extend(f"    {name}," for name in sorted(self.names))
+        out.append(")\n\n")
+
+        # enum value -> member lookup tables
+        for spec in self.specs.values():
+            if spec.kind == "enum":
+                out.append(f"_{spec.name} = {{m.value: m for m in {spec.name}}}")
+        out.append("")
+
+        # JSON value -> shared instance tables
+        interned = [name for name in self.interned if name in self.specs]
+        out.extend(f"_{name}_interned = {{}}" for name in interned)
+        out.append("\nINTERNED = {")
+        out.extend(f"    {name}: _{name}_interned," for name in interned)
+        out.append("}\n")
+
+        out.extend(f"\n{function}" for function in functions)
+
+        out.append("")
+        for spec in self.specs.values():
+            if spec.kind == "union":
+                out.append(f"_{spec.name}_variants = {{")
+                out.extend(
+                    f"    {k!r}: ({v}, _{v}),"
+                    if v in self.specs
+                    else f"    {k!r}: ({v}, _generic_from_json),"
+                    for k, v in spec.variants.items()
+                )
+                out.append("}")
+
+        out.append("\nSPECIALIZED = {")
+        out.extend(
+            f"    {spec.name}: _{spec.name},"
+            for spec in self.specs.values()
+            if spec.kind != "enum"
+        )
+        out.append("}\n")
+        out.append(INSTALL)
+        return "\n".join(out)
+
+
+INSTALL = '''
+def _generic_from_json(cls, data):
+    return cls.from_json_data(data)
+
+
+def _freeze(data):
+    """Return a hashable key for a JSON value."""
+    if isinstance(data, dict):
+        return tuple((k, _freeze(v)) for k, v in data.items())
+    if isinstance(data, list):
+        return tuple(_freeze(v) for v in data)
+    return data
+
+
+def clear_interned():
+    """Drop the shared instances, e.g. after the loaded rules are released."""
+    for table in INTERNED.values():
+        table.clear()
+
+
+_generic = {}
+
+
+def install():
+    """Replace `from_json_data` of every model class by its specialized version."""
+    for cls, func in SPECIALIZED.items():
+        _generic.setdefault(cls, cls.__dict__["from_json_data"])
+        cls.from_json_data = classmethod(func)
+
+
+def uninstall():
+    """Restore the generic `from_json_data` methods."""
+    for cls, method in _generic.items():
+        cls.from_json_data = method
+'''
+
+
+def generate(source: str | None = None) -> str:
+    """Return the source of the specialized constructor module."""
+    if source is None:
+        source = MODEL_PATH.read_text()
+    interned = INTERNED if model_options(source)["frozen"] else ()
+    return _Emitter(parse_model(source), interned).module()
+
+
+def write(path: Path = OUTPUT_PATH) -> Path:
+    path.write_text(generate())
+    return path
+
+
+DATACLASS_RE = re.compile(r"^@dataclass(?:\((?P<args>.*)\))?$", re.MULTILINE)
+
+
+def model_options(source: str | None = None) -> dict[str, bool]:
+    """Return the `slots` and `frozen` options the model is built with."""
+    if source is None:
+        source = MODEL_PATH.read_text()
+    match = DATACLASS_RE.search(source)
+    args = (match["args"] or "") if match else ""
+    return {
+        "slots": "slots=True" in args,
+        "frozen": "frozen=True" in args,
+    }
+
+
+def rewrite_model(source: str, *, slots: bool, frozen: bool) -> str:
+    """Return the model source with every `@dataclass` decorator set to the
+    given `slots` and `frozen` options."""
+    args = [f"{k}=True" for k, v in (("slots", slots), ("frozen", frozen)) if v]
+    decorator = f"@dataclass({', '.join(args)})" if args else "@dataclass"
+    return DATACLASS_RE.sub(decorator, source)
+
+
+def write_model(*, slots: bool, frozen: bool, path: Path = MODEL_PATH) -> Path:
+    path.write_text(rewrite_model(path.read_text(), slots=slots, frozen=frozen))
+    return path
@@ -0,0 +1,95 @@
+"""Cache of rendered rule content.
+
+Viewers and renderables turn the same rules into Markdown, markup or console
+output over and over. `content_cache` keeps the results keyed by `(rule ID,
+flavour, *variant)`, where the flavour names the output ("header", "rows",
+"ansi", ...) and the variant holds whatever else the output depends on, such
+as the width or the color system. The least recently used entries are
+evicted first; `warm()` renders ahead of time, e.g. in a worker thread.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from threading import Event, Lock
+from typing import Any
+
+
+class ContentCache:
+    """Thread-safe LRU cache of rendered content."""
+
+    def __init__(self, maxsize: int = 16384) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"<ContentCache {len(self)}/{self.maxsize} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def get(
+        self,
+        rule_id: str,
+        flavour: str,
+        render: Callable[[str], Any],
+        *variant: Hashable,
+    ) -> Any:
+        """Return the `flavour` content of `rule_id`, calling `render(rule_id)`
+        unless it is cached."""
+        key = (rule_id, flavour, *variant)
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            except KeyError:
+                self.misses += 1
+        # render outside the lock; a concurrent render of the same key wins
+        value = render(rule_id)
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def warm(
+        self,
+        rule_ids: Iterable[str],
+        flavour: str,
+        render: Callable[[str], Any],
+        *variant: Hashable,
+        cancel: Event | None = None,
+    ) -> int:
+        """Render the `flavour` content of `rule_ids` that is not cached yet,
+        stopping early when `cancel` is set; return the number rendered."""
+        count = 0
+        for rule_id in rule_ids:
+            if cancel is not None and cancel.is_set():
+                break
+            if (rule_id, flavour, *variant) in self._entries:
+                continue
+            self.get(rule_id, flavour, render, *variant)
+            count += 1
+        return count
+
+    def invalidate(self, rule_id: str | None = None) -> None:
+        """Drop the cached content of `rule_id`, or of everything."""
+        with self._lock:
+            if rule_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == rule_id]:
+                del self._entries[key]
+
+
+content_cache = ContentCache()
+"""Cache shared by the reference app and the renderables."""
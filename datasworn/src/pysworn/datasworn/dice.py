@@ -0,0 +1,93 @@
+"""Dice expressions such as `1d100`, `2d6` or `1d10+2`.
+
+`Dice.parse()` compiles a Datasworn `DiceExpression` once into its count,
+sides and modifier; compiled dice are cached and roll singly or in batches.
+"""
+
+import random
+import re
+from array import array
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from itertools import accumulate
+from typing import Any
+
+_DICE_RE = re.compile(r"(?P<count>\d*)d(?P<sides>\d+)(?P<modifier>[+-]\d+)?")
+
+
+@dataclass(frozen=True, slots=True)
+class Dice:
+    count: int
+    sides: int
+    modifier: int = 0
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def parse(cls, expression: str) -> "Dice":
+        """Return the compiled form of a `NdM[+K]` expression."""
+        match = _DICE_RE.fullmatch(expression.replace(" ", ""))
+        if match is None or match["sides"] == "0" or match["count"] == "0":
+            msg = f"Unsupported dice expression: {expression}"
+            raise ValueError(msg)
+        return cls(
+            int(match["count"] or 1),
+            int(match["sides"]),
+            int(match["modifier"] or 0),
+        )
+
+    def __str__(self) -> str:
+        modifier = f"{self.modifier:+d}" if self.modifier else ""
+        return f"{self.count}d{self.sides}{modifier}"
+
+    @property
+    def low(self) -> int:
+        return self.count + self.modifier
+
+    @property
+    def high(self) -> int:
+        return self.count * self.sides + self.modifier
+
+    def weights(self) -> list[int]:
+        """Return the number of ways to roll each total, lowest first."""
+        return list(_weights(self.count, self.sides))
+
+    def roll(self, rng: Any = random) -> int:
+        """Roll once with `rng` (a `random.Random` or the `random` module)."""
+        if self.count == 1:
+            return rng.randint(1, self.sides) + self.modifier
+        randint = rng.randint
+        return sum(randint(1, self.sides) for _ in range(self.count)) + self.modifier
+
+    def roll_many(self, n: int, rng: Any = random) -> array:
+        """Roll `n` times in one `choices()` call and return the totals."""
+        return array("i", self.sample(range(self.low, self.high + 1), n, rng))
+
+    def sample(self, population, n: int, rng: Any = random) -> list:
+        """Draw `n` items of `population`, which holds one item per total from
+        `low` to `high`, with the probability of rolling that total."""
+        if self.count == 1:
+            return rng.choices(population, k=n)
+        cum_weights = _cum_weights(self.count, self.sides)
+        return rng.choices(population, cum_weights=cum_weights, k=n)
+
+
+@cache
+def _weights(count: int, sides: int) -> tuple[int, ...]:
+    weights = [1]
+    for _ in range(count):
+        new = [0] * (len(weights) + sides - 1)
+        for i, w in enumerate(weights):
+            for j in range(sides):
+                new[i + j] += w
+        weights = new
+    return tuple(weights)
+
+
+@cache
+def _cum_weights(count: int, sides: int) -> tuple[int, ...]:
+    return tuple(accumulate(_weights(count, sides)))
+
+
+def parse(expression: Any) -> Dice:
+    """Return the compiled `Dice` of a `DiceExpression` or string."""
+    return Dice.parse(getattr(expression, "value", expression))
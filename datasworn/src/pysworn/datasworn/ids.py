@@ -0,0 +1,81 @@
+"""Integer numbers for rule IDs.
+
+Every ruleset gets an `IdTable` when it is indexed: its IDs numbered densely
+in index order, with the parent and the type of each ID stored in parallel
+integer arrays. Search indexes and link graphs refer to IDs by these numbers
+instead of keeping lists of strings of their own.
+
+Across rulesets, an ID is numbered `ruleset position << RULESET_SHIFT | local
+number`, so converting between IDs and numbers never loads another ruleset;
+see `main.id_table`.
+"""
+
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+
+NO_ID = -1
+"""Number of the missing parent of a ruleset."""
+
+RULESET_SHIFT = 24
+"""Bits of an ID number that hold its number within the ruleset."""
+
+LOCAL_MASK = (1 << RULESET_SHIFT) - 1
+
+
+@dataclass(slots=True)
+class IdTable:
+    ruleset: str
+    ids: list[str]
+    """IDs, numbered by position."""
+    numbers: dict[str, int]
+    """ID -> number."""
+    parents: array
+    """Number of the parent of each ID, `NO_ID` for the ruleset itself."""
+    types: array
+    """Position in `type_names` of the type of each ID."""
+    type_names: list[str]
+
+    @classmethod
+    def build(
+        cls,
+        ruleset: str,
+        index: Mapping[str, object],
+        parents: Mapping[str, str | None],
+        type_of: Callable[[str], str],
+    ) -> "IdTable":
+        """Number the IDs of `index` and look up their parents and types."""
+        ids = list(index)
+        numbers = {id_: n for n, id_ in enumerate(ids)}
+        type_numbers: dict[str, int] = {}
+        types = array("H")
+        for id_ in ids:
+            types.append(type_numbers.setdefault(type_of(id_), len(type_numbers)))
+        parent_numbers = array(
+            "i", (numbers.get(parents.get(id_), NO_ID) for id_ in ids)
+        )
+        return cls(ruleset, ids, numbers, parent_numbers, types, list(type_numbers))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, n: int) -> str:
+        return self.ids[n]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.numbers
+
+    def number(self, id_: str) -> int:
+        """Return the number of `id_`, raising `KeyError` if it is unknown."""
+        return self.numbers[id_]
+
+    def parent(self, n: int) -> int:
+        """Return the number of the parent of ID number `n`, or `NO_ID`."""
+        return self.parents[n]
+
+    def type(self, n: int) -> str:
+        """Return the type prefix of ID number `n`."""
+        return self.type_names[self.types[n]]
@@ -0,0 +1,96 @@
+"""Reverse references between rules.
+
+Every ruleset gets a `LinkGraph` when it is indexed, built from the same
+references `validate.check_ruleset()` follows: Markdown links and template
+placeholders, ID fields such as `suggestions`, `replaces`, `enhances` and
+the theme, domain, region and NPC of delve sites, and tag values that are
+IDs. The graph is stored the other way round, as one sorted list of linked
+IDs and integer adjacency arrays, so `backlinks()` answers "what links
+here" with a binary search per ruleset.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from .ids import IdTable
+from .validate import references
+
+
+@cache
+def _wildcard(pattern: str) -> re.Pattern[str]:
+    """Compile an ID wildcard: `*` matches one key, `/**` any number of keys."""
+    escaped = re.escape(pattern)
+    escaped = escaped.replace(r"/\*\*", r"(?:/[^/.]+)*").replace(r"\*", r"[^/.]+")
+    return re.compile(escaped)
+
+
+@dataclass(slots=True)
+class LinkGraph:
+    ids: IdTable
+    """Numbers of the IDs of the ruleset."""
+    targets: list[str]
+    """All linked IDs and wildcards, sorted."""
+    offsets: array
+    """The sources linking to `targets[i]` are `links[offsets[i]:offsets[i + 1]]`."""
+    links: array
+    """Numbers of the linking IDs, grouped by target."""
+    wildcards: array
+    """Positions of the targets that are wildcards."""
+
+    @classmethod
+    def build(cls, index: dict[str, Any], ids: IdTable) -> "LinkGraph":
+        """Collect the references of every object in `index`."""
+        by_target: dict[str, list[int]] = {}
+        for id_, obj in index.items():
+            refs = dict.fromkeys(references(obj))
+            refs.pop(id_, None)
+            if not refs:
+                continue
+            source = ids.number(id_)
+            for ref in refs:
+                by_target.setdefault(ref, []).append(source)
+
+        targets = sorted(by_target)
+        offsets = array("i", [0])
+        links = array("i")
+        for target in targets:
+            links.extend(by_target[target])
+            offsets.append(len(links))
+        wildcards = array("i", (i for i, t in enumerate(targets) if "*" in t))
+        return cls(ids, targets, offsets, links, wildcards)
+
+    def _sources(self, i: int) -> list[str]:
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return [self.ids[j] for j in self.links[start:stop]]
+
+    def linking_to(self, id_: str) -> list[str]:
+        """Return the IDs that link to `id_`, directly or through a wildcard."""
+        found = []
+        i = bisect_left(self.targets, id_)
+        if i < len(self.targets) and self.targets[i] == id_:
+            found.extend(self._sources(i))
+        for i in self.wildcards:
+            if _wildcard(self.targets[i]).fullmatch(id_):
+                found.extend(self._sources(i))
+        return found
+
+
+def backlinks(id_: str, ruleset: str | list[str] | None = None) -> list[str]:
+    """Return the IDs that link to `id_`, from all (or the given) rulesets,
+    loading them as needed."""
+    from .main import server
+
+    if ruleset is None:
+        rulesets = server.rulesets
+    elif isinstance(ruleset, str):
+        rulesets = [ruleset]
+    else:
+        rulesets = ruleset
+    found = {}
+    for name in rulesets:
+        found.update(dict.fromkeys(server.load(name).links.linking_to(id_)))
+    return list(found)
@@ -1,9 +1,14 @@
+import re
+import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import warnings
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import fields, is_dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Any
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Literal
 
 import orjson as json
 import pysworn.datasworn._datasworn as _datasworn
@@ -11,8 +16,12 @@ import typer
 from rich import print
 from rich.console import Console
 
+from . import cache, links, oracles, search, store, validate
 from ._datasworn import *  # noqa
+from ._datasworn import _from_json
+from .ids import LOCAL_MASK, NO_ID, RULESET_SHIFT, IdTable
 from .logging import log
+from .ruleset import RulesetData
 
 console = Console()
 
@@ -25,6 +34,9 @@ def _parse_rfc3339(s: str) -> datetime:
 
 
 _datasworn._parse_rfc3339 = _parse_rfc3339
+_from_json.install()
+
+LoadMode = Literal["thread", "process", "serial"]
 
 RULESETS = [
     "classic",
@@ -80,44 +92,71 @@ TYPE_TITLES = {
 }
 
 
-index: dict[str, Any] = {}
-id_tree: dict[str, dict] = {}
-rules: dict[str, _datasworn.RulesPackage] = {}
+_ID_RE = re.compile(
+    r"(?:datasworn:)?"
+    r"(?:(?P<type>[a-z_.]++):)?"
+    r"(?P<ruleset>[\w*]++)"
+    r"(?P<path>(?:/(?P<category>[^/.]*+)[^/]*+)?(?:/(?P<subcategory>[^/.]*+))?[^:]*+)"
+)
+"""Datasworn ID: `[datasworn:]type.subtype:ruleset/category/subcategory...`.
+Category and subcategory stop at the first dot, wildcards are kept as is."""
 
 
 class ParsedId:
+    """The parts of a Datasworn ID, e.g. `oracle_rollable.row:starforged/core/
+    action.0` has type `oracle_rollable.row`, ruleset `starforged`, category
+    `core` and subcategory `action`. A bare ruleset ID has type `source`.
+
+    Instances compare and hash by ID and must not be modified; use
+    `ParsedId.parse()` to share them between calls.
+    """
+
+    __slots__ = ("_path", "category", "id", "ruleset", "subcategory", "type")
+
+    id: str
+    type: str
     ruleset: str
+    category: str | None
+    subcategory: str | None
 
     def __init__(self, id_: str) -> None:
-        self.id: str = id_
-        self.type: str = "ruleset"
-        self.ruleset: str
-        self.category: str | None = None
-        self.subcategory: str | None = None
-
-        if id_.startswith("datasworn:"):
-            id_ = id_[10:]
-
-        if ":" in id_:
-            self.type, path = id_.split(":")
-            if len(pp := path.split("/")) < 3:
-                self.ruleset, self.category = pp
-            else:
-                self.ruleset, self.category, self.subcategory, *_ = pp
-        elif id_ in RULESETS:
-            self.ruleset = id_
-            self.type = "source"
-        else:
+        match = _ID_RE.fullmatch(id_)
+        if match is None or (match["type"] is None and match["path"]):
             msg = f"Could not parse id: {id_}"
             raise KeyError(msg)
+        self.id = id_
+        self.type, self.ruleset, self.category, self.subcategory, self._path = (
+            match.group("type", "ruleset", "category", "subcategory", "path")
+        )
+        if self.type is None:
+            if self.ruleset not in RULESETS:
+                msg = f"Could not parse id: {id_}"
+                raise KeyError(msg)
+            self.type = "source"
 
-        if self.category:
-            self.category = self.category.split(".")[0]
+    @classmethod
+    @lru_cache(maxsize=2**16)
+    def parse(cls, id_: str) -> "ParsedId":
+        """Return the (cached) parsed `id_`."""
+        return cls(id_)
+
+    @property
+    def container(self) -> str | None:
+        """ID of the object an embedded object (row, ability, ...) belongs to,
+        e.g. `oracle_rollable:starforged/core/action` for the row above."""
+        if "." not in self.type:
+            return None
+        type_, _ = self.type.rsplit(".", 1)
+        path, _ = f"{self.ruleset}{self._path}".rsplit(".", 1)
+        return f"{type_}:{path}"
 
-        if self.subcategory:
-            self.subcategory = self.subcategory.split(".")[0]
-        else:
-            pass
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedId):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
 
     def __repr__(self):
         return f"<ParsedId {self.type}:{self.ruleset}/{self.category}>"
@@ -129,7 +168,10 @@ class ParsedId:
         )
 
 
-def add_to_index(ids, index, obj):
+def add_to_index(ids, index, obj, parents=None, parent=None):
+    """Add `obj` and everything below it with an ID to `index` and the nested
+    `ids` tree, and record the nearest identified ancestor of each ID in
+    `parents`."""
     ids_ = ids
     if hasattr(obj, "id"):  # and isinstance(obj.id, IDType):
         key = str(obj.id.value)
@@ -139,67 +181,439 @@ def add_to_index(ids, index, obj):
         index[key] = obj
         ids[key] = {}
         ids_ = ids[key]
+        if parents is not None:
+            parents[key] = parent
+        parent = key
 
     match obj:
         case obj if is_dataclass(obj):
             for field in fields(obj):
                 # if hasattr(obj, field):
                 vv = getattr(obj, field.name)
-                add_to_index(ids_, index, vv)
+                add_to_index(ids_, index, vv, parents, parent)
 
         case dict():
             for field, v in obj.items():
-                add_to_index(ids_, index, v)
+                add_to_index(ids_, index, v, parents, parent)
 
         case list():
             for v in obj:
-                add_to_index(ids_, index, v)
+                add_to_index(ids_, index, v, parents, parent)
+
+
+def _type_of(id_: str) -> str:
+    """Return the type prefix of an index key (the ruleset for a ruleset)."""
+    return id_.split(":", 1)[0]
+
+
+def ruleset_of(id_: str) -> str:
+    """Return the ruleset an index key belongs to."""
+    if ":" not in id_:
+        return id_
+    return id_.split(":", 1)[1].split("/", 1)[0]
+
+
+class LazyRules(Mapping[str, _datasworn.RulesPackage]):
+    """Ruleset ID -> RulesPackage, loading each ruleset on first access."""
+
+    def __init__(self, server: "RulesServer") -> None:
+        self._server = server
+
+    def __getitem__(self, ruleset: str) -> _datasworn.RulesPackage:
+        if ruleset not in self._server.rulesets:
+            raise KeyError(ruleset)
+        return self._server.load(ruleset).package
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._server.rulesets)
+
+    def __len__(self) -> int:
+        return len(self._server.rulesets)
+
+    def __contains__(self, ruleset: object) -> bool:
+        return ruleset in self._server.rulesets
+
+    def __repr__(self) -> str:
+        return f"<LazyRules {self._server.rulesets}>"
+
+
+class LazyIndex(Mapping[str, Any]):
+    """ID -> rule object, loading the ruleset of an ID on first access."""
+
+    _field = "index"
+    """Name of the mapping in the loaded `RulesetData`."""
+
+    def __init__(self, server: "RulesServer") -> None:
+        self._server = server
+
+    def __getitem__(self, id_: str) -> Any:
+        ruleset = ruleset_of(id_)
+        if ruleset not in self._server.rulesets:
+            raise KeyError(id_)
+        return getattr(self._server.load(ruleset), self._field)[id_]
+
+    def __contains__(self, id_: object) -> bool:
+        if not isinstance(id_, str):
+            return False
+        ruleset = ruleset_of(id_)
+        if ruleset not in self._server.rulesets:
+            return False
+        return id_ in getattr(self._server.load(ruleset), self._field)
+
+    def __iter__(self) -> Iterator[str]:
+        for ruleset in self._server.rulesets:
+            yield from getattr(self._server.load(ruleset), self._field)
+
+    def __len__(self) -> int:
+        return sum(
+            len(getattr(self._server.load(r), self._field))
+            for r in self._server.rulesets
+        )
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self._server.loaded}>"
+
+    def _rulesets(self, ruleset: str | None) -> list[str]:
+        if ruleset is None:
+            return self._server.rulesets
+        if ruleset not in self._server.rulesets:
+            raise KeyError(ruleset)
+        return [ruleset]
+
+    def types(self, ruleset: str | None = None) -> list[str]:
+        """Return the type prefixes of all (or one ruleset's) IDs."""
+        types = {}
+        for r in self._rulesets(ruleset):
+            types.update(dict.fromkeys(self._server.load(r).types))
+        return list(types)
+
+    def by_type(self, type_: str, ruleset: str | None = None) -> list[str]:
+        """Return the IDs with type prefix `type_`, e.g.
+        `index.by_type("oracle_rollable", ruleset="starforged")`."""
+        ids = []
+        for r in self._rulesets(ruleset):
+            ids.extend(self._server.load(r).types.get(type_, ()))
+        return ids
+
+    def by_ruleset(self, ruleset: str) -> Mapping[str, Any]:
+        """Return the ID -> rule object mapping of one ruleset."""
+        return self._server.load(self._rulesets(ruleset)[0]).index
+
+
+class LazyParents(LazyIndex):
+    """ID -> ID of its nearest identified ancestor (None for a ruleset)."""
+
+    _field = "parents"
+
+
+class LazyBreadcrumbs(LazyIndex):
+    """ID -> precomputed breadcrumb trail, see `breadcrumbs()`."""
+
+    _field = "breadcrumbs"
+
+
+class LazyRowTables(LazyIndex):
+    """Oracle ID -> `oracles.RowTable` of each rollable oracle table."""
+
+    _field = "row_tables"
+
+
+class LazyIssues(LazyIndex):
+    """ID -> `validate.Issue`s found in that object when it was indexed."""
+
+    _field = "issues"
+
+
+class LazyIdTree(Mapping[str, dict]):
+    """Ruleset ID -> nested dict of child IDs, loading rulesets on access."""
+
+    def __init__(self, server: "RulesServer") -> None:
+        self._server = server
+
+    def __getitem__(self, ruleset: str) -> dict:
+        if ruleset not in self._server.rulesets:
+            raise KeyError(ruleset)
+        return self._server.load(ruleset).tree[ruleset]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._server.rulesets)
+
+    def __len__(self) -> int:
+        return len(self._server.rulesets)
+
+    def __repr__(self) -> str:
+        return f"<LazyIdTree {self._server.loaded}>"
+
+
+class LazyIdTable:
+    """Numbers of the IDs of all rulesets, see `ids.IdTable`, loading the
+    ruleset of an ID or number on first access."""
+
+    def __init__(self, server: "RulesServer") -> None:
+        self._server = server
+        self._positions = {r: i for i, r in enumerate(server.rulesets)}
+
+    def table(self, ruleset: str) -> IdTable:
+        """Return the `IdTable` of one ruleset."""
+        if ruleset not in self._server.rulesets:
+            raise KeyError(ruleset)
+        return self._server.load(ruleset).ids
+
+    def _split(self, n: int) -> tuple[int, IdTable, int]:
+        position = n >> RULESET_SHIFT
+        if n < 0 or position >= len(self._server.rulesets):
+            raise KeyError(n)
+        table = self._server.load(self._server.rulesets[position]).ids
+        return position << RULESET_SHIFT, table, n & LOCAL_MASK
+
+    def number(self, id_: str) -> int:
+        """Return the number of `id_`, raising `KeyError` if it is unknown."""
+        ruleset = ruleset_of(id_)
+        if (position := self._positions.get(ruleset)) is None:
+            raise KeyError(id_)
+        return position << RULESET_SHIFT | self._server.load(ruleset).ids.number(id_)
+
+    def id(self, n: int) -> str:
+        """Return the ID numbered `n`."""
+        _, table, local = self._split(n)
+        return table[local]
+
+    def parent(self, n: int) -> int:
+        """Return the number of the parent of ID number `n`, or `NO_ID`."""
+        base, table, local = self._split(n)
+        parent = table.parent(local)
+        return NO_ID if parent == NO_ID else base | parent
+
+    def type(self, n: int) -> str:
+        """Return the type prefix of ID number `n`."""
+        _, table, local = self._split(n)
+        return table.type(local)
+
+    def ruleset(self, n: int) -> str:
+        """Return the ruleset of ID number `n`."""
+        return self._split(n)[1].ruleset
+
+    def __contains__(self, id_: object) -> bool:
+        ruleset = ruleset_of(id_) if isinstance(id_, str) else None
+        return ruleset in self._server.rulesets and id_ in self.table(ruleset)
+
+    def __len__(self) -> int:
+        return sum(len(self.table(r)) for r in self._server.rulesets)
+
+    def __repr__(self) -> str:
+        return f"<LazyIdTable {self._server.loaded}>"
 
 
 class RulesServer:
-    def load_rules(self, ruleset_path: str) -> _datasworn.RulesPackage:
-        path = Path(__file__).parent.absolute()
-        with Path(path / "_datasworn" / ruleset_path).open("rt") as file:
-            rules_dict = json.loads(file.read())
-        return rules_dict
+    """Loads rulesets on demand and serves them through lazy mappings.
+
+    `rules`, `index`, `id_tree`, `parents` and `breadcrumbs` load a ruleset
+    the first time one of its IDs (or the ruleset key) is touched. Call `preload()` to load
+    everything up front, in parallel.
+    """
+
+    def _build_ruleset(self, data: bytes) -> RulesetData:
+        rules_package = _datasworn.RulesPackage.from_json_data(json.loads(data))
+        ruleset_index: dict[str, Any] = {}
+        ruleset_tree: dict[str, dict] = {}
+        ruleset_parents: dict[str, str | None] = {}
+        add_to_index(ruleset_tree, ruleset_index, rules_package, ruleset_parents)
+        ruleset_breadcrumbs = {
+            id_: _build_breadcrumbs(id_, ruleset_index, ruleset_parents)
+            for id_ in ruleset_index
+        }
+        ruleset_types: dict[str, list[str]] = {}
+        for id_ in ruleset_index:
+            ruleset_types.setdefault(_type_of(id_), []).append(id_)
+        ruleset_row_tables = {
+            id_: oracles.build_row_table(obj)
+            for id_, obj in ruleset_index.items()
+            if oracles.is_rollable(obj)
+        }
+        ruleset_issues: dict[str, list[validate.Issue]] = {}
+        for issue in validate.check_ruleset(ruleset_index):
+            log.debug(f"Invalid ruleset data: {issue}")
+            ruleset_issues.setdefault(issue.id, []).append(issue)
+        if ruleset_issues:
+            log.debug(
+                f"{sum(map(len, ruleset_issues.values()))} issues in ruleset "
+                f"{rules_package.id.value}; see `datasworn validate`"
+            )
+        ruleset_ids = IdTable.build(
+            rules_package.id.value, ruleset_index, ruleset_parents, _type_of
+        )
+        ruleset_search = search.SearchIndex.build(ruleset_index, ruleset_ids)
+        ruleset_links = links.LinkGraph.build(ruleset_index, ruleset_ids)
+        return RulesetData(
+            package=rules_package,
+            index=ruleset_index,
+            tree=ruleset_tree,
+            parents=ruleset_parents,
+            breadcrumbs=ruleset_breadcrumbs,
+            types=ruleset_types,
+            row_tables=ruleset_row_tables,
+            issues=ruleset_issues,
+            search=ruleset_search,
+            links=ruleset_links,
+            ids=ruleset_ids,
+        )
 
-    def _load_ruleset(self, ruleset: str):
+    def _load_ruleset(self, ruleset: str) -> RulesetData | store.StoreSnapshot:
         log.debug(f"Loading ruleset: {ruleset}")
-        rules = self.load_rules(ruleset + ".json")
-        return _datasworn.RulesPackage.from_json_data(rules)
-
-    def __init__(self) -> None:
-        self.rules = {}
+        data = (cache.DATA_PATH / f"{ruleset}.json").read_bytes()
+        if not cache.cache_enabled():
+            return self._build_ruleset(data)
+
+        key = cache.snapshot_key(data)
+        if cache.store_enabled():
+            if opened := store.open_store(ruleset, key):
+                log.debug(f"Opened store for ruleset: {ruleset}")
+                return opened
+            snapshot = cache.load_snapshot(ruleset, key) or self._build_ruleset(data)
+            store.save_store(ruleset, key, snapshot)
+            return store.open_store(ruleset, key) or snapshot
+
+        if snapshot := cache.load_snapshot(ruleset, key):
+            log.debug(f"Loaded snapshot for ruleset: {ruleset}")
+            return snapshot
+        snapshot = self._build_ruleset(data)
+        cache.save_snapshot(ruleset, key, snapshot)
+        return snapshot
+
+    def __init__(self, rulesets: list[str] = RULESETS) -> None:
+        self.rulesets = list(rulesets)
+        self._loaded: dict[str, RulesetData | store.StoreSnapshot] = {}
+        self._locks = {ruleset: Lock() for ruleset in self.rulesets}
+        self.rules = LazyRules(self)
+        self.index = LazyIndex(self)
+        self.id_tree = LazyIdTree(self)
+        self.parents = LazyParents(self)
+        self.breadcrumbs = LazyBreadcrumbs(self)
+        self.row_tables = LazyRowTables(self)
+        self.issues = LazyIssues(self)
+        self.id_table = LazyIdTable(self)
+
+    @property
+    def loaded(self) -> list[str]:
+        return [ruleset for ruleset in self.rulesets if ruleset in self._loaded]
+
+    def load(self, ruleset: str) -> RulesetData | store.StoreSnapshot:
+        """Load `ruleset` unless already loaded and return its tables, see
+        `RulesetData`; a `store.StoreSnapshot` has the same fields."""
+        try:
+            return self._loaded[ruleset]
+        except KeyError:
+            pass
+        with self._locks[ruleset]:
+            if ruleset not in self._loaded:
+                t0 = time.perf_counter()
+                with cache.gc_paused():
+                    self._loaded[ruleset] = self._load_ruleset(ruleset)
+                t1 = time.perf_counter()
+                log.debug(f"Loaded ruleset {ruleset} in {t1 - t0:.2f} seconds")
+        return self._loaded[ruleset]
+
+    def _store(self, ruleset: str, snapshot: RulesetData) -> None:
+        with self._locks[ruleset]:
+            self._loaded.setdefault(ruleset, snapshot)
+
+    def preload(
+        self,
+        rulesets: list[str] | None = None,
+        mode: LoadMode = "thread",
+    ) -> None:
+        """Load all (or the given) rulesets.
+
+        Args:
+            rulesets: Rulesets to load, defaults to all.
+            mode: "thread" loads in a thread pool, "process" builds each
+                ruleset in a worker process and ships it back pickled,
+                "serial" loads one after the other.
+
+        A ruleset that fails to load is reported and skipped, so one broken
+        ruleset does not stop the others; it is tried again when accessed.
+        """
+        rulesets = [r for r in rulesets or self.rulesets if r not in self._loaded]
         t0 = time.perf_counter()
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                executor.submit(self._load_ruleset, ruleset): ruleset
-                for ruleset in RULESETS
-            }
-            # for ruleset in RULESETS:
-            for future in as_completed(futures):
-                ruleset = futures[future]
+        if mode == "serial":
+            for ruleset in rulesets:
                 try:
-                    rules_package = future.result()
+                    self.load(ruleset)
                 except Exception as exc:
                     print(f"{ruleset} generated an exception: {exc}")
-                else:
-                    # add individual rules to global index
-                    add_to_index(id_tree, index, rules_package)
-                    self.rules[rules_package.id.value] = rules_package
+        elif mode in ("thread", "process"):
+            pool = ThreadPoolExecutor if mode == "thread" else ProcessPoolExecutor
+            task = self.load if mode == "thread" else _load_in_worker
+            with pool() as executor:
+                futures = {
+                    executor.submit(task, ruleset): ruleset for ruleset in rulesets
+                }
+                for future in as_completed(futures):
+                    ruleset = futures[future]
+                    try:
+                        result = future.result()
+                        if mode == "process" and result:
+                            with cache.gc_paused():
+                                self._store(ruleset, cache.loads(result))
+                        elif mode == "process":
+                            self.load(ruleset)
+                    except Exception as exc:
+                        print(f"{ruleset} generated an exception: {exc}")
+        else:
+            msg = f"Unknown load mode: {mode}"
+            raise ValueError(msg)
         t1 = time.perf_counter()
-        log.debug(f"Loaded {len(self.rules)} rulesets in {t1 - t0:.2f} seconds")
+        log.debug(f"Loaded {len(rulesets)} rulesets ({mode}) in {t1 - t0:.2f} seconds")
+
+
+def _load_in_worker(ruleset: str) -> bytes:
+    """Build `ruleset` in a worker process and return it pickled, or nothing
+    if it was written to a store for the parent to open."""
+    with cache.gc_paused():
+        snapshot = RulesServer([ruleset])._load_ruleset(ruleset)
+    if isinstance(snapshot, store.StoreSnapshot):
+        return b""
+    return cache.dumps(snapshot)
+
+
+server = RulesServer()
+rules = server.rules
+index = server.index
+id_tree = server.id_tree
+parents = server.parents
+breadcrumb_table = server.breadcrumbs
+row_tables = server.row_tables
+issues = server.issues
+id_table = server.id_table
+preload = server.preload
+
+
+def get_parent_id(id_, node=None) -> str | None:
+    """Return the ID of the nearest identified ancestor of `id_`.
+
+    `node` is deprecated and ignored: parents are looked up in `parents`
+    instead of by searching an id tree.
+    """
+    if node is not None:
+        warnings.warn(
+            "get_parent_id() ignores `node`; it will be removed",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    return parents.get(id_)
+
+
+def get_ancestors(id_) -> list[str]:
+    """Return the IDs of all ancestors of `id_`, nearest first."""
+    ancestors = []
+    while id_ := parents.get(id_):
+        ancestors.append(id_)
+    return ancestors
 
 
-def get_parent_id(id_, node=id_tree):
-    for k, v in node.items():
-        if id_ in v:
-            return k
-        parent = get_parent_id(id_, v)
-        if parent:
-            return parent
-    return None
-    # print(v)
+def get_depth(id_) -> int:
+    """Return the number of ancestors of `id_`; 0 for a ruleset."""
+    return len(get_ancestors(id_))
 
 
 def get_rule_types():
@@ -218,7 +632,7 @@ def get_rule_types():
     return rule_types
 
 
-def breadcrumbs(id_) -> list[str]:
+def _build_breadcrumbs(id_, index, parents) -> tuple[str, ...]:
     def _get_name_or_label(id_):
         obj = index[id_]
         if hasattr(obj, "name") and obj.name:
@@ -234,7 +648,7 @@ def breadcrumbs(id_) -> list[str]:
     next_id = id_
     if name := _get_name_or_label(next_id):
         parts.append(f"**{name.upper()}**")
-    next_id = get_parent_id(next_id)
+    next_id = parents.get(next_id)
     while next_id:
         if next_id in RULESETS:
             break
@@ -242,9 +656,9 @@ def breadcrumbs(id_) -> list[str]:
             parts.append(f"[{name}]({next_id})")
         else:
             break
-        next_id = get_parent_id(next_id)
+        next_id = parents.get(next_id)
 
-    parsed_id = ParsedId(id_)
+    parsed_id = ParsedId.parse(id_)
 
     parts.append(
         f"[{TYPE_TITLES[parsed_id.type]}]({parsed_id.ruleset}.{parsed_id.type})"
@@ -252,7 +666,9 @@ def breadcrumbs(id_) -> list[str]:
     parts.append(f"[{TYPE_TITLES[parsed_id.ruleset]}]({parsed_id.ruleset})")
     parts.reverse()
     # print(parts)
-    return parts
+    return tuple(sys.intern(part) for part in parts)
 
 
-rules = RulesServer().rules
+def breadcrumbs(id_) -> list[str]:
+    """Return the Markdown breadcrumb trail of `id_`, outermost first."""
+    return list(breadcrumb_table[id_])
@@ -0,0 +1,91 @@
+"""Roll resolution for rollable oracle tables.
+
+Every table with `rows` and `dice` gets a `RowTable` at load time: a dense
+array holding, for each possible roll, the index of the row it lands on. A
+roll is then resolved with one array access instead of a scan over the rows,
+and `roll_many()` draws and resolves thousands of rolls in one call.
+"""
+
+import random
+from array import array
+from dataclasses import dataclass
+from typing import Any
+
+from .dice import Dice
+from .rng import as_rng
+
+NO_ROW = -1
+"""Row index for a roll that no row covers."""
+
+
+@dataclass(slots=True)
+class RowTable:
+    dice: str
+    low: int
+    """Lowest possible roll, stored at `rows[0]`."""
+    rows: array
+    """Row index (or `NO_ROW`) for every roll from `low` to the highest."""
+
+    @property
+    def high(self) -> int:
+        return self.low + len(self.rows) - 1
+
+    def row_index(self, roll: int) -> int | None:
+        """Return the index of the row `roll` lands on, if any."""
+        i = roll - self.low
+        if i < 0 or i >= len(self.rows):
+            return None
+        row = self.rows[i]
+        return None if row == NO_ROW else row
+
+    def row_indexes(self, rolls) -> array:
+        """Return the row index (or `NO_ROW`) of each roll in `rolls`."""
+        rows, low, size = self.rows, self.low, len(self.rows)
+        return array(
+            "h",
+            [rows[i] if 0 <= (i := roll - low) < size else NO_ROW for roll in rolls],
+        )
+
+    def roll(self, rng: Any = random) -> int:
+        """Roll the dice once and return the roll."""
+        return Dice.parse(self.dice).roll(rng)
+
+    def roll_many(self, n: int, rng: Any = random) -> array:
+        """Roll the dice `n` times and return the row index of each roll.
+
+        Drawing from the dense row array with the dice distribution as
+        weights rolls and resolves in a single `choices()` call.
+        """
+        return array("h", Dice.parse(self.dice).sample(self.rows, n, rng))
+
+
+def build_row_table(oracle: Any) -> RowTable:
+    """Return the roll -> row index table of a rollable oracle."""
+    dice = oracle.dice.value
+    compiled = Dice.parse(dice)
+    low, high = compiled.low, compiled.high
+    rows = array("h", [NO_ROW]) * (high - low + 1)
+    for i, row in enumerate(oracle.rows):
+        roll = row.roll
+        if roll is None or roll.min is None or roll.max is None:
+            continue
+        for face in range(max(roll.min, low), min(roll.max, high) + 1):
+            # the first matching row wins, as in a scan over the rows
+            if rows[face - low] == NO_ROW:
+                rows[face - low] = i
+    return RowTable(dice, low, rows)
+
+
+def is_rollable(obj: Any) -> bool:
+    return hasattr(obj, "rows") and hasattr(obj, "dice")
+
+
+def roll_many(oracle_id: str, n: int, seed: Any = None) -> array:
+    """Roll the oracle `oracle_id` `n` times and return the row index of each
+    roll as an `array('h')`; `NO_ROW` marks rolls that no row covers.
+
+    `seed` is an `int`, a generator such as a `Stream`, or `None`.
+    """
+    from .main import row_tables
+
+    return row_tables[oracle_id].roll_many(n, as_rng(seed))
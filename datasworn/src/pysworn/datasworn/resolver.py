@@ -0,0 +1,223 @@
+"""Fully resolve oracle rolls.
+
+A row may ask for further rolls (`OracleRoll`: "Roll twice", "Action + Theme")
+and may replace its text with a template whose `{{text>oracle_id}}`
+placeholders are filled with the text of those rolls. `resolve()` follows the
+rolls recursively, applies the `OracleDuplicateBehavior` of each and fills the
+templates.
+
+Templates are compiled once into a plan of literal and placeholder parts, and
+the oracle, row table and dice of every rolled oracle are memoized, so bulk
+generation does not re-parse or re-look-up anything.
+"""
+
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from ._datasworn import OracleDuplicateBehavior
+from .dice import Dice
+from .rng import as_stream
+
+MAX_DEPTH = 8
+"""Nested rolls deeper than this are not followed."""
+
+MAX_REROLLS = 100
+"""Attempts to find a new row before a duplicate is kept anyway."""
+
+CHUNK_SIZE = 1000
+"""Rolls resolved on each child stream by `resolve_many()`."""
+
+_PLACEHOLDER_RE = re.compile(
+    r"\{\{(?P<field>text[23]?)>"
+    # tolerate `(id)` and trailing words inside the braces, both in the data
+    r"\(?(?:datasworn:)?(?P<id>[a-z_.]+:[\w/.*]+)\)?(?P<rest>[^}]*)\}\}"
+)
+
+
+@dataclass(slots=True)
+class RollResult:
+    oracle_id: str
+    roll: int
+    row_id: str | None
+    text: str
+    """Row text, with its template filled in if it has one."""
+    text2: str | None = None
+    text3: str | None = None
+    rolls: list["RollResult"] = field(default_factory=list)
+    """Results of the rolls the row asked for."""
+    templated: bool = False
+    duplicate: bool = False
+    """A repeated result kept by the `keep` or `make_it_worse` behavior."""
+
+    def __str__(self) -> str:
+        if self.templated or not self.rolls:
+            return self.text
+        return "; ".join(str(result) for result in self.rolls)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> tuple[str | tuple[str, str], ...]:
+    """Split `template` into literal strings and `(field, oracle_id)`
+    placeholders."""
+    plan: list[str | tuple[str, str]] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        if match.start() > pos:
+            plan.append(template[pos : match.start()])
+        plan.append((match["field"], match["id"]))
+        if match["rest"]:
+            plan.append(match["rest"])
+        pos = match.end()
+    if pos < len(template):
+        plan.append(template[pos:])
+    return tuple(plan)
+
+
+_tables: dict[str, tuple[Any, Any, Dice]] = {}
+
+
+def oracle_table(oracle_id: str) -> tuple[Any, Any, Dice]:
+    """Return the memoized oracle, row table and dice of `oracle_id`."""
+    try:
+        return _tables[oracle_id]
+    except KeyError:
+        pass
+    from .main import index, row_tables
+
+    table = row_tables[oracle_id]
+    _tables[oracle_id] = entry = (index[oracle_id], table, Dice.parse(table.dice))
+    return entry
+
+
+def rolls_itself(row: Any, oracle_id: str) -> bool:
+    """Whether `row` asks to roll again on its own oracle ("Roll twice")."""
+    return any(
+        oracle_roll.oracle is None or oracle_roll.oracle.value == oracle_id
+        for oracle_roll in row.oracle_rolls or ()
+    )
+
+
+class Resolver:
+    """Resolves rolls with one random number generator."""
+
+    def __init__(self, rng: Any = random, *, auto_only: bool = True) -> None:
+        self.rng = rng
+        self.auto_only = auto_only
+        """Follow only the rolls marked `auto`, as a player would."""
+
+    def resolve(
+        self, oracle_id: str, roll: int | None = None, depth: int = 0
+    ) -> RollResult:
+        """Roll `oracle_id` (or use `roll`) and resolve the row it lands on."""
+        oracle, table, dice = oracle_table(oracle_id)
+        if roll is None:
+            roll = dice.roll(self.rng)
+        return self._resolve_row(oracle_id, oracle, table.row_index(roll), roll, depth)
+
+    def _resolve_row(self, oracle_id, oracle, i, roll, depth) -> RollResult:
+        if i is None:
+            return RollResult(oracle_id, roll, None, "")
+        row = oracle.rows[i]
+        text2 = getattr(row, "text2", None)
+        text3 = getattr(row, "text3", None)
+        result = RollResult(
+            oracle_id,
+            roll,
+            row.id.value,
+            row.text.value,
+            text2.value if text2 else None,
+            text3.value if text3 else None,
+        )
+        if depth >= MAX_DEPTH:
+            return result
+
+        for oracle_roll in row.oracle_rolls or ():
+            if self.auto_only and not oracle_roll.auto:
+                continue
+            target = oracle_roll.oracle.value if oracle_roll.oracle else oracle_id
+            result.rolls.extend(self._roll_times(target, oracle_roll, depth + 1))
+
+        if template := row.template:
+            pending = list(result.rolls)
+            for name in ("text", "text2", "text3"):
+                if text := getattr(template, name):
+                    setattr(result, name, self._fill(text.value, pending, depth))
+            result.templated = True
+        return result
+
+    def _roll_times(self, oracle_id, oracle_roll, depth) -> list[RollResult]:
+        oracle, table, dice = oracle_table(oracle_id)
+        if oracle_roll.dice is not None:
+            dice = Dice.parse(oracle_roll.dice.value)
+        behavior = oracle_roll.duplicates
+        results = []
+        seen = set()
+        for _ in range(oracle_roll.number_of_rolls):
+            for _ in range(MAX_REROLLS):
+                roll = dice.roll(self.rng)
+                i = table.row_index(roll)
+                if i is None:
+                    continue
+                # a "Roll twice" row rolled on its own oracle is rolled again
+                if rolls_itself(oracle.rows[i], oracle_id):
+                    continue
+                if i in seen and behavior is OracleDuplicateBehavior.REROLL:
+                    continue
+                break
+            result = self._resolve_row(oracle_id, oracle, i, roll, depth)
+            result.duplicate = i in seen
+            seen.add(i)
+            results.append(result)
+        return results
+
+    def _fill(self, template: str, pending: list[RollResult], depth: int) -> str:
+        parts = []
+        for part in compile_template(template):
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+            name, oracle_id = part
+            for k, result in enumerate(pending):
+                if result.oracle_id == oracle_id:
+                    del pending[k]
+                    break
+            else:
+                result = self.resolve(oracle_id, depth=depth + 1)
+            parts.append(getattr(result, name) or "")
+        return "".join(parts)
+
+
+def resolve(oracle_id: str, rng: Any = random) -> RollResult:
+    """Roll `oracle_id` and fully resolve the result."""
+    return Resolver(rng).resolve(oracle_id)
+
+
+def resolve_many(
+    oracle_id: str, n: int, seed: Any = None, workers: int | None = None
+) -> list[RollResult]:
+    """Roll `oracle_id` `n` times and fully resolve every result.
+
+    The rolls are split into chunks of `CHUNK_SIZE`, each rolled on its own
+    child stream of `seed` (see `rng.Stream`). With `workers`, the chunks are
+    resolved in a process pool; the results are the same for any number of
+    workers.
+    """
+    streams = as_stream(seed).spawn(-(-n // CHUNK_SIZE))
+    sizes = [min(CHUNK_SIZE, n - i * CHUNK_SIZE) for i in range(len(streams))]
+    args = ([oracle_id] * len(sizes), sizes, streams)
+    if workers is None or workers <= 1:
+        chunks = list(map(_resolve_chunk, *args))
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            chunks = list(executor.map(_resolve_chunk, *args))
+    return [result for chunk in chunks for result in chunk]
+
+
+def _resolve_chunk(oracle_id: str, n: int, rng: Any) -> list[RollResult]:
+    resolver = Resolver(rng)
+    _, _, dice = oracle_table(oracle_id)
+    return [resolver.resolve(oracle_id, roll) for roll in dice.roll_many(n, rng)]
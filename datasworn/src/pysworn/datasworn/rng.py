@@ -0,0 +1,75 @@
+"""Seeded, reproducible random number streams for oracle rolls.
+
+A `Stream` is a `random.Random` seeded from a session seed and a spawn key.
+`spawn()` derives independent child streams (one per worker or process) whose
+seeds depend only on the session seed and their position, so work fanned out
+over any number of workers replays exactly from the session seed alone.
+
+Every roll path (`Dice`, `RowTable`, `Resolver`, `roll_many()`) takes an `rng`
+argument; anything with `randint()` and `choices()` works, including the
+`random` module itself.
+"""
+
+import hashlib
+import random
+import secrets
+from typing import Any
+
+
+def _derive(entropy: int, key: tuple[int, ...]) -> int:
+    """Return the seed of the stream at `key` below `entropy`."""
+    data = ",".join(map(str, (entropy, *key))).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest())
+
+
+class Stream(random.Random):
+    """A random number stream that can spawn independent child streams."""
+
+    def __init__(self, entropy: int | None = None, key: tuple[int, ...] = ()):
+        if entropy is None:
+            entropy = secrets.randbits(64)
+        self.entropy = entropy
+        """The session seed, shared by all streams spawned from it."""
+        self.key = key
+        """Position of this stream in the spawn tree, `()` for the root."""
+        self._spawned = 0
+        super().__init__(_derive(entropy, key))
+
+    def __repr__(self) -> str:
+        return f"Stream({self.entropy}, {self.key})"
+
+    def __reduce__(self):
+        state = (self.getstate(), self._spawned)
+        return self.__class__, (self.entropy, self.key), state
+
+    def __setstate__(self, state) -> None:
+        random_state, self._spawned = state
+        self.setstate(random_state)
+
+    def child(self, i: int) -> "Stream":
+        """Return the `i`-th child stream, without touching this stream."""
+        return Stream(self.entropy, (*self.key, i))
+
+    def spawn(self, n: int) -> list["Stream"]:
+        """Return `n` new child streams, distinct from all spawned before."""
+        start = self._spawned
+        self._spawned += n
+        return [self.child(i) for i in range(start, start + n)]
+
+
+def as_rng(seed: Any = None) -> Any:
+    """Return a generator for `seed`: a fresh `Stream` for `None` or an
+    `int`, or `seed` itself if it already is a generator."""
+    if seed is None or isinstance(seed, int):
+        return Stream(seed)
+    return seed
+
+
+def as_stream(seed: Any = None) -> Stream:
+    """Return a `Stream` for `seed`, seeding one from `seed` if it is a plain
+    generator."""
+    if isinstance(seed, Stream):
+        return seed
+    if seed is None or isinstance(seed, int):
+        return Stream(seed)
+    return Stream(seed.getrandbits(64))
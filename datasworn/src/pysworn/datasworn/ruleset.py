@@ -0,0 +1,35 @@
+"""The tables built for one indexed ruleset.
+
+`RulesServer.load()` returns a `RulesetData` (or a `store.StoreSnapshot`
+with the same fields), and the snapshot cache pickles it whole.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pysworn.datasworn import _datasworn
+
+from .ids import IdTable
+from .links import LinkGraph
+from .oracles import RowTable
+from .search import SearchIndex
+from .validate import Issue
+
+
+@dataclass(slots=True)
+class RulesetData:
+    package: _datasworn.RulesPackage
+    index: dict[str, Any]
+    """ID -> rule object."""
+    tree: dict[str, dict]
+    """Ruleset ID -> nested dict of child IDs."""
+    parents: dict[str, str | None]
+    """ID -> ID of its nearest identified ancestor."""
+    breadcrumbs: dict[str, tuple[str, ...]]
+    types: dict[str, list[str]]
+    """Type prefix -> IDs of that type."""
+    row_tables: dict[str, RowTable]
+    issues: dict[str, list[Issue]]
+    search: SearchIndex
+    links: LinkGraph
+    ids: IdTable
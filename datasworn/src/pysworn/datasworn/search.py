@@ -0,0 +1,205 @@
+"""Full-text search over rule content.
+
+Every ruleset gets a `SearchIndex` when it is indexed: an inverted index from
+the words of names, summaries, descriptions, row texts, tags and the IDs of
+named objects to the IDs they appear in, weighted by field. The sorted term list answers prefix
+queries with a binary search, and `search()` ranks the IDs that match every
+query word with a BM25-style score summed over the loaded rulesets.
+"""
+
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .ids import IdTable
+
+FIELDS = (
+    ("name", 3.0),
+    ("canonical_name", 3.0),
+    ("summary", 2.0),
+    ("description", 1.0),
+    ("text", 1.0),
+    ("text2", 1.0),
+    ("text3", 1.0),
+)
+"""Searched fields and the weight of a word found in each."""
+
+TAG_WEIGHT = 1.5
+
+PATH_WEIGHT = 0.5
+"""Weight of the words in the ID of a named object, which name its parents."""
+
+K1 = 1.2
+"""Saturation of repeated words in the ranking."""
+
+_MARKUP_RE = re.compile(r"\]\([^)]*\)|\{\{.*?\}\}")
+"""Link targets and table substitutions, which are not searched."""
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def terms(text: str) -> list[str]:
+    """Return the searchable words of `text`, lowercased."""
+    return _WORD_RE.findall(_MARKUP_RE.sub(" ", text).lower())
+
+
+@dataclass(slots=True)
+class SearchHit:
+    id: str
+    score: float
+
+
+@dataclass(slots=True)
+class SearchIndex:
+    ids: IdTable
+    """Numbers of the IDs of the ruleset."""
+    size: int
+    """Number of IDs with searchable words."""
+    terms: list[str]
+    """All indexed words, sorted."""
+    postings: dict[str, tuple[array, array]]
+    """Word -> numbers of the IDs it appears in and its weight in each."""
+
+    @classmethod
+    def build(cls, index: dict[str, Any], ids: IdTable) -> "SearchIndex":
+        """Index the searchable fields of every object in `index`."""
+        found: dict[str, dict[int, float]] = {}
+        size = 0
+        for id_, obj in index.items():
+            words = _weighted_words(id_, obj)
+            if not words:
+                continue
+            doc = ids.number(id_)
+            size += 1
+            for word, weight in words:
+                docs = found.setdefault(word, {})
+                docs[doc] = docs.get(doc, 0.0) + weight
+        postings = {
+            word: (array("i", docs.keys()), array("f", docs.values()))
+            for word, docs in found.items()
+        }
+        return cls(ids, size, sorted(postings), postings)
+
+    def expand(self, prefix: str) -> list[str]:
+        """Return the indexed words starting with `prefix`."""
+        i = bisect_left(self.terms, prefix)
+        words = []
+        while i < len(self.terms) and self.terms[i].startswith(prefix):
+            words.append(self.terms[i])
+            i += 1
+        return words
+
+    def matches(self, word: str, prefix: bool = False) -> dict[int, float]:
+        """Return the weight of `word` (or of the best word starting with it)
+        in each ID it appears in."""
+        if not prefix:
+            docs, weights = self.postings.get(word, ((), ()))
+            return dict(zip(docs, weights))
+        found: dict[int, float] = {}
+        for term in self.expand(word):
+            docs, weights = self.postings[term]
+            for doc, weight in zip(docs, weights):
+                if weight > found.get(doc, 0.0):
+                    found[doc] = weight
+        return found
+
+
+def _weighted_words(id_: str, obj: Any) -> list[tuple[str, float]]:
+    words = []
+    if getattr(obj, "name", None) is not None:
+        path = id_.partition(":")[2].partition("/")[2]
+        words.extend((word, PATH_WEIGHT) for word in terms(path))
+    for name, weight in FIELDS:
+        value = getattr(obj, name, None)
+        text = getattr(value, "value", value)
+        if isinstance(text, str):
+            words.extend((word, weight) for word in terms(text))
+    tags = getattr(obj, "tags", None)
+    if tags is not None and isinstance(tags.value, dict):
+        for ruleset_tags in tags.value.values():
+            for tag in ruleset_tags:
+                words.extend((word, TAG_WEIGHT) for word in terms(tag))
+    return words
+
+
+def parse_query(query: str) -> list[tuple[str, bool]]:
+    """Return the words of `query` and whether each is a prefix: the last word
+    (as typed so far) and words ending in `*`."""
+    parts = query.split()
+    words = []
+    for n, part in enumerate(parts):
+        last = n == len(parts) - 1 and not query[-1:].isspace()
+        prefix = last or part.endswith("*")
+        words.extend((word, prefix) for word in terms(part))
+    return words
+
+
+def search_indexes(
+    indexes: Iterable[SearchIndex],
+    query: str,
+    limit: int | None = 20,
+    types: Iterable[str] | None = None,
+) -> list[SearchHit]:
+    """Rank the IDs of `indexes` that contain every word of `query`."""
+    words = parse_query(query)
+    if not words:
+        return []
+    indexes = list(indexes)
+    per_index = [
+        [idx.matches(word, prefix) for word, prefix in words] for idx in indexes
+    ]
+    n = sum(idx.size for idx in indexes)
+    idf = [
+        math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for df in (
+            sum(len(matches[k]) for matches in per_index) for k in range(len(words))
+        )
+    ]
+    types = tuple(f"{t}:" for t in types) if types else None
+
+    hits = []
+    for idx, matches in zip(indexes, per_index):
+        smallest, *rest = sorted(matches, key=len)
+        docs = set(smallest).intersection(*rest)
+        for doc in docs:
+            id_ = idx.ids[doc]
+            if types and not id_.startswith(types):
+                continue
+            score = 0.0
+            for k, word_matches in enumerate(matches):
+                w = word_matches[doc]
+                score += idf[k] * w * (K1 + 1) / (w + K1)
+            hits.append(SearchHit(id_, score))
+    hits.sort(key=lambda hit: (-hit.score, hit.id))
+    return hits[:limit]
+
+
+def search(
+    query: str,
+    limit: int | None = 20,
+    ruleset: str | Iterable[str] | None = None,
+    types: Iterable[str] | None = None,
+) -> list[SearchHit]:
+    """Search the rules for `query`, loading rulesets as needed.
+
+    Args:
+        query: Words to find; the last one may be incomplete.
+        limit: Maximum number of hits, `None` for all.
+        ruleset: Ruleset(s) to search, defaults to all.
+        types: Only return IDs of these types, e.g. `["oracle_rollable"]`.
+    """
+    from .main import server
+
+    if ruleset is None:
+        rulesets = server.rulesets
+    elif isinstance(ruleset, str):
+        rulesets = [ruleset]
+    else:
+        rulesets = list(ruleset)
+    return search_indexes(
+        (server.load(name).search for name in rulesets), query, limit, types
+    )
@@ -0,0 +1,529 @@
+"""Memory-mapped, read-only store of an indexed ruleset.
+
+A snapshot (see `cache`) is unpickled in full, so every process holds the
+whole object graph of every ruleset it loads. A store keeps the same data in
+one file that is mapped read-only and decoded on demand:
+
+- the IDs of the ruleset as a flat UTF-8 string table with offsets, their
+  numbers in sorted order for binary search, and the parent and type number
+  of each ID (the `ids.IdTable` arrays), which also serve the parent map and
+  the IDs by type,
+- one pickle record per ID, in which children with IDs of their own are
+  references to their records, so looking up a move unpickles the move and
+  not the ruleset around it; a dict of such children (e.g. the collections
+  of the `RulesPackage`) becomes a `RecordDict` that unpickles them on first
+  access,
+- the rows of all oracle `RowTable`s as one int16 array, used in place,
+- the smaller tables (id tree, breadcrumbs, issues, search index, link
+  graph) as one pickle each, unpickled on first access.
+
+Processes that open the same store share its pages through the OS page
+cache. `RulesServer` uses stores when `PYSWORN_STORE` is set.
+"""
+
+import io
+import mmap
+import os
+import pickle
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from threading import RLock
+from typing import Any
+
+from . import cache
+from .ids import NO_ID
+from .logging import log
+from .oracles import RowTable
+from .ruleset import RulesetData
+
+MAGIC = b"PYSWST02"
+
+_SECTIONS = (
+    "id_offsets",
+    "id_bytes",
+    "id_order",
+    "parents",
+    "types",
+    "record_offsets",
+    "records",
+    "rows",
+    "fields",
+    "meta",
+)
+_HEADER = struct.Struct(f"<8s{2 * len(_SECTIONS)}Q")
+
+_META_FIELDS = ("tree", "breadcrumbs", "issues", "search", "links")
+"""`RulesetData` fields stored as pickles of their own."""
+
+_IDS = "ids"
+"""Persistent ID of the `IdTable` in the field pickles."""
+
+_RECORDS = "records"
+"""Persistent ID tag of a dict of records."""
+
+
+def store_path(ruleset: str, key: str) -> Path:
+    return cache.cache_dir() / f"{ruleset}-{key}.store"
+
+
+class _RecordPickler(cache._Pickler):
+    """Pickle one object, storing its children with IDs as record numbers."""
+
+    def __init__(self, file: io.BytesIO, numbers: dict[int, int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.numbers = numbers
+        self.root: object = None
+
+    def persistent_id(self, obj: Any) -> Any:
+        if obj is not self.root and (n := self.numbers.get(id(obj))) is not None:
+            return n
+        if type(obj) in (dict, RecordDict) and obj:
+            numbers = {k: self.numbers.get(id(v)) for k, v in obj.items()}
+            if None not in numbers.values():
+                return (_RECORDS, numbers)
+        return super().persistent_id(obj)
+
+
+class _MetaPickler(cache._Pickler):
+    def __init__(self, file: io.BytesIO, ids: Any) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.ids = ids
+
+    def persistent_id(self, obj: Any) -> Any:
+        if obj is self.ids:
+            return _IDS
+        return super().persistent_id(obj)
+
+
+def _records(index: dict[str, Any]) -> tuple[array, bytes]:
+    numbers = {id(obj): n for n, obj in enumerate(index.values())}
+    file = io.BytesIO()
+    pickler = _RecordPickler(file, numbers)
+    offsets = array("Q", [0])
+    for obj in index.values():
+        pickler.root = obj
+        pickler.dump(obj)
+        # records must not refer to objects memoized by earlier records
+        pickler.clear_memo()
+        offsets.append(file.tell())
+    return offsets, file.getvalue()
+
+
+def write_store(path: Path, snapshot: RulesetData) -> None:
+    """Write the indexed ruleset `snapshot` to a store at `path`."""
+    index, row_tables, ids = snapshot.index, snapshot.row_tables, snapshot.ids
+    encoded = [id_.encode() for id_ in ids]
+    id_offsets = array("I", [0])
+    for id_ in encoded:
+        id_offsets.append(id_offsets[-1] + len(id_))
+    id_order = array("I", sorted(range(len(encoded)), key=encoded.__getitem__))
+    record_offsets, records = _records(index)
+
+    rows = array("h")
+    directory = {}
+    for oracle_id, table in row_tables.items():
+        directory[oracle_id] = (table.dice, table.low, len(rows), len(table.rows))
+        rows.extend(table.rows)
+
+    fields = io.BytesIO()
+    field_offsets = {}
+    for name in _META_FIELDS:
+        start = fields.tell()
+        _MetaPickler(fields, ids).dump(getattr(snapshot, name))
+        field_offsets[name] = (start, fields.tell())
+    meta = pickle.dumps(
+        (ids.ruleset, ids.type_names, directory, field_offsets),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+    sections = [
+        id_offsets.tobytes(),
+        b"".join(encoded),
+        id_order.tobytes(),
+        ids.parents.tobytes(),
+        ids.types.tobytes(),
+        record_offsets.tobytes(),
+        records,
+        rows.tobytes(),
+        fields.getvalue(),
+        meta,
+    ]
+    table = []
+    offset = _HEADER.size
+    for data in sections:
+        offset += -offset % 8  # keep the arrays aligned
+        table += [offset, len(data)]
+        offset += len(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as file:
+        file.write(_HEADER.pack(MAGIC, *table))
+        for start, data in zip(table[::2], sections):
+            file.write(b"\0" * (start - file.tell()))
+            file.write(data)
+    tmp.replace(path)
+
+
+class _RecordUnpickler(cache._Unpickler):
+    def __init__(self, data: memoryview, index: "StoreIndex") -> None:
+        super().__init__(io.BytesIO(data))
+        self.index = index
+
+    def persistent_load(self, pid: Any) -> Any:
+        if isinstance(pid, int):
+            return self.index.get_record(pid)
+        if pid[0] == _RECORDS:
+            return RecordDict(self.index, pid[1])
+        return super().persistent_load(pid)
+
+
+class _MetaUnpickler(cache._Unpickler):
+    def __init__(self, data: memoryview, ids: "StoreIdTable") -> None:
+        super().__init__(io.BytesIO(data))
+        self.ids = ids
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _IDS:
+            return self.ids
+        return super().persistent_load(pid)
+
+
+class StoreIdTable:
+    """The `ids.IdTable` of a store, which decodes IDs from the mapped string
+    table and finds their numbers by binary search instead of building a
+    list and a dict of all IDs in every process."""
+
+    def __init__(
+        self,
+        ruleset: str,
+        offsets: memoryview,
+        data: memoryview,
+        order: memoryview,
+        parents: memoryview,
+        types: memoryview,
+        type_names: list[str],
+    ) -> None:
+        self.ruleset = ruleset
+        self._offsets = offsets
+        self._data = data
+        self._order = order
+        self.parents = parents
+        self.types = types
+        self.type_names = type_names
+
+    def _encoded(self, n: int) -> bytes:
+        return self._data[self._offsets[n] : self._offsets[n + 1]].tobytes()
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def __getitem__(self, n: int) -> str:
+        if not 0 <= n < len(self.parents):
+            raise IndexError(n)
+        return str(self._data[self._offsets[n] : self._offsets[n + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.__getitem__, range(len(self.parents)))
+
+    def __contains__(self, id_: object) -> bool:
+        if not isinstance(id_, str):
+            return False
+        try:
+            self.number(id_)
+        except KeyError:
+            return False
+        return True
+
+    def number(self, id_: str) -> int:
+        """Return the number of `id_`, raising `KeyError` if it is unknown."""
+        key = id_.encode()
+        i = bisect_left(self._order, key, key=self._encoded)
+        if i == len(self._order) or self._encoded(n := self._order[i]) != key:
+            raise KeyError(id_)
+        return n
+
+    def parent(self, n: int) -> int:
+        """Return the number of the parent of ID number `n`, or `NO_ID`."""
+        return self.parents[n]
+
+    def type(self, n: int) -> str:
+        """Return the type prefix of ID number `n`."""
+        return self.type_names[self.types[n]]
+
+
+class StoreIndex(Mapping[str, Any]):
+    """ID -> rule object, unpickling each object from its record on first
+    access."""
+
+    def __init__(
+        self, ids: StoreIdTable, offsets: memoryview, records: memoryview
+    ) -> None:
+        self.ids = ids
+        self._offsets = offsets
+        self._records = records
+        self._objects: list[Any] = [None] * len(ids)
+        self._lock = RLock()
+
+    def get_record(self, n: int) -> Any:
+        """Return the object with ID number `n`."""
+        if (obj := self._objects[n]) is not None:
+            return obj
+        # children are unpickled while their parent is, on the same thread
+        with self._lock:
+            if (obj := self._objects[n]) is None:
+                start, stop = self._offsets[n], self._offsets[n + 1]
+                with cache.gc_paused():
+                    obj = _RecordUnpickler(self._records[start:stop], self).load()
+                self._objects[n] = obj
+        return obj
+
+    def __getitem__(self, id_: str) -> Any:
+        return self.get_record(self.ids.number(id_))
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def loaded(self) -> int:
+        """Number of objects unpickled so far."""
+        return sum(obj is not None for obj in self._objects)
+
+
+class RecordDict(dict):
+    """Key -> child with an ID of its own, e.g. the oracle collections of a
+    `RulesPackage`. Its keys are there from the start; the children are
+    unpickled from their records when any of them is first accessed, so
+    counting the collections of a ruleset does not load the ruleset."""
+
+    __slots__ = ("_index", "_numbers")
+
+    def __init__(self, index: StoreIndex, numbers: dict[str, int]) -> None:
+        super().__init__(dict.fromkeys(numbers))
+        self._index = index
+        self._numbers: dict[str, int] | None = numbers
+
+    def _load(self) -> None:
+        if (numbers := self._numbers) is not None:
+            get_record = self._index.get_record
+            dict.update(self, {k: get_record(n) for k, n in numbers.items()})
+            self._numbers = None
+
+    def __getitem__(self, key: str) -> Any:
+        self._load()
+        return dict.__getitem__(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        # also routes dict(d), {**d} and d | e through the loaded values
+        self._load()
+        return dict.__iter__(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._load()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        self._load()
+        return dict.__ne__(self, other)
+
+    def __repr__(self) -> str:
+        self._load()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self.items()),)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self._load()
+        return dict.get(self, key, default)
+
+    def values(self) -> Any:
+        self._load()
+        return dict.values(self)
+
+    def items(self) -> Any:
+        self._load()
+        return dict.items(self)
+
+
+class StoreParents(Mapping[str, str | None]):
+    """ID -> ID of its parent, from the parent numbers of the ID table."""
+
+    def __init__(self, ids: StoreIdTable) -> None:
+        self.ids = ids
+
+    def __getitem__(self, id_: str) -> str | None:
+        parent = self.ids.parent(self.ids.number(id_))
+        return None if parent == NO_ID else self.ids[parent]
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class StoreTypes(Mapping[str, list[str]]):
+    """Type prefix -> IDs of that type, from the type numbers of the ID
+    table."""
+
+    def __init__(self, ids: StoreIdTable) -> None:
+        self.ids = ids
+        self._by_type: dict[str, list[str]] = {}
+
+    def __getitem__(self, type_: str) -> list[str]:
+        if (found := self._by_type.get(type_)) is None:
+            if type_ not in self.ids.type_names:
+                raise KeyError(type_)
+            k = self.ids.type_names.index(type_)
+            found = [self.ids[n] for n, t in enumerate(self.ids.types) if t == k]
+            self._by_type[type_] = found
+        return found
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids.type_names)
+
+    def __len__(self) -> int:
+        return len(self.ids.type_names)
+
+
+class StoreRowTables(Mapping[str, RowTable]):
+    """Oracle ID -> `RowTable` whose rows are a view of the store."""
+
+    def __init__(self, directory: dict[str, tuple], rows: memoryview) -> None:
+        self._directory = directory
+        self._rows = rows
+        self._tables: dict[str, RowTable] = {}
+
+    def __getitem__(self, oracle_id: str) -> RowTable:
+        if (table := self._tables.get(oracle_id)) is None:
+            dice, low, start, length = self._directory[oracle_id]
+            table = RowTable(dice, low, self._rows[start : start + length])
+            self._tables[oracle_id] = table
+        return table
+
+    def __contains__(self, oracle_id: object) -> bool:
+        return oracle_id in self._directory
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._directory)
+
+    def __len__(self) -> int:
+        return len(self._directory)
+
+
+class StoreSnapshot:
+    """A loaded ruleset served from a store, with the fields of
+    `RulesetData`."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, *table = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"Not a pysworn store: {path}")
+        view = memoryview(self._map)
+        section = {
+            name: view[start : start + length]
+            for name, start, length in zip(_SECTIONS, table[::2], table[1::2])
+        }
+
+        ruleset, type_names, directory, field_offsets = pickle.loads(section["meta"])
+        ids = StoreIdTable(
+            ruleset,
+            section["id_offsets"].cast("I"),
+            section["id_bytes"],
+            section["id_order"].cast("I"),
+            section["parents"].cast("i"),
+            section["types"].cast("H"),
+            type_names,
+        )
+
+        self.path = path
+        self.ids = ids
+        self.index = StoreIndex(
+            ids, section["record_offsets"].cast("Q"), section["records"]
+        )
+        self.row_tables = StoreRowTables(directory, section["rows"].cast("h"))
+        self.parents = StoreParents(ids)
+        self.types = StoreTypes(ids)
+        self._fields = section["fields"]
+        self._field_offsets: dict[str, tuple[int, int]] = field_offsets
+        self._loaded_fields: dict[str, Any] = {}
+        self._lock = RLock()
+
+    def _field(self, name: str) -> Any:
+        """Return the `RulesetData` field `name`, unpickling it on first
+        access."""
+        if (value := self._loaded_fields.get(name)) is not None:
+            return value
+        with self._lock:
+            if (value := self._loaded_fields.get(name)) is None:
+                start, stop = self._field_offsets[name]
+                with cache.gc_paused():
+                    value = _MetaUnpickler(self._fields[start:stop], self.ids).load()
+                self._loaded_fields[name] = value
+        return value
+
+    @property
+    def tree(self) -> dict[str, dict]:
+        return self._field("tree")
+
+    @property
+    def breadcrumbs(self) -> dict[str, tuple[str, ...]]:
+        return self._field("breadcrumbs")
+
+    @property
+    def issues(self) -> dict[str, list]:
+        return self._field("issues")
+
+    @property
+    def search(self) -> Any:
+        return self._field("search")
+
+    @property
+    def links(self) -> Any:
+        return self._field("links")
+
+    @property
+    def package(self) -> Any:
+        """The `RulesPackage`; its collections are `RecordDict`s, which load
+        their children on first access."""
+        return self.index[self.ids.ruleset]
+
+    def __repr__(self) -> str:
+        return f"<StoreSnapshot {self.path.name} loaded={self.index.loaded}>"
+
+
+def open_store(ruleset: str, key: str) -> StoreSnapshot | None:
+    """Open the store of `ruleset` for `key`, if there is a readable one."""
+    path = store_path(ruleset, key)
+    try:
+        return StoreSnapshot(path)
+    except FileNotFoundError:
+        return None
+    except cache.READ_ERRORS as exc:
+        log.warning(f"Ignoring unreadable store {path}: {exc}")
+        return None
+
+
+def save_store(ruleset: str, key: str, snapshot: RulesetData) -> None:
+    path = store_path(ruleset, key)
+    try:
+        for stale in path.parent.glob(f"{ruleset}-*.store"):
+            stale.unlink(missing_ok=True)
+        write_store(path, snapshot)
+    except cache.WRITE_ERRORS as exc:
+        log.warning(f"Could not write store {path}: {exc}")
@@ -0,0 +1,184 @@
+"""Validation of loaded rulesets.
+
+`check_ruleset()` makes one pass over the index of a ruleset and reports
+every rollable oracle whose row ranges leave gaps, overlap or fall outside
+its dice, every row ID used twice in an oracle and every link to an ID that
+does not exist. Row ranges are checked as sorted intervals, so an oracle
+costs one sort of its rows rather than one lookup per face.
+"""
+
+import re
+from collections.abc import Container, Iterator
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
+from typing import Any, Literal, get_args, get_type_hints
+
+from .dice import Dice
+
+IssueKind = Literal["gap", "overlap", "range", "duplicate", "dangling"]
+
+_LINK_RE = re.compile(r"datasworn:([a-z_.]+:[\w/.*]+)|\{\{text[23]?>([^}]*)\}\}")
+"""Markdown links `[...](datasworn:id)` and template placeholders."""
+
+_PLACEHOLDER_ID_RE = re.compile(r"(?:datasworn:)?([a-z_.]+:[\w/.*]+)")
+
+
+@dataclass(frozen=True, slots=True)
+class Issue:
+    kind: IssueKind
+    id: str
+    """ID of the object with the problem."""
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.kind}: {self.id}: {self.message}"
+
+
+def _ranges(low: int, high: int) -> str:
+    return f"{low}" if low == high else f"{low}-{high}"
+
+
+def check_rows(oracle_id: str, oracle: Any) -> list[Issue]:
+    """Check that the row ranges of `oracle` cover its dice exactly once and
+    that its row IDs are unique."""
+    issues = []
+    dice = Dice.parse(oracle.dice.value)
+    intervals = []
+    seen = set()
+    for row in oracle.rows:
+        if row.id is not None:
+            if (row_id := row.id.value) in seen:
+                issues.append(Issue("duplicate", row_id, "duplicate row ID"))
+            seen.add(row_id)
+        roll = row.roll
+        if roll is None or roll.min is None or roll.max is None:
+            continue
+        if roll.min < dice.low or roll.max > dice.high:
+            msg = f"{_ranges(roll.min, roll.max)} outside {dice}"
+            issues.append(Issue("range", oracle_id, msg))
+        intervals.append((roll.min, roll.max))
+
+    intervals.sort()
+    covered = dice.low - 1
+    for low, high in intervals:
+        if low > covered + 1:
+            msg = f"no row for {_ranges(covered + 1, low - 1)}"
+            issues.append(Issue("gap", oracle_id, msg))
+        elif low <= covered:
+            msg = f"rows overlap on {_ranges(low, min(high, covered))}"
+            issues.append(Issue("overlap", oracle_id, msg))
+        covered = max(covered, high)
+    if covered < dice.high:
+        msg = f"no row for {_ranges(covered + 1, dice.high)}"
+        issues.append(Issue("gap", oracle_id, msg))
+    return issues
+
+
+_SKIP, _ID, _TEXT, _TAG, _NODE = range(5)
+
+_TEXT_TYPES = ("MarkdownString", "MarkdownTemplateString")
+
+
+@cache
+def _plan(cls: type) -> tuple[int, tuple[str, ...]]:
+    """Return how to look for links in instances of `cls`: as an ID, as
+    Markdown text, as a node with these fields, or not at all."""
+    if not is_dataclass(cls):
+        return _SKIP, ()
+    if cls.__name__.endswith(("ID", "IDWildcard")):
+        return _ID, ()
+    if cls.__name__ in _TEXT_TYPES:
+        return _TEXT, ()
+    if cls.__name__ == "Tag":
+        return _TAG, ()
+    _plan_stack.add(cls)
+    try:
+        hints = get_type_hints(cls)
+        names = tuple(
+            f.name for f in fields(cls) if f.name != "id" and _links(hints[f.name])
+        )
+    finally:
+        _plan_stack.discard(cls)
+    return (_NODE, names) if names else (_SKIP, ())
+
+
+_plan_stack: set[type] = set()
+
+
+def _links(hint: Any) -> bool:
+    """Whether a field annotated with `hint` can hold a link."""
+    if args := get_args(hint):
+        return any(_links(arg) for arg in args)
+    if not isinstance(hint, type):
+        return False
+    classes = [hint]
+    while classes:
+        cls = classes.pop()
+        # an unfinished plan further up may still find links
+        if cls in _plan_stack or _plan(cls)[0] != _SKIP:
+            return True
+        classes.extend(cls.__subclasses__())
+    return False
+
+
+def references(obj: Any) -> Iterator[str]:
+    """Yield the IDs that the fields of `obj` (but not its children with IDs
+    of their own) link to."""
+    stack = [getattr(obj, name) for name in _plan(type(obj))[1]]
+    while stack:
+        value = stack.pop()
+        if value is None:
+            continue
+        if isinstance(value, list):
+            stack.extend(value)
+            continue
+        if isinstance(value, dict):
+            stack.extend(value.values())
+            continue
+        kind, names = _plan(type(value))
+        if kind == _NODE:
+            if getattr(value, "id", None) is None:
+                stack.extend(getattr(value, name) for name in names)
+        elif kind == _ID:
+            yield value.value
+        elif kind == _TEXT and ("datasworn:" in value.value or "{{" in value.value):
+            for link, placeholder in _LINK_RE.findall(value.value):
+                if placeholder:
+                    if (match := _PLACEHOLDER_ID_RE.search(placeholder)) is None:
+                        continue
+                    link = match[1]
+                yield link
+        elif kind == _TAG:
+            # tag values are untyped; only strings that look like IDs link
+            tagged = value.value if isinstance(value.value, list) else [value.value]
+            for item in tagged:
+                if isinstance(item, str) and _PLACEHOLDER_ID_RE.fullmatch(item):
+                    yield item
+
+
+def check_ruleset(
+    index: dict[str, Any], known: Container[str] | None = None
+) -> list[Issue]:
+    """Check every object in the `index` of a ruleset.
+
+    Links are looked up in `index` first and then in `known` (e.g. the index
+    of all rulesets); without `known`, links into other rulesets are not
+    checked.
+    """
+    from .main import ruleset_of
+
+    issues = []
+    rulesets = {ruleset_of(id_) for id_ in index}
+    for id_, obj in index.items():
+        if hasattr(obj, "rows") and hasattr(obj, "dice"):
+            issues.extend(check_rows(id_, obj))
+        for ref in references(obj):
+            if "*" in ref or ref in index:
+                continue
+            if known is None:
+                if ruleset_of(ref) not in rulesets:
+                    continue
+            elif ref in known:
+                continue
+            issues.append(Issue("dangling", id_, f"link to unknown ID {ref}"))
+    return issues
@@ -0,0 +1,69 @@
+"""Candidate index for the command palette.
+
+Textual's fuzzy matcher accepts a candidate when the letters of the query
+appear in it in order, ignoring case. `CandidateIndex` keeps the candidates
+that contain each letter, so a query only looks at the candidates containing
+its rarest letter, and remembers recent results: a query that extends one of
+them, as it does with every keystroke, is narrowed from that result instead.
+Only the candidates that really match are left for the matcher to score.
+"""
+
+import re
+from array import array
+from collections.abc import Sequence
+
+MAX_RESULTS = 256
+"""Number of recent query results kept for narrowing."""
+
+
+def _subsequence(query: str) -> re.Pattern[str]:
+    """Return a pattern matching strings that contain the letters of `query`
+    in order, taking the first occurrence of each so it never backtracks."""
+    parts = [re.escape(query[0])]
+    for letter in query[1:]:
+        letter = re.escape(letter)
+        parts.append(f"[^{letter}]*{letter}")
+    return re.compile("".join(parts), re.DOTALL)
+
+
+class CandidateIndex:
+    """Narrows a query to the candidates it fuzzy-matches."""
+
+    def __init__(self, candidates: Sequence[str]) -> None:
+        self.candidates = list(candidates)
+        self._lower = [candidate.lower() for candidate in self.candidates]
+        by_letter: dict[str, array] = {}
+        for i, text in enumerate(self._lower):
+            for letter in set(text):
+                by_letter.setdefault(letter, array("i")).append(i)
+        self._by_letter = by_letter
+        self._results: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def narrow(self, query: str) -> Sequence[int]:
+        """Return the positions of the candidates that contain the letters of
+        `query` in order."""
+        query = query.lower()
+        if not query:
+            return range(len(self.candidates))
+        if (found := self._results.get(query)) is not None:
+            return found
+
+        pool: Sequence[int] | None = None
+        for end in range(len(query) - 1, 0, -1):
+            if (pool := self._results.get(query[:end])) is not None:
+                break
+        if pool is None:
+            pool = min(
+                (self._by_letter.get(letter, ()) for letter in set(query)), key=len
+            )
+        search = _subsequence(query).search
+        lower = self._lower
+        found = [i for i in pool if search(lower[i])]
+
+        if len(self._results) >= MAX_RESULTS:
+            del self._results[next(iter(self._results))]
+        self._results[query] = found
+        return found
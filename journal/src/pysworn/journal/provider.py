@@ -1,26 +1,31 @@
 from functools import partial
 
-from pysworn.datasworn import index
+from pysworn.datasworn import index, preload
+from pysworn.datasworn.search import search
 from textual.app import App, ComposeResult
 from textual.command import DiscoveryHit, Hit, Hits, Provider
 from textual.containers import VerticalScroll
 from textual.widgets import Footer, Header, RichLog
 
+from .candidates import CandidateIndex
+
 
 class PyswornCommands(Provider):
     """A command provider to provide pysworn commands based on index entries."""
 
-    links: list[tuple[str, str]]
+    links: list[tuple[str, str, str]]
+    """Command, link and help text of every entry."""
+    candidates: CandidateIndex
 
-    def _read_links(self) -> list[tuple[str, str]]:
+    def _read_links(self) -> list[tuple[str, str, str]]:
         links_ = []
-        for link in index.keys():
-            if ".row:" in link:
-                continue
-            if ":" not in link:
-                links_.append((link, link))
+        for rule_type in index.types():
+            if rule_type.endswith(".row"):
                 continue
-            links_.append((link.split(":")[1], link))
+            for link in index.by_type(rule_type):
+                help = f"{type(index[link]).__name__} [i dim]{link}"
+                links_.append((link.partition(":")[2] or link, link, help))
+        self.candidates = CandidateIndex([cmd for cmd, _, _ in links_])
         self.app.log(f"Read {len(links_)} links")
         return links_
 
@@ -36,30 +41,58 @@ class PyswornCommands(Provider):
         app = self.app
         assert isinstance(app, ProviderApp)
 
-        for cmd, link in self.links:
+        for i in self.candidates.narrow(query):
+            cmd, link, help = self.links[i]
             score = matcher.match(cmd)
             if score > 0:
                 yield Hit(
                     score,
                     matcher.highlight(cmd),
                     partial(app.view_link, link),
-                    help=f"{type(index[link]).__name__} [i dim]{link}",
+                    help=help,
                 )
 
     async def discover(self) -> Hits:
         app = self.app
         assert isinstance(app, ProviderApp)
-        for cmd, link in self.links:
+        for cmd, link, help in self.links:
             yield DiscoveryHit(
                 f"{cmd}",
                 partial(app.view_link, link),
-                help=f"{type(index[link]).__name__} [i dim]{link}",
+                help=help,
+            )
+
+
+class SearchCommands(Provider):
+    """A command provider to search the names, texts and tags of all rules."""
+
+    async def startup(self) -> None:
+        """Build the search indexes of all rulesets before the first query."""
+        await self.app.run_worker(preload, thread=True).wait()
+
+    async def search(self, query: str) -> Hits:
+        """Search the rules for the words of `query`."""
+        app = self.app
+        assert isinstance(app, ProviderApp)
+
+        hits = search(query, limit=20)
+        if not hits:
+            return
+        top = hits[0].score
+        for hit in hits:
+            obj = index[hit.id]
+            name = getattr(obj, "name", None)
+            yield Hit(
+                hit.score / top,
+                getattr(name, "value", None) or hit.id.partition(":")[2],
+                partial(app.view_link, hit.id),
+                help=f"{type(obj).__name__} [i dim]{hit.id}",
             )
 
 
 class ProviderApp(App):
     # COMMANDS = App.COMMANDS | {PyswornCommands}
-    COMMANDS = {PyswornCommands}
+    COMMANDS = {PyswornCommands, SearchCommands}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -88,5 +121,63 @@ def main() -> None:
     app.run()
 
 
+BENCH_QUERIES = ["face_danger", "derelict/zone", "sundered_isles/asset", "xyzzy"]
+
+
+def bench() -> None:
+    """Measure the per-keystroke latency of the command palette search, with
+    and without the candidate index, over all non-row links."""
+    import time
+
+    from rich import print
+    from rich.table import Table
+    from textual.fuzzy import Matcher
+
+    preload()
+    cmds = [
+        link.partition(":")[2] or link
+        for rule_type in index.types()
+        if not rule_type.endswith(".row")
+        for link in index.by_type(rule_type)
+    ]
+    t0 = time.perf_counter()
+    candidates = CandidateIndex(cmds)
+    t1 = time.perf_counter()
+    print(f"Indexed {len(cmds)} links in {t1 - t0:.3f} seconds")
+
+    def scan(query: str, pool) -> int:
+        matcher = Matcher(query)
+        return sum(matcher.match(cmds[i]) > 0 for i in pool)
+
+    table = Table(
+        "Query", "Keystrokes", "Scored", "Hits", "Scan (ms/key)", "Indexed (ms/key)"
+    )
+    for query in BENCH_QUERIES:
+        full = indexed = 0.0
+        scored = hits = 0
+        for end in range(1, len(query) + 1):
+            typed = query[:end]
+            t0 = time.perf_counter()
+            expected = scan(typed, range(len(cmds)))
+            t1 = time.perf_counter()
+            pool = candidates.narrow(typed)
+            hits = scan(typed, pool)
+            t2 = time.perf_counter()
+            assert hits == expected, typed
+            full += t1 - t0
+            indexed += t2 - t1
+            scored += len(pool)
+        n = len(query)
+        table.add_row(
+            query,
+            repr(n),
+            f"{scored / n:.0f}",
+            repr(hits),
+            f"{full / n * 1e3:.2f}",
+            f"{indexed / n * 1e3:.2f}",
+        )
+    print(table)
+
+
 if __name__ == "__main__":
     main()
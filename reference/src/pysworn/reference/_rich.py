@@ -1,80 +1,121 @@
 import re
+from functools import cache
 
 from pysworn.datasworn._datasworn import MarkdownString
 
-
-def plain(obj: MarkdownString | None):
+_TOKEN_RE = re.compile(
+    r"\[(?P<text>.*?)\]\((?P<link>.*?)\)"
+    r"|(?P<template>\{\{.*?\}\})"
+    r"|__(?P<bold>.*?)__"
+)
+"""Links, table substitutions and bold text, in one pass."""
+
+Token = str | tuple[str, str] | tuple[str, str, str]
+
+OUTCOMES = ("strong hit", "weak hit", "miss")
+
+
+@cache
+def tokens(value: str) -> tuple[Token, ...]:
+    """Split Datasworn Markdown into plain strings and `("link", text,
+    target)`, `("template", source)` and `("bold", text)` tokens."""
+    if "[" not in value and "{{" not in value and "__" not in value:
+        return (value,)
+    parts: list[Token] = []
+    pos = 0
+    for m in _TOKEN_RE.finditer(value):
+        if m.start() > pos:
+            parts.append(value[pos : m.start()])
+        if m["link"] is not None:
+            parts.append(("link", m["text"], m["link"]))
+        elif m["template"] is not None:
+            parts.append(("template", m["template"]))
+        else:
+            parts.append(("bold", m["bold"]))
+        pos = m.end()
+    if pos < len(value):
+        parts.append(value[pos:])
+    return tuple(parts)
+
+
+def _to_markup(parts: tuple[Token, ...]) -> str:
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return parts[0]
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part[0] == "link":
+            text = _to_markup(tokens(part[1].upper()))
+            out.append(f"[u][@click=screen.open_link('{part[2]}')]{text}[/][/u]")
+        elif part[0] == "bold":
+            out.append(f"[bold]{_to_markup(tokens(part[1]))}[/bold]")
+    return "".join(out)
+
+
+def _to_plain(parts: tuple[Token, ...]) -> str:
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return parts[0]
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part[0] == "link":
+            out.append(_to_plain(tokens(part[1].upper())))
+        elif part[0] == "bold":
+            out.append(_to_plain(tokens(part[1])))
+    return "".join(out)
+
+
+def _to_markdown(parts: tuple[Token, ...]) -> str:
+    if len(parts) == 1 and isinstance(parts[0], str):
+        return parts[0]
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+        elif part[0] == "link":
+            out.append(f"[{_to_markdown(tokens(part[1]))}]({part[2]})")
+        elif part[0] == "bold":
+            # link outcomes
+            if part[1] in OUTCOMES:
+                out.append(f"[{part[1]}]({part[1].replace(' ', '_')})")
+            else:
+                out.append(f"__{_to_markdown(tokens(part[1]))}__")
+    return "".join(out)
+
+
+@cache
+def _markup(value: str) -> str:
+    return _to_markup(tokens(value.replace("datasworn:", "")))
+
+
+@cache
+def _plain(value: str) -> str:
+    return _to_plain(tokens(value.replace("datasworn:", "")))
+
+
+@cache
+def _markdown(value: str) -> str:
+    return _to_markdown(tokens(value.replace("datasworn:", "")))
+
+
+def plain(obj: MarkdownString | None) -> str:
+    """Convert to the text that `markup()` displays, without any markup"""
     if not obj:
         return ""
+    return _plain(obj.value)
 
-    value = obj.value
-    value = value.replace("datasworn:", "")
-    # remove links
-    markup_regex = r"(?:\[(?P<text>.*?)\])\((?P<link>.*?)\)"
-    for m in re.findall(markup_regex, value):
-        value = value.replace(f"[{m[0]}]({m[1]})", f"{m[1]}")
-
-    # remove table substitutions
-    value = re.sub(r"{{.*?}}", "", value)
-
-    # remove bold
-    value = re.sub(r"\_\_(.*?)\_\_", r"\1", value)
 
-    return obj.value
-
-
-def markup(obj: MarkdownString | None):
+def markup(obj: MarkdownString | None) -> str:
     """Convert to Textual + Rich markup"""
     if not obj:
         return ""
+    return _markup(obj.value)
+
 
-    value = obj.value
-    value = value.replace("datasworn:", "")
-    # remove links
-    markup_regex = r"(?:\[(?P<text>.*?)\])\((?P<link>.*?)\)"
-    for m in re.findall(markup_regex, value):
-        # value = value.replace(f"[{m[0]}]({m[1]})", f"_{m[0]}_")
-        value = value.replace(
-            f"[{m[0]}]({m[1]})",
-            f"[u][@click=screen.open_link('{m[1]}')]{m[0].upper()}[/][/u]",
-        )
-
-    # remove table substitutions
-    value = re.sub(r"{{.*?}}", "", value)
-    # convert to standard bold
-    # value = value.replace("__", "**")
-    value = re.sub(r"\_\_(.*?)\_\_", r"[bold]\1[/bold]", value)
-    # for m in re.findall(markup_regex, value):
-    #     value = value.replace(f"__{m[0]}__", f"[bold]{m[0]}[/bold]")
-    # value = value.replace("__", "**")
-    # return Markdown(value)
-    return str(value)
-
-
-def markdown(obj: MarkdownString | None):
+def markdown(obj: MarkdownString | None) -> str:
     """Convert to Textual + Rich markdown"""
     if not obj:
         return ""
-
-    value = obj.value
-
-    # markup_regex = r"(?:\[(?P<text>.*?)\])\((?P<link>.*?)\)"
-    # for m in re.findall(markup_regex, value):
-    #     value = value.replace(
-    #         f"[{m[0]}]({m[1]})",
-    #         f"[{m[0]}]({m[1].removeprefix('datasworn:')})",
-    #     )
-
-    value = value.replace("datasworn:", "")
-
-    # link outcomes
-    value = value.replace("__strong hit__", "[strong hit](strong_hit)")
-    value = value.replace("__weak hit__", "[weak hit](weak_hit)")
-    value = value.replace("__miss__", "[miss](miss)")
-    # value = value.replace("__strong hit__", "[green][strong hit](strong_hit)[/]")
-    # value = value.replace("__weak hit__", "[yellow][weak hit](weak_hit)[/]")
-    # value = value.replace("__miss__", "[red][miss](miss)[/]")
-
-    # link tables
-    value = re.sub(r"{{.*?}}", "", value)
-    return str(value)
+    return _markdown(obj.value)
@@ -1,11 +1,16 @@
+from threading import Event
+
 from pysworn.datasworn import RulesPackageRuleset
-from pysworn.datasworn.main import rules
+from pysworn.datasworn.content import content_cache
+from pysworn.datasworn.main import index, preload, row_tables, rules
+from pysworn.datasworn.rng import Stream
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.screen import ModalScreen
 from textual.widgets import Markdown
 
 from .logging import log
+from .oracle_table import table_rows
 from .screen import ReferenceScreen
 from .themes import (
     deepspace_theme,
@@ -13,6 +18,7 @@ from .themes import (
     ironsworn_theme,
     starforged_theme,
 )
+from .viewer import rule_header
 
 WELCOME = """
 PySworn Reference - (c) 2025 G. Brandt
@@ -76,8 +82,13 @@ class PyswornApp(App):
     #     Binding("f1", "get_help", "Help"),
     # ]
 
-    # def __init__(self) -> None:
-    #     super().__init__()
+    def __init__(self, seed: int | None = None, warm_cache: bool = False) -> None:
+        super().__init__()
+        self.rng = Stream(seed)
+        """Session stream for all rolls; replay a session with its seed."""
+        self.warm_cache = warm_cache
+        """Render oracle tables and rule headers ahead of time in a thread."""
+        self._stop_warming = Event()
 
     # def compose(self) -> ComposeResult:
     #     yield ReferenceScreen()
@@ -96,8 +107,20 @@ class PyswornApp(App):
         # self.theme = "starforged"
         self.theme = "deepspace"
 
+        if self.warm_cache:
+            self.run_worker(self._warm_content, thread=True)
         await self.push_screen(ReferenceScreen(), self.exit)
 
+    def on_unmount(self) -> None:
+        self._stop_warming.set()
+
+    def _warm_content(self) -> None:
+        stop = self._stop_warming
+        n = content_cache.warm(row_tables, "rows", table_rows, cancel=stop)
+        ids = (id_ for id_ in index if ".row:" not in id_)
+        n += content_cache.warm(ids, "header", rule_header, cancel=stop)
+        log.info(f"Pre-rendered {n} rules: {content_cache}")
+
     # await self.push_screen_wait(ReferenceScreen())
 
     # def action_get_help(self) -> None:
@@ -105,6 +128,7 @@ class PyswornApp(App):
 
 
 def run() -> None:
+    preload()
     log.info(f"Loaded rulesets: {list(rules.keys())}")
 
     app = PyswornApp()
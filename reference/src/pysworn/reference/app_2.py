@@ -3,6 +3,7 @@ from pathlib import PurePath
 from typing import Annotated
 
 import typer
+from pysworn.datasworn import preload
 from pysworn.reference.ruleset import RulesetTabs
 from pysworn.renderables import get_renderable
 from rich.traceback import install
@@ -180,6 +181,7 @@ def main(
 
         print_tree()
 
+    preload()
     app = RulesetTabsApp()
     app.log(f"inline: {inline}")
     app.run(inline=inline)
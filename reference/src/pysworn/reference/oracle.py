@@ -1,9 +1,9 @@
 import logging
-import random
-from typing import Tuple
+from typing import Any, Tuple
 
-from pysworn.datasworn import index
+from pysworn.datasworn import dice, index, row_tables
 from pysworn.datasworn._datasworn import OracleRollableTableTableText
+from rich.cells import cell_len
 
 from ._rich import markup, plain
 
@@ -40,22 +40,31 @@ def get_rows(otr: OracleRollableTableTableText):
     return rows
 
 
+TEXT_COLUMNS = ("text", "text2", "text3")
+
+_row_widths: dict[str, tuple[int, int, int]] = {}
+
+
+def column_widths(rows, n: int) -> tuple[int, ...]:
+    """Return the widest cell of each of the `n` columns of `rows`."""
+    widths = tuple(max(map(cell_len, column), default=0) for column in zip(*rows))
+    return widths + (0,) * (n - len(widths))
+
+
 def get_max_row_widths(otr: OracleRollableTableTableText) -> tuple[int, int, int]:
+    """Return the displayed width of the widest text, text2 and text3 of the
+    rows of `otr`, computed once per oracle."""
     if not hasattr(otr, "rows"):
         msg = f"OracleRollableTableText {otr} has no rows"
         raise ValueError(msg)
-    text = 0
-    text2 = 0
-    text3 = 0
-    for row in otr.rows:
-        text = max(text, len(plain(row.text)))
-        if not hasattr(row, "text2"):
-            continue
-        text2 = max(text2, len(plain(row.text2)))
-        if not hasattr(row, "text3"):
-            continue
-        text3 = max(text3, len(plain(row.text3)))
-    return (text, text2, text3)
+    id_ = otr.id.value
+    if (widths := _row_widths.get(id_)) is None:
+        rows = (
+            [plain(getattr(row, name, None)) for name in TEXT_COLUMNS]
+            for row in otr.rows
+        )
+        widths = _row_widths[id_] = column_widths(rows, len(TEXT_COLUMNS))
+    return widths
 
 
 def get_dimensions(otr: OracleRollableTableTableText) -> tuple[int, int]:
@@ -69,19 +78,14 @@ def get_dimensions(otr: OracleRollableTableTableText) -> tuple[int, int]:
 
 
 def get_row(otr: OracleRollableTableTableText, n: int):
-    # dice = otr.dice.value
-    # print(dice)
-    for row in otr.rows:
-        min_ = getattr(row, "min")
-        max_ = getattr(row, "max")
-        if min_ is None or max_ is None:
-            return None
-        if min_ <= n <= max_:
-            text = markup(getattr(row, "text", None))
-            text2 = markup(getattr(row, "text2", None))
-            text3 = markup(getattr(row, "text3", None))
-            return [text, text2, text3]
-    return None
+    nrow = get_row_number(otr, n)
+    if nrow is None:
+        return None
+    row = otr.rows[nrow]
+    text = markup(getattr(row, "text", None))
+    text2 = markup(getattr(row, "text2", None))
+    text3 = markup(getattr(row, "text3", None))
+    return [text, text2, text3]
 
 
 def get_row_by_index(otr: OracleRollableTableTableText, n: int) -> list[str]:
@@ -97,9 +101,11 @@ def get_row_by_index(otr: OracleRollableTableTableText, n: int) -> list[str]:
     return [dice_range, text, text2, text3]
 
 
-def get_row_from_link(link: str) -> Tuple[str, str]:
+def get_row_from_link(link: str, rng: Any) -> Tuple[str, str]:
     """
-    Get a row from a link like 'oracle_id;row_index'
+    Get a row from a link like 'oracle_id;row_index', rolling with `rng` if
+    the link has no roll. Pass the session stream (`PyswornApp.rng`), so that
+    a seeded session replays its link rolls
     """
     if ";" in link:
         oracle_id, row_index = link.split(";")
@@ -110,14 +116,7 @@ def get_row_from_link(link: str) -> Tuple[str, str]:
         # no roll specified, roll now
         oracle_id = link
         otr = index[oracle_id]
-        n = {
-            "1d6": random.randint(1, 6),
-            "1d10": random.randint(1, 10),
-            "1d20": random.randint(1, 20),
-            "1d100": random.randint(1, 100),
-            "1d200": random.randint(1, 200),
-            "1d300": random.randint(1, 300),
-        }[otr.dice.value]
+        n = dice.parse(otr.dice).roll(rng)
         row = get_row(otr, n)
 
     if oracle_id not in index:
@@ -143,17 +142,4 @@ def get_name_or_canonical(obj):
 
 
 def get_row_number(otr: OracleRollableTableTableText, n: int) -> int | None:
-    nrow = 0
-    for row in otr.rows:
-        roll = row.roll
-        if roll is None:
-            nrow += 1
-            continue
-        min_ = roll.min
-        max_ = roll.max
-        if min_ is None or max_ is None:
-            return None
-        if min_ <= n <= max_:
-            return nrow
-        nrow += 1
-    return None
+    return row_tables[otr.id.value].row_index(n)
@@ -1,7 +1,9 @@
 # import logging
 import random
 
-from pysworn.datasworn.main import index
+from pysworn.datasworn import dice
+from pysworn.datasworn.content import content_cache
+from pysworn.datasworn.main import ParsedId, index
 from textual import events, on
 from textual.binding import Binding
 from textual.message import Message
@@ -11,6 +13,27 @@ from ._rich import markdown, markup
 from .oracle import get_max_row_widths, get_row_by_index, get_row_number
 
 
+def table_rows(oracle_id: str) -> tuple[tuple[str, tuple], ...]:
+    """Return the key and the cells of each row of an oracle table."""
+    rows = []
+    for row in index[oracle_id].rows:
+        roll_min = getattr(getattr(row, "roll"), "min", "")
+        roll_max = getattr(getattr(row, "roll"), "max", "")
+        roll = f"{roll_min}-{roll_max}" if roll_min != roll_max else roll_min
+
+        row_text = []
+        row_text.append(roll)
+
+        row_text.append(markup(row.text))
+        if hasattr(row, "text2"):
+            row_text.append(markup(row.text2))
+        if hasattr(row, "text3"):
+            row_text.append(markup(row.text3))
+
+        rows.append((row.id.value, tuple(row_text)))
+    return tuple(rows)
+
+
 class OracleTable(DataTable):
     BINDINGS = [
         Binding("r", "roll", "Roll", show=True),
@@ -38,12 +61,8 @@ class OracleTable(DataTable):
     def action_roll(self):
         # otr = index[self.oracle_id]
         oracle = self.oracle
-        m, d = oracle.dice.value.split("d")
-        if m != "1":
-            msg = f"Only 1dX dice supported, got {oracle.dice.value}"
-            raise ValueError(msg)
-        dice = random.randint(1, int(d))
-        row_number = get_row_number(oracle, dice)
+        roll = dice.parse(oracle.dice).roll(getattr(self.app, "rng", random))
+        row_number = get_row_number(oracle, roll)
         if row_number is None:
             return
         row = get_row_by_index(oracle, row_number)
@@ -52,11 +71,9 @@ class OracleTable(DataTable):
         self.move_cursor(row=row_number, scroll=True)
 
     def update(self, oracle_id) -> None:
-        if ".row" in oracle_id:
-            oracle_type, oracle_id_ = oracle_id.split(":")
-            oracle_type = oracle_type.split(".")[0]
-            oracle_id_ = oracle_id_.split(".")[0]
-            oracle_id = f"{oracle_type}:{oracle_id_}"
+        parsed_id = ParsedId.parse(oracle_id)
+        if parsed_id.type.endswith(".row"):
+            oracle_id = parsed_id.container
 
         self.rule_id = oracle_id
         self.oracle_id = oracle_id
@@ -71,8 +88,6 @@ class OracleTable(DataTable):
             msg = f"Oracle {self.oracle.id} has no rows"
             raise ValueError(msg)
 
-        rows = self.oracle.rows
-
         max1, max2, max3 = get_max_row_widths(self.oracle)
         wmax = 68
 
@@ -94,21 +109,8 @@ class OracleTable(DataTable):
                 self.add_column("T3", width=min(max3, wmax))
             self.show_header = False
 
-        for row in rows:
-            roll_min = getattr(getattr(row, "roll"), "min", "")
-            roll_max = getattr(getattr(row, "roll"), "max", "")
-            roll = f"{roll_min}-{roll_max}" if roll_min != roll_max else roll_min
-
-            row_text = []
-            row_text.append(roll)
-
-            row_text.append(markup(row.text))
-            if hasattr(row, "text2"):
-                row_text.append(markup(row.text2))
-            if hasattr(row, "text3"):
-                row_text.append(markup(row.text3))
-
-            self.add_row(*row_text, height=None, key=row.id.value)
+        for key, row_text in content_cache.get(oracle_id, "rows", table_rows):
+            self.add_row(*row_text, height=None, key=key)
 
     def on_show(self) -> None:
         total_height = 0
@@ -77,7 +77,7 @@ class RulesetTabs(Vertical):
         self.log(self.tree)
 
     async def watch_current_id(self, id_):
-        parsed_id = ParsedId(id_)
+        parsed_id = ParsedId.parse(id_)
         ruleset = parsed_id.ruleset
         self.log(f"watch_current_id: {id_}")
         #     # with self.prevent(TabbedContent.TabActivated):
@@ -1,4 +1,4 @@
-from pysworn.datasworn.main import RULESETS, index, rules
+from pysworn.datasworn.main import RULESETS, ParsedId, index, rules
 from pysworn.reference import (
     VIEWER_TYPES,
     # ReferenceTree,
@@ -263,16 +263,13 @@ class ReferenceScreen(ModalScreen[str]):
             return
 
         # else link is full id
-        id_type, path = link.split(":")
+        parsed_id = ParsedId.parse(link)
 
-        # ruleset is first token after slash
-        ruleset = path.split("/")[0]
+        ruleset = parsed_id.ruleset
         category_tabs = ruleset_tabs.query_one(f"#{ruleset}-rules-tabs", TabbedContent)
         ruleset_tabs.active = ruleset
 
-        # category is second token after slash
-        category = path.split("/")[1]
-        category, viewer = VIEWER_TYPES[id_type]
+        category, viewer = VIEWER_TYPES[parsed_id.type]
         category_tabs.active = category
 
         parent_link = link
@@ -325,7 +322,7 @@ class ReferenceScreen(ModalScreen[str]):
             tree = category_pane.query_one(f"#{category}-tree", ReferenceTree)
             tree.collection = getattr(rules[ruleset], category)
             try:
-                if (node := tree.nodes[link]) != tree.cursor_node:
+                if (node := tree.find_node(link)) != tree.cursor_node:
                     if node.is_collapsed:
                         parent = node.parent
                         while parent:
@@ -2,6 +2,7 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Any
 
+from pysworn.datasworn.main import parents
 from rich.text import Text
 from textual.binding import Binding
 from textual.events import Focus
@@ -119,30 +120,58 @@ class ReferenceTree(PySwornTree):
         )
 
         self.collection = collection
+        self._by_id: dict[str, TreeNode] = {}
+        self._unfilled: dict[TreeNode, Any] = {}
+        """Nodes whose children are added when they are first expanded, so
+        that building the tree loads only the top-level collections."""
 
         for obj in self.collection.values():
-            # if hasattr(obj, "contents"):
-            n = self.root.add(colorized_label(obj, False), data=obj.id.value)
-            self._add_collection(n, obj)
-            # else:
-            # self.root.add_leaf(colorized_label(obj, False), data=obj.id.value)
+            self._add_collection(self.root, obj)
 
-        # self.log(self.tree)
+    def _add_collection(self, node: TreeNode, collection) -> None:
+        n = node.add(colorized_label(collection, False), data=collection.id.value)
+        self._by_id[collection.id.value] = n
+        self._unfilled[n] = collection
 
-    def _add_collection(self, node: TreeNode, collection):
+    def _fill(self, node: TreeNode) -> None:
+        """Add the children of `node` unless they are there already."""
+        if (collection := self._unfilled.pop(node, None)) is None:
+            return
         if hasattr(collection, "contents") and collection.contents:
             for obj in collection.contents.values():
                 n = node.add_leaf(colorized_label(obj, True), data=obj.id.value)
+                self._by_id[obj.id.value] = n
 
         if hasattr(collection, "collections") and collection.collections:
             for obj in collection.collections.values():
-                n = node.add(colorized_label(obj, False), data=obj.id.value)
-                self._add_collection(n, obj)
+                self._add_collection(node, obj)
 
         # if hasattr(collection, "options"):
         #     for obj in collection.options:
         #         n = node.add_leaf(colorized_label(obj, True), data=obj.id.value)
 
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        self._fill(event.node)
+
+    def action_toggle_expand_all(self):
+        while self._unfilled:
+            self._fill(next(iter(self._unfilled)))
+        super().action_toggle_expand_all()
+
+    def find_node(self, id_: str) -> TreeNode:
+        """Return the node of `id_`, adding the nodes on its path first.
+
+        Raises `KeyError` if `id_` is not in the tree."""
+        path = []
+        while (node := self._by_id.get(id_)) is None:
+            path.append(id_)
+            if (id_ := parents.get(id_)) is None:
+                raise KeyError(path[0])
+        for child in reversed(path):
+            self._fill(node)
+            node = self._by_id[child]
+        return node
+
     @property
     def nodes(self) -> dict[str, TreeNode]:
         """Return a dict mapping node data (link) to TreeNode."""
@@ -11,6 +11,8 @@ from pysworn.datasworn._datasworn import (
     Ruleset,
     SpecialTrackType,
 )
+from pysworn.datasworn.content import content_cache
+from pysworn.datasworn.links import backlinks
 from pysworn.datasworn.main import get_parent_id
 from pysworn.reference.oracle import get_max_row_widths
 from rich.rule import Rule
@@ -66,17 +68,61 @@ def render_tags(rule_id) -> ComposeResult:
             yield RuleMarkdown(msg)
 
 
-def render_suggestions(rule_id) -> ComposeResult:
+def suggestions_markdown(rule_id) -> str:
     obj = index[rule_id]
+    msg = []
     if hasattr(obj, "suggestions") and obj.suggestions:
-        msg = []
         for s in obj.suggestions.value:
             if s.value in index:
                 sobj = index[s.value]
                 msg.append(f"[{sobj.name.value}]({s.value})")
             else:
                 msg.append(f"{s.value}")
-    yield RuleMarkdown(", ".join(msg))
+    return ", ".join(msg)
+
+
+MAX_BACKLINKS = 24
+
+
+def backlinks_markdown(rule_id) -> str:
+    """Return links to the named rules that link to `rule_id`, or ""."""
+    named = {}
+    for source in backlinks(rule_id):
+        # rows and abilities are listed under the rule they belong to
+        while source is not None and getattr(index[source], "name", None) is None:
+            source = get_parent_id(source)
+        if source is not None and source != rule_id:
+            named.setdefault(source, index[source].name.value)
+    if not named:
+        return ""
+    msg = [f"[{name}]({source})" for source, name in named.items()]
+    if len(msg) > MAX_BACKLINKS:
+        msg[MAX_BACKLINKS:] = [f"and {len(msg) - MAX_BACKLINKS} more"]
+    return f"*Linked from* {', '.join(msg)}"
+
+
+def render_suggestions(rule_id) -> ComposeResult:
+    yield RuleMarkdown(suggestions_markdown(rule_id))
+
+
+def rule_header(rule_id) -> tuple[str, ...]:
+    """Return the Markdown of the name, summary, description, suggestions and
+    comment of a rule, as shown at the top of every `RuleViewer`."""
+    obj = index[rule_id]
+    sections = []
+    if hasattr(obj, "canonical_name") and obj.canonical_name:
+        sections.append(f"**{obj.canonical_name.value.upper()}**\n\n")
+    elif hasattr(obj, "name") and obj.name:
+        sections.append(f"**{obj.name.value.upper()}**\n\n")
+    if hasattr(obj, "summary") and obj.summary:
+        sections.append(f"**{markdown(obj.summary)}**")
+    if hasattr(obj, "description") and obj.description:
+        sections.append(f"{markdown(obj.description)}")
+    if hasattr(obj, "suggestions") and obj.suggestions:
+        sections.append(suggestions_markdown(rule_id))
+    if hasattr(obj, "comment") and obj.comment:
+        sections.append(f"*{obj.comment}*")
+    return tuple(sections)
 
 
 class RuleMarkdown(Markdown):
@@ -149,21 +195,13 @@ class RuleViewer(VerticalScroll):
             self.styles.border_title_color = obj.color.value
             self.styles.border = ("solid", obj.color.value)
 
-        if hasattr(obj, "canonical_name") and obj.canonical_name:
-            yield RuleMarkdown(f"**{obj.canonical_name.value.upper()}**\n\n")
-        elif hasattr(obj, "name") and obj.name:
-            yield RuleMarkdown(f"**{obj.name.value.upper()}**\n\n")
+        for section in content_cache.get(self.rule_id, "header", rule_header):
+            yield RuleMarkdown(section)
+        if linked := content_cache.get(self.rule_id, "backlinks", backlinks_markdown):
+            yield RuleMarkdown(linked)
 
         if hasattr(obj, "type") and isinstance(obj.type, str):
             self.border_title = obj.type.upper()
-        if hasattr(obj, "summary") and obj.summary:
-            yield RuleMarkdown(f"**{markdown(obj.summary)}**")
-        if hasattr(obj, "description") and obj.description:
-            yield RuleMarkdown(f"{markdown(obj.description)}")
-        if hasattr(obj, "suggestions") and obj.suggestions:
-            yield from render_suggestions(self.rule_id)
-        if hasattr(obj, "comment") and obj.comment:
-            yield RuleMarkdown(f"*{obj.comment}*")
         # if hasattr(obj, "tags") and obj.tags:
         #     yield from render_tags(self.rule_id)
         # if hasattr(obj, "oracle") and obj.oracle:
@@ -668,7 +706,7 @@ class TruthViewer(RuleViewer):
 
     async def action_roll(self):
         options = self.query_children(TruthOptionViewer)
-        n = random.randint(0, len(options) - 1)
+        n = getattr(self.app, "rng", random).randint(0, len(options) - 1)
         selected: TruthOptionViewer | None = None
         for option in options:
             if int(option.rule_id[-1]) == n:
@@ -35,6 +35,22 @@ def get_renderable(id_: str):
     return renderable(obj)
 
 
+def render(id_: str, console=None) -> str:
+    """Return the console output of the renderable of `id_`, cached per
+    console width and color system in the shared content cache."""
+    from pysworn.datasworn.content import content_cache
+    from rich import get_console
+
+    console = console or get_console()
+
+    def _render(id_: str) -> str:
+        with console.capture() as capture:
+            console.print(get_renderable(id_))
+        return capture.get()
+
+    return content_cache.get(id_, "ansi", _render, console.width, console.color_system)
+
+
 RENDERABLES = {
     "asset": AssetRenderable,
     "asset.ability": AssetAbilityRenderable,
@@ -79,5 +95,6 @@ RENDERABLES = {
 
 __all__ = [
     "get_renderable",
+    "render",
     "RENDERABLES",
 ]
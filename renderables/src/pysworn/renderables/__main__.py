@@ -1,3 +1,4 @@
+import sys
 from typing import Annotated
 
 import typer
@@ -14,7 +15,7 @@ def main(
     prefix: Annotated[str, typer.Option("--prefix", "-p")] = "oracle_rollable",
     debug: Annotated[bool, typer.Option("--debug", "-d")] = False,
 ):
-    from pysworn.renderables import RENDERABLES
+    from pysworn.renderables import RENDERABLES, render
 
     if prefix == "rules":
         renderable = RENDERABLES["rules"]
@@ -29,7 +30,7 @@ def main(
                 )
             )
 
-    for link, v in index.items():
+    for link in index:
         if prefix and not link.startswith(prefix):
             continue
         rule_type = link
@@ -39,16 +40,7 @@ def main(
         if debug:
             print(f"[i dim]{link}[/] --> {renderable} {type(index[link]).__name__}")
         if renderable:
-            print(
-                # Panel(
-                renderable(index[link]),
-                # title=f"[dim]{prefix.upper()}",
-                # title_align="left",
-                # border_style="dim",
-                # width=80,
-                # )
-            )
-            # print(renderable(index[link]))
+            sys.stdout.write(render(link))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import pytest
+from pysworn.datasworn import RULESETS
 from pysworn.datasworn.cli import app
 from typer.testing import CliRunner
 
@@ -26,3 +28,621 @@ def test_rules():
     res = runner.invoke(app, ["rules"])
     assert res.exit_code == 0
     assert len(res.output.splitlines()) == 774
+
+
+def test_codegen_up_to_date():
+    from pysworn.datasworn import codegen
+
+    assert codegen.OUTPUT_PATH.read_text() == codegen.generate()
+
+
+def test_specialized_from_json_data():
+    import orjson
+    from pysworn.datasworn._datasworn import RulesPackage, _from_json
+    from pysworn.datasworn.cache import DATA_PATH
+
+    data = orjson.loads((DATA_PATH / "classic.json").read_bytes())
+    _from_json.uninstall()
+    generic = RulesPackage.from_json_data(data)
+    _from_json.install()
+    assert RulesPackage.from_json_data(data) == generic
+
+
+def test_slotted_model_rewrite():
+    from pysworn.datasworn import codegen
+
+    # round-trip whichever build is checked in
+    source = codegen.MODEL_PATH.read_text()
+    options = codegen.model_options(source)
+    slotted = codegen.rewrite_model(source, slots=True, frozen=True)
+    assert codegen.model_options(slotted) == {"slots": True, "frozen": True}
+    plain = codegen.rewrite_model(slotted, slots=False, frozen=False)
+    assert codegen.model_options(plain) == {"slots": False, "frozen": False}
+    assert "@dataclass(" not in plain
+    assert codegen.rewrite_model(plain, **options) == source
+
+
+def test_interned_wrappers():
+    from pysworn.datasworn import codegen
+    from pysworn.datasworn._datasworn import DiceExpression, MarkdownString
+
+    # the shipped model is frozen, so identical values share one instance
+    assert codegen.model_options() == {"slots": True, "frozen": True}
+    dice = DiceExpression.from_json_data("1d100")
+    assert DiceExpression.from_json_data("1d100") is dice
+    text = MarkdownString.from_json_data("x")
+    assert MarkdownString.from_json_data("x") is text
+
+
+def test_interned_rules():
+    from pysworn.datasworn.cli import _shared_objects
+    from pysworn.datasworn.main import rules
+
+    refs, distinct, _ = _shared_objects(rules.values())
+    for name in ("DiceExpression", "Label", "MarkdownString"):
+        assert distinct[name] < refs[name], name
+    # e.g. 31978 references to 21276 markdown strings
+    assert distinct["MarkdownString"] < 0.75 * refs["MarkdownString"]
+
+
+def test_count_memory():
+    res = runner.invoke(app, ["count", "--memory"])
+    assert res.exit_code == 0
+    assert "MarkdownString" in res.output
+
+
+def test_import_loads_no_ruleset():
+    import subprocess
+    import sys
+
+    code = "from pysworn.datasworn.main import server; print(server.loaded)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_index():
+    from pysworn.datasworn.main import RulesServer, ruleset_of
+
+    server = RulesServer(["classic", "delve"])
+    assert server.index["move:delve/delve/delve_the_depths"].name.value
+    assert server.loaded == ["delve"]
+    assert "move:classic/adventure/face_danger" in server.index
+    assert server.loaded == ["classic", "delve"]
+
+    server = RulesServer(["classic", "delve"])
+    ids = list(server.index)
+    assert len(server.index) == len(ids)
+    assert len(ids) == sum(len(server.load(r).index) for r in server.rulesets)
+    assert {ruleset_of(id_) for id_ in ids} == {"classic", "delve"}
+
+
+def test_parent_map():
+    from pysworn.datasworn import get_ancestors, get_depth, get_parent_id
+
+    id_ = "move:classic/adventure/face_danger"
+    assert get_parent_id(id_) == "move_category:classic/adventure"
+    assert get_ancestors(id_) == ["move_category:classic/adventure", "classic"]
+    assert get_depth(id_) == 2
+    assert get_parent_id("classic") is None
+    with pytest.deprecated_call():
+        assert get_parent_id(id_, {}) == "move_category:classic/adventure"
+
+
+def test_breadcrumbs_jsonl():
+    import orjson
+
+    res = runner.invoke(app, ["breadcrumbs", "--format", "jsonl", "-r", "classic"])
+    assert res.exit_code == 0
+    rows = [orjson.loads(line) for line in res.output.splitlines()]
+    crumbs = {row["id"]: row["breadcrumbs"] for row in rows}
+    assert crumbs["move:classic/adventure/face_danger"] == [
+        "[Ironsworn](classic)",
+        "[Moves](classic.move)",
+        "[Adventure Moves](move_category:classic/adventure)",
+        "**FACE DANGER**",
+    ]
+
+
+def test_parsed_id():
+    from pysworn.datasworn.main import ParsedId
+
+    parsed = ParsedId.parse(
+        "datasworn:asset.ability.oracle_rollable.row:sundered_isles/companion/parrot.0.parrot_wisdom.3"
+    )
+    assert parsed.type == "asset.ability.oracle_rollable.row"
+    assert (parsed.ruleset, parsed.category, parsed.subcategory) == (
+        "sundered_isles",
+        "companion",
+        "parrot",
+    )
+    assert (
+        parsed.container
+        == "asset.ability.oracle_rollable:sundered_isles/companion/parrot.0.parrot_wisdom"
+    )
+    assert ParsedId.parse(parsed.id) is parsed
+    assert ParsedId("classic").type == "source"
+    assert ParsedId("asset:*/path/*").category == "path"
+
+
+def test_index_by_type():
+    from pysworn.datasworn import index
+
+    ids = index.by_type("oracle_rollable", ruleset="starforged")
+    assert ids
+    assert all(id_.startswith("oracle_rollable:starforged/") for id_ in ids)
+    assert len(index.by_type("move")) == sum(
+        len(index.by_type("move", ruleset=r)) for r in RULESETS
+    )
+    assert "oracle_rollable.row" in index.types("classic")
+
+
+def test_row_tables():
+    from pysworn.datasworn import index, row_tables
+    from pysworn.datasworn.oracles import NO_ROW
+
+    oracle = index["oracle_rollable:starforged/core/action"]
+    table = row_tables[oracle.id.value]
+    assert (table.low, table.high) == (1, 100)
+    for face in range(1, 101):
+        row = oracle.rows[table.row_index(face)]
+        assert row.roll.min <= face <= row.roll.max
+    assert table.row_index(0) is None
+    assert list(table.row_indexes([1, 100])) == [0, len(oracle.rows) - 1]
+    assert NO_ROW not in table.rows
+
+
+def test_row_indexes_out_of_range():
+    from array import array
+
+    from pysworn.datasworn.oracles import NO_ROW, RowTable
+
+    table = RowTable("1d6", 1, array("h", [0, 0, 1, 1, 2, NO_ROW]))
+    assert list(table.row_indexes([-5, 0, 1, 5, 6, 7, 100])) == [
+        NO_ROW,
+        NO_ROW,
+        0,
+        2,
+        NO_ROW,
+        NO_ROW,
+        NO_ROW,
+    ]
+
+
+def test_roll_many():
+    from pysworn.datasworn.oracles import NO_ROW, roll_many
+
+    id_ = "oracle_rollable:starforged/core/action"
+    rows = roll_many(id_, 1000, seed=1)
+    assert len(rows) == 1000
+    assert NO_ROW not in rows
+    assert roll_many(id_, 1000, seed=1) == rows
+
+
+def test_dice():
+    import random
+
+    from pysworn.datasworn.dice import Dice
+
+    dice = Dice.parse("2d6+1")
+    assert (dice.count, dice.sides, dice.modifier) == (2, 6, 1)
+    assert Dice.parse("2d6+1") is dice
+    assert str(dice) == "2d6+1"
+    assert (dice.low, dice.high) == (3, 13)
+    assert dice.weights() == [1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1]
+    rng = random.Random(0)
+    assert all(3 <= dice.roll(rng) <= 13 for _ in range(100))
+    assert set(dice.roll_many(1000, rng)) == set(range(3, 14))
+
+
+def test_resolver():
+    import random
+
+    from pysworn.datasworn.resolver import Resolver, compile_template, resolve_many
+
+    assert compile_template("{{text>oracle_rollable:a/b}} of {{text2>x:y/z}}") == (
+        ("text", "oracle_rollable:a/b"),
+        " of ",
+        ("text2", "x:y/z"),
+    )
+
+    resolver = Resolver(random.Random(1))
+    # 96-100: Roll twice
+    result = resolver.resolve("oracle_rollable:starforged/character/role", 100)
+    assert len(result.rolls) == 2
+    assert result.rolls[0].row_id != result.rolls[1].row_id
+    assert str(result) == "; ".join(r.text for r in result.rolls)
+
+    for result in resolve_many("oracle_rollable:delve/site_name/format", 20, seed=1):
+        assert result.templated
+        assert "{{" not in result.text
+
+    res = runner.invoke(app, ["roll", "oracle_rollable:starforged/core/action"])
+    assert res.exit_code == 0
+
+
+def test_rng():
+    import pickle
+
+    from pysworn.datasworn.resolver import CHUNK_SIZE, resolve_many
+    from pysworn.datasworn.rng import Stream
+
+    root = Stream(42)
+    a, b = root.spawn(2)
+    assert a.key == (0,) and b.key == (1,)
+    assert root.spawn(1)[0].key == (2,)
+    assert Stream(42).child(0).random() == Stream(42, (0,)).random()
+    assert a.random() != b.random()
+    copy = pickle.loads(pickle.dumps(a))
+    assert copy.random() == a.random()
+
+    id_ = "oracle_rollable:starforged/core/action"
+    n = CHUNK_SIZE + 10
+    serial = [r.row_id for r in resolve_many(id_, n, seed=7)]
+    parallel = [r.row_id for r in resolve_many(id_, n, seed=7, workers=2)]
+    assert serial == parallel
+
+
+def test_analysis():
+    from fractions import Fraction
+
+    from pysworn.datasworn.analysis import (
+        _inclusion,
+        expected_rows,
+        oracle_stats,
+        row_probabilities,
+    )
+
+    id_ = "oracle_rollable:starforged/character/role"
+    p = row_probabilities(id_)
+    assert sum(p) == 1
+    assert p[-1] == Fraction(5, 100)  # 96-100: Roll twice
+
+    # two draws without repeats: each item is drawn at most once
+    assert _inclusion([0.5, 0.5], 2) == [1.0, 1.0]
+    assert abs(sum(_inclusion([0.2, 0.3, 0.5], 3)) - 3) < 1e-9
+
+    expected = expected_rows(id_)
+    # "Roll twice" is rerolled when rolled by itself
+    assert expected["oracle_rollable.row:starforged/character/role.47"] == float(p[-1])
+    assert sum(expected.values()) > 1 + p[-1] * 2
+
+    (stats,) = oracle_stats(["oracle_rollable:delve/site_name/format"])
+    assert stats.coverage == 1
+    assert stats.expected > 1
+
+    res = runner.invoke(app, ["oracle-stats", "-r", "delve"])
+    assert res.exit_code == 0
+
+
+def test_analysis_roll_twice_first(monkeypatch):
+    from array import array
+    from types import SimpleNamespace as NS
+
+    from pysworn.datasworn import resolver
+    from pysworn.datasworn._datasworn import OracleDuplicateBehavior
+    from pysworn.datasworn.analysis import expected_rows
+    from pysworn.datasworn.dice import Dice
+    from pysworn.datasworn.oracles import RowTable
+
+    def oracle_roll(oracle=None, k=1):
+        return NS(
+            oracle=oracle and NS(value=oracle),
+            auto=True,
+            number_of_rolls=k,
+            dice=None,
+            duplicates=OracleDuplicateBehavior.REROLL,
+        )
+
+    def oracle(id_, dice, rolls):
+        rows = [
+            NS(id=NS(value=f"{id_}.{i}"), oracle_rolls=r, template=None)
+            for i, r in enumerate(rolls)
+        ]
+        table = RowTable(dice, 1, array("h", range(len(rows))))
+        monkeypatch.setitem(
+            resolver._tables, id_, (NS(rows=rows), table, Dice.parse(dice))
+        )
+
+    x, y = "oracle_rollable:test/roll_twice_first", "oracle_rollable:test/nested"
+    # "Roll twice" comes before the row that rolls on another oracle
+    oracle(x, "1d4", [[oracle_roll(k=2)], [oracle_roll(y)], None, None])
+    oracle(y, "1d2", [None, None])
+
+    expected = expected_rows(x)
+    assert expected[f"{x}.0"] == 0.25
+    # row 1 is rolled directly (1/4) or as one of two of rows 1-3 (1/4 * 2/3)
+    assert abs(expected[f"{x}.1"] - 5 / 12) < 1e-9
+    assert abs(expected[f"{y}.0"] - 5 / 24) < 1e-9
+
+
+def test_validate():
+    from types import SimpleNamespace as NS
+
+    from pysworn.datasworn import issues
+    from pysworn.datasworn.validate import check_rows
+
+    def row(i, low, high):
+        return NS(id=NS(value=f"row.{i}"), roll=NS(min=low, max=high))
+
+    oracle = NS(
+        dice=NS(value="1d10"),
+        rows=[row(0, 1, 3), row(1, 3, 5), row(1, 8, 11)],
+    )
+    found = {(i.kind, i.message) for i in check_rows("oracle", oracle)}
+    assert found == {
+        ("overlap", "rows overlap on 3"),
+        ("gap", "no row for 6-7"),
+        ("range", "8-11 outside 1d10"),
+        ("duplicate", "duplicate row ID"),
+    }
+
+    id_ = "oracle_rollable:sundered_isles/overland/region_landmarks/highlands"
+    assert [i.kind for i in issues[id_]] == ["gap"]
+    assert "oracle_rollable:starforged/core/action" not in issues
+
+    res = runner.invoke(app, ["validate", "-r", "classic", "--strict"])
+    assert res.exit_code == 0
+
+
+def test_content_cache():
+    from threading import Event
+
+    from pysworn.datasworn.content import ContentCache
+
+    calls = []
+
+    def render(id_):
+        calls.append(id_)
+        return id_.upper()
+
+    cache = ContentCache(maxsize=2)
+    assert cache.get("a", "text", render) == "A"
+    assert cache.get("a", "text", render) == "A"
+    assert cache.get("a", "text", render, 80) == "A"
+    assert calls == ["a", "a"]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.get("b", "text", render)  # evicts ("a", "text")
+    assert ("a", "text") not in cache
+    assert ("a", "text", 80) in cache
+
+    assert cache.warm(["b", "c"], "text", render) == 1
+    cancel = Event()
+    cancel.set()
+    assert cache.warm(["d"], "text", render, cancel=cancel) == 0
+    cache.invalidate("b")
+    assert ("b", "text") not in cache and len(cache) == 1
+
+
+def test_search():
+    from itertools import pairwise
+
+    from pysworn.datasworn.search import parse_query, search, terms
+
+    assert terms("[Face Danger](datasworn:move:classic/adventure/face_danger)") == [
+        "face",
+        "danger",
+    ]
+    assert parse_query("face dan") == [("face", False), ("dan", True)]
+    assert parse_query("face* danger ") == [("face", True), ("danger", False)]
+
+    hits = search("secure adv", ruleset="classic")
+    assert hits[0].id == "move:classic/adventure/secure_an_advantage"
+    assert all(a.score >= b.score for a, b in pairwise(hits))
+    hits = search("derelict zone", types=["oracle_rollable"])
+    assert hits and all(h.id.startswith("oracle_rollable:") for h in hits)
+    assert search("xyzzy") == []
+
+    result = runner.invoke(app, ["search", "iron vow", "-n", "3"])
+    assert result.exit_code == 0
+    assert "Breadcrumbs" in result.output
+
+
+def test_backlinks():
+    from pysworn.datasworn.links import _wildcard, backlinks
+    from pysworn.datasworn.main import server
+
+    # delve sites link their theme; NPCs and rows link it in Markdown
+    found = backlinks("delve_site_theme:delve/fortified")
+    assert "delve_site:delve/alvas_rest" in found
+    assert "oracle_rollable:classic/action_and_theme/action" in backlinks(
+        "oracle_rollable:classic/action_and_theme/theme"
+    )
+    assert backlinks("move:classic/adventure/face_danger", "starforged") == []
+
+    assert _wildcard("asset:*/path/*").fullmatch("asset:classic/path/a")
+    assert not _wildcard("asset:*/path/*").fullmatch("asset:classic/path/a/b")
+    assert _wildcard("oracle_rollable:*/**/peril").fullmatch("oracle_rollable:x/peril")
+
+    graph = server.load("delve").links
+    assert len(graph.offsets) == len(graph.targets) + 1
+    assert len(graph.links) == graph.offsets[-1]
+
+    result = runner.invoke(app, ["backlinks", "delve_site_theme:delve/fortified"])
+    assert result.exit_code == 0
+    assert runner.invoke(app, ["backlinks", "move:nowhere/x"]).exit_code != 0
+
+
+def test_id_table():
+    from pysworn.datasworn import id_table, index, parents
+    from pysworn.datasworn.ids import NO_ID
+
+    id_ = "move:starforged/fate/pay_the_price"
+    n = id_table.number(id_)
+    assert id_table.id(n) == id_
+    assert id_table.type(n) == "move"
+    assert id_table.ruleset(n) == "starforged"
+    assert id_table.id(id_table.parent(n)) == parents[id_]
+    assert id_table.parent(id_table.number("classic")) == NO_ID
+    assert id_ in id_table and "move:nowhere/x" not in id_table
+
+    table = id_table.table("delve")
+    assert list(table) == list(index.by_ruleset("delve"))
+    assert all(table.number(i) == k for k, i in enumerate(table))
+
+
+def test_store(tmp_path):
+    from pysworn.datasworn.main import server
+    from pysworn.datasworn.store import StoreSnapshot, write_store
+
+    snapshot = server.load("delve")
+    write_store(tmp_path / "delve.store", snapshot)
+    stored = StoreSnapshot(tmp_path / "delve.store")
+
+    assert list(stored.index) == list(snapshot.index)
+    assert stored.index.loaded == 0
+    assert all(stored.ids.number(i) == k for k, i in enumerate(snapshot.index))
+    assert "move:delve/nope" not in stored.ids
+    move = stored.index["move:delve/delve/delve_the_depths"]
+    assert move == snapshot.index["move:delve/delve/delve_the_depths"]
+    assert 0 < stored.index.loaded < len(stored.index)
+
+    # the package does not load its collections until they are used
+    stored = StoreSnapshot(tmp_path / "delve.store")
+    package = stored.package
+    assert package is stored.index["delve"]
+    assert len(package.oracles) == len(snapshot.package.oracles)
+    assert stored.index.loaded == 1
+    assert package == snapshot.package
+    assert stored.index.loaded == len(stored.index)
+    assert not stored._loaded_fields
+
+    for field in ("tree", "parents", "breadcrumbs", "types", "issues"):
+        assert getattr(stored, field) == getattr(snapshot, field)
+    oracle_id = next(iter(snapshot.row_tables))
+    assert list(stored.row_tables[oracle_id].rows) == list(
+        snapshot.row_tables[oracle_id].rows
+    )
+    assert stored.search.ids is stored.ids and stored.links.ids is stored.ids
+
+
+@pytest.fixture
+def builds(tmp_path, monkeypatch):
+    """Cache snapshots in `tmp_path` and record every ruleset build."""
+    from pysworn.datasworn.main import RulesServer
+
+    monkeypatch.setenv("PYSWORN_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("PYSWORN_NO_CACHE", raising=False)
+    monkeypatch.delenv("PYSWORN_STORE", raising=False)
+    calls = []
+    build = RulesServer._build_ruleset
+
+    def _build_ruleset(self, data):
+        calls.append(data)
+        return build(self, data)
+
+    monkeypatch.setattr(RulesServer, "_build_ruleset", _build_ruleset)
+    return calls
+
+
+def _load_delve():
+    from pysworn.datasworn.main import RulesServer
+
+    return RulesServer(["delve"]).load("delve")
+
+
+def test_snapshot_cache(builds, tmp_path):
+    from pysworn.datasworn import cache
+
+    built = _load_delve()
+    assert len(builds) == 1
+    (path,) = (tmp_path / "cache").glob("delve-*.pickle")
+    assert path == cache.snapshot_path("delve", cache.snapshot_key(builds[0]))
+
+    loaded = _load_delve()
+    assert len(builds) == 1
+    assert list(loaded.index) == list(built.index)
+    assert loaded.breadcrumbs == built.breadcrumbs
+
+
+def test_snapshot_cache_invalidation(builds, tmp_path, monkeypatch):
+    from pysworn.datasworn import cache
+
+    _load_delve()
+    assert len(builds) == 1
+
+    monkeypatch.setattr(cache, "SNAPSHOT_VERSION", cache.SNAPSHOT_VERSION + 1)
+    _load_delve()
+    assert len(builds) == 2
+
+    monkeypatch.setattr(cache, "_module_digest", lambda: b"changed")
+    _load_delve()
+    assert len(builds) == 3
+
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    data = (cache.DATA_PATH / "delve.json").read_bytes()
+    (data_path / "delve.json").write_bytes(data + b"\n")
+    monkeypatch.setattr(cache, "DATA_PATH", data_path)
+    _load_delve()
+    assert len(builds) == 4
+    _load_delve()
+    assert len(builds) == 4
+    # stale snapshots are removed
+    assert len(list((tmp_path / "cache").glob("delve-*.pickle"))) == 1
+
+
+def test_snapshot_cache_disabled(builds, tmp_path, monkeypatch):
+    monkeypatch.setenv("PYSWORN_NO_CACHE", "1")
+    _load_delve()
+    _load_delve()
+    assert len(builds) == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_corrupt_snapshot(builds, tmp_path):
+    _load_delve()
+    (path,) = (tmp_path / "cache").glob("delve-*.pickle")
+    path.write_bytes(path.read_bytes()[:1000])
+
+    loaded = _load_delve()
+    assert len(builds) == 2
+    assert "move:delve/delve/delve_the_depths" in loaded.index
+    _load_delve()
+    assert len(builds) == 2
+
+
+@pytest.mark.parametrize("use_store", [False, True])
+def test_preload_process(tmp_path, monkeypatch, use_store):
+    from pysworn.datasworn.main import RulesServer
+    from pysworn.datasworn.store import StoreSnapshot
+
+    monkeypatch.setenv("PYSWORN_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("PYSWORN_NO_CACHE", raising=False)
+    monkeypatch.setenv("PYSWORN_STORE", "1" if use_store else "")
+    rulesets = ["classic", "delve"]
+
+    # the workers build the rulesets; a store is returned as b"" and opened
+    process = RulesServer(rulesets)
+    process.preload(mode="process")
+    assert process.loaded == rulesets
+    assert all(
+        isinstance(process.load(r), StoreSnapshot) == use_store for r in rulesets
+    )
+
+    serial = RulesServer(rulesets)
+    serial.preload(mode="serial")
+    assert list(process.index) == list(serial.index)
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread"])
+def test_preload_skips_broken_ruleset(monkeypatch, capsys, mode):
+    from pysworn.datasworn.main import RulesServer
+
+    monkeypatch.setenv("PYSWORN_NO_CACHE", "1")
+    build = RulesServer._build_ruleset
+
+    def _build_ruleset(self, data):
+        if b'"_id": "delve"' in data[:100]:
+            raise KeyError("duplicate ID")
+        return build(self, data)
+
+    monkeypatch.setattr(RulesServer, "_build_ruleset", _build_ruleset)
+    server = RulesServer(["delve", "classic"])
+    server.preload(mode=mode)
+    assert server.loaded == ["classic"]
+    assert "delve generated an exception" in capsys.readouterr().out
+    with pytest.raises(KeyError):
+        server.load("delve")
@@ -0,0 +1,14 @@
+from pysworn.journal.candidates import CandidateIndex
+
+
+def test_candidate_index():
+    cmds = ["classic/adventure/face_danger", "starforged/derelict/zone", "Face/Off"]
+    candidates = CandidateIndex(cmds)
+
+    assert list(candidates.narrow("")) == [0, 1, 2]
+    assert candidates.narrow("fd") == [0, 1]
+    assert candidates.narrow("fda") == [0]  # narrowed from "fd"
+    assert candidates.narrow("fa") == [0, 2]
+    assert candidates.narrow("FACE/") == [2]
+    assert candidates.narrow("[z]") == []
+    assert candidates.narrow("zd") == []
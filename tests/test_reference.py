@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import pytest
+from pysworn.datasworn._datasworn import MarkdownString
+
+
+def test_plain():
+    from pysworn.reference._rich import plain
+
+    value = MarkdownString(
+        "Roll on [Action](datasworn:oracle_rollable:starforged/core/action)"
+        " and __[Theme](datasworn:oracle_rollable:starforged/core/theme)__."
+        "{{table>oracle_rollable:starforged/core/theme}}"
+    )
+    assert plain(value) == "Roll on ACTION and THEME."
+    assert plain(MarkdownString("no markup")) == "no markup"
+    assert plain(None) == ""
+
+
+def test_row_widths():
+    from pysworn.reference.oracle import column_widths, get_max_row_widths
+
+    rows = [
+        SimpleNamespace(
+            text=MarkdownString("[Ab](datasworn:move:classic/adventure/x)"),
+            text2=MarkdownString("__wide column__"),
+            text3=None,
+        ),
+        # text3 counts even where text2 is missing
+        SimpleNamespace(
+            text=MarkdownString("a"), text2=None, text3=MarkdownString("third")
+        ),
+    ]
+    otr = SimpleNamespace(id=SimpleNamespace(value="oracle_rollable:test/x"), rows=rows)
+    assert get_max_row_widths(otr) == (2, 11, 5)
+    assert column_widths([("a", "bb")], 3) == (1, 2, 0)
+
+
+FACE_DANGER = "[Face Danger](datasworn:move:classic/adventure/face_danger)"
+PAY_THE_PRICE = "[Pay the Price](datasworn:move:starforged/fate/pay_the_price)"
+MARKUP = [
+    (
+        f"On a __strong hit__, {FACE_DANGER}.{{{{table>oracle_rollable:classic/x}}}}",
+        (
+            "On a [bold]strong hit[/bold], [u][@click=screen.open_link("
+            "'move:classic/adventure/face_danger')]FACE DANGER[/][/u]."
+        ),
+        (
+            "On a [strong hit](strong_hit), "
+            "[Face Danger](move:classic/adventure/face_danger)."
+        ),
+    ),
+    (
+        f"__{PAY_THE_PRICE}__ on a __miss__",
+        (
+            "[bold][u][@click=screen.open_link('move:starforged/fate/pay_the_price')]"
+            "PAY THE PRICE[/][/u][/bold] on a [bold]miss[/bold]"
+        ),
+        "__[Pay the Price](move:starforged/fate/pay_the_price)__ on a [miss](miss)",
+    ),
+    ("plain", "plain", "plain"),
+]
+"""Markdown, markup and markdown, as converted before the token cache."""
+
+
+def test_cached_markup():
+    from pysworn.reference import _rich
+
+    for cached in (_rich.tokens, _rich._markup, _rich._markdown):
+        cached.cache_clear()
+    for value, markup, markdown in MARKUP:
+        for _ in range(2):  # computed, then cached
+            value_ = MarkdownString(value)
+            assert _rich.markup(value_) == markup
+            assert _rich.markdown(value_) == markdown
+    assert _rich._markup.cache_info().hits == len(MARKUP)
+    assert _rich._markdown.cache_info().hits == len(MARKUP)
+
+
+def test_seeded_link_rolls():
+    from pysworn.reference.app import PyswornApp
+    from pysworn.reference.oracle import get_row_from_link
+
+    def session(seed):
+        rng = PyswornApp(seed).rng
+        return [
+            get_row_from_link("oracle_rollable:starforged/core/action", rng)
+            for _ in range(20)
+        ]
+
+    assert session(7) == session(7)
+    assert session(7) != session(8)
+
+
+def test_reference_tree_fills_on_demand():
+    from pysworn.datasworn.main import rules
+    from pysworn.reference.tree import ReferenceTree
+
+    collection = rules["starforged"].oracles
+    tree = ReferenceTree("Oracles", collection)
+    assert len(tree.root.children) == len(collection)
+    assert all(not node.children for node in tree.root.children)
+
+    node = tree.find_node("oracle_rollable:starforged/core/action")
+    assert node.parent.data == "oracle_collection:starforged/core"
+    assert node in node.parent.children
+    with pytest.raises(KeyError):
+        tree.find_node("oracle_rollable.row:starforged/core/action.0")